@@ -0,0 +1,234 @@
+"""In-memory stand-in for the Quay API endpoints used by QuayGateway.
+
+Start it, point API_HOST/API_PORT at it and run any pipeline without a real
+Quay. State lives in memory and is lost on exit. Latency, server errors and
+429s can be injected to see how the provisioner behaves under load:
+
+    python fake_quay.py --port 9900 --latency 20 --jitter 10 --throttle-rate 0.01
+
+The state and its error messages come from src/quay/fake_state.py, which
+InMemoryQuayGateway uses as well. Only the standard library is needed, so
+it runs next to the provisioner without extra dependencies.
+`GET /_fake/stats` returns request counters, `POST /_fake/reset` drops all
+state.
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+# The state lives in the provisioner's tree (stdlib only) so InMemoryQuayGateway shares it
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from quay.fake_state import BASE_PATH, FakeApiError, QuayState, route
+
+
+class Faults:
+    """Injected latency (ms, uniform +/- jitter), 500s and 429s with Retry-After."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 throttle_rate: float = 0.0, retry_after: float = 1.0, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+
+    def delay(self) -> float:
+        if not self.latency and not self.jitter:
+            return 0.0
+        return max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter)) / 1000
+
+    def failure(self) -> Optional[int]:
+        roll = self.random.random()
+        if roll < self.throttle_rate:
+            return 429
+        if roll < self.throttle_rate + self.error_rate:
+            return 500
+        return None
+
+
+class FakeQuayServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Every provisioner worker keeps a connection open; don't drop them on accept
+    request_queue_size = 1024
+
+    def __init__(self, address: Tuple[str, int], faults: Optional[Faults] = None, token: Optional[str] = None):
+        super().__init__(address, FakeQuayHandler)
+        self.state = QuayState()
+        self.faults = faults or Faults()
+        self.token = token
+        self.stats_lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self.injected: Dict[int, int] = {}
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key: str, injected: Optional[int] = None) -> None:
+        with self.stats_lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+            if injected:
+                self.injected[injected] = self.injected.get(injected, 0) + 1
+
+    def stats(self) -> dict:
+        with self.stats_lock:
+            return {
+                "requests": dict(sorted(self.requests.items())),
+                "total": sum(self.requests.values()),
+                "injected": {str(status): count for status, count in sorted(self.injected.items())},
+                "organizations": len(self.state.organizations),
+            }
+
+    def reset(self) -> None:
+        with self.state.lock:
+            self.state = QuayState()
+        with self.stats_lock:
+            self.requests.clear()
+            self.injected.clear()
+
+
+class FakeQuayHandler(BaseHTTPRequestHandler):
+    # Keep-alive, like Quay behind its load balancer; the client pools connections
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, every answer waits for a delayed ACK
+    disable_nagle_algorithm = True
+    server: FakeQuayServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _reply(self, status: int, body: object = None, headers: Optional[Dict[str, str]] = None) -> None:
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        if data:
+            self.send_header("Content-Type", "application/json")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            raise FakeApiError(400, "Invalid JSON body")
+        return body if isinstance(body, dict) else {}
+
+    def _dispatch(self, method: str) -> None:
+        path = urlsplit(self.path).path.rstrip("/")
+        try:
+            body = self._body()
+        except FakeApiError as e:
+            self._reply(e.status, e.body())
+            return
+
+        if path.startswith("/_fake/"):
+            self._control(method, path)
+            return
+        if self.server.token and self.headers.get("Authorization") != f"Bearer {self.server.token}":
+            self._reply(401, FakeApiError(401, "Unauthorized").body())
+            return
+        if not path.startswith(BASE_PATH):
+            self._reply(404, FakeApiError(404, "Not Found").body())
+            return
+
+        key, handler, args = route(method, path[len(BASE_PATH):])
+        faults = self.server.faults
+        delay = faults.delay()
+        if delay:
+            time.sleep(delay)
+        injected = faults.failure()
+        self.server.count(key, injected)
+        if injected == 429:
+            self._reply(429, FakeApiError(429, "Too Many Requests").body(), {"Retry-After": f"{faults.retry_after:g}"})
+            return
+        if injected:
+            self._reply(injected, FakeApiError(injected, "Injected server error").body())
+            return
+        if handler is None:
+            self._reply(404, FakeApiError(404, "Not Found").body())
+            return
+
+        try:
+            with self.server.state.lock:
+                status, result = handler(self.server.state, body, *args)
+        except FakeApiError as e:
+            self._reply(e.status, e.body())
+            return
+        self._reply(status, result)
+
+    def _control(self, method: str, path: str) -> None:
+        if method == "GET" and path == "/_fake/stats":
+            self._reply(200, self.server.stats())
+        elif method == "POST" and path == "/_fake/reset":
+            self.server.reset()
+            self._reply(204)
+        else:
+            self._reply(404, FakeApiError(404, "Not Found").body())
+
+
+def serve(host: str = "127.0.0.1", port: int = 0, faults: Optional[Faults] = None,
+          token: Optional[str] = None) -> FakeQuayServer:
+    """Start a server on a daemon thread (port 0 picks a free port); call `shutdown()` to stop it."""
+    server = FakeQuayServer((host, port), faults, token)
+    threading.Thread(target=server.serve_forever, name="fake-quay", daemon=True).start()
+    return server
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="In-memory fake of the Quay API used by the provisioner")
+    parser.add_argument("--host", default="127.0.0.1", help="address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=9900, help="port to listen on (default: 9900)")
+    parser.add_argument("--token", help="require 'Authorization: Bearer TOKEN' (default: accept any request)")
+    parser.add_argument("--latency", type=float, default=0.0, help="added latency per request in ms (default: 0)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="uniform +/- latency jitter in ms (default: 0)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--seed", type=int, help="seed for latency and fault injection")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    faults = Faults(args.latency, args.jitter, args.error_rate, args.throttle_rate, args.retry_after, args.seed)
+    server = FakeQuayServer((args.host, args.port), faults, args.token)
+    print(f"Fake Quay API listening on {server.url}{BASE_PATH}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
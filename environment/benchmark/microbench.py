@@ -0,0 +1,176 @@
+"""Per-item CPU cost of the provisioner itself, without any network.
+
+Every case runs in-process on generated inputs (see run_benchmark.py) and
+reports CPU and wall microseconds per item, best of --repeat runs:
+
+    load inputs      read a YAML inputs file, resolve templates, validate
+    dto <job>        pydantic validation of one item's params
+    display ...      per-item output: item lines, compact progress
+    dispatch ...     a loaded pipeline run by PipelineExecutor with an
+                     InMemoryQuayGateway (sequential, threaded, asyncio)
+
+The dispatch cases include the actions' own work (prechecks, existence
+cache, logging calls) and the in-memory gateway, which is far cheaper
+than any HTTP round trip; what remains is the framework's overhead.
+
+    python microbench.py --orgs 500 --repeat 3
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import yaml
+
+from run_benchmark import PIPELINE_FILE, SRC_DIR, generate_inputs
+
+sys.path.insert(0, str(SRC_DIR))
+
+# Settings read by Config; the in-memory gateway never contacts API_HOST
+os.environ.setdefault("API_TOKEN", "microbench")
+os.environ.update({"LOG_LEVEL": "ERROR", "DEBUG_ENABLED": "false", "SHOW_CURL": "false",
+                   "METRICS_TEXTFILE": "", "PUSHGATEWAY_URL": "", "REQUEST_STATS_FILE": "", "TRACE_FILE": ""})
+
+from config.loader import Config
+from engine.pipeline_engine import PipelineEngine
+from quay.in_memory_gateway import InMemoryQuayGateway
+from quay.model.organization_model import Organization
+from quay.model.robot_account_model import CreateRobotAccount
+from quay.model.team_model import AddTeamMember, CreateTeam, DefaultRepositoryPermission, SyncTeamLdap
+from utils.display import Display, ProgressLine
+
+# (name, items, fn, setup or None): see measure()
+Case = Tuple[str, int, Callable, Optional[Callable]]
+
+DTOS = [
+    ("organizations", Organization),
+    ("robot_accounts", CreateRobotAccount),
+    ("teams", CreateTeam),
+    ("team_members", AddTeamMember),
+    ("default_repo_permissions", DefaultRepositoryPermission),
+    ("team_ldap_sync", SyncTeamLdap),
+]
+
+
+def measure(fn: Callable, repeat: int, setup: Optional[Callable] = None) -> Tuple[float, float]:
+    """Best (CPU seconds, wall seconds) of `repeat` calls of fn(setup()), output discarded.
+
+    Only `fn` is timed; `setup` builds a fresh argument for every call.
+    """
+    best_cpu, best_wall = float("inf"), float("inf")
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            arg = setup() if setup else None
+            cpu, wall = time.process_time(), time.perf_counter()
+            if setup:
+                fn(arg)
+            else:
+                fn()
+            cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+        best_cpu, best_wall = min(best_cpu, cpu), min(best_wall, wall)
+    return best_cpu, best_wall
+
+
+def configure(**settings: str) -> Config:
+    os.environ.update(settings)
+    Config.reset()
+    return Config()
+
+
+def engine_cases(inputs: dict, work_dir: Path) -> List[Case]:
+    items = sum(len(value) for value in inputs.values())
+    inputs_file = work_dir / "inputs.yaml"
+    inputs_file.write_text(yaml.safe_dump(inputs, sort_keys=False))
+    os.environ.update({"PIPELINE_FILE": str(PIPELINE_FILE), "INPUTS_FILE": str(inputs_file)})
+
+    def load():
+        engine = PipelineEngine(configure(), InMemoryQuayGateway())
+        engine.load_pipeline(PIPELINE_FILE)
+
+    def prepare(**settings):
+        def setup():
+            engine = PipelineEngine(configure(**settings), InMemoryQuayGateway())
+            return engine, engine.load_pipeline(PIPELINE_FILE)
+        return setup
+
+    def dispatch(prepared):
+        engine, pipeline = prepared
+        engine.run(pipeline)
+
+    pipeline_cases = [
+        ("dispatch sequential", {"MAX_PARALLEL": "1", "ASYNC_IO": "false", "PROGRESS_MODE": "items"}),
+        ("dispatch sequential compact", {"MAX_PARALLEL": "1", "ASYNC_IO": "false", "PROGRESS_MODE": "compact"}),
+        ("dispatch threaded x8", {"MAX_PARALLEL": "8", "ASYNC_IO": "false", "PROGRESS_MODE": "compact"}),
+        ("dispatch asyncio x8", {"MAX_PARALLEL": "8", "ASYNC_IO": "true", "PROGRESS_MODE": "compact"}),
+    ]
+    cases = [("load inputs (yaml)", items, load, None)]
+    cases += [(name, items, dispatch, prepare(**settings)) for name, settings in pipeline_cases]
+    return cases
+
+
+def dto_cases(inputs: dict) -> List[Case]:
+    def validate(model, params_list):
+        def run():
+            for params in params_list:
+                model(**params)
+        return run
+    return [(f"dto {model.__name__}", len(inputs[key]), validate(model, inputs[key]), None) for key, model in DTOS]
+
+
+def display_cases(inputs: dict) -> List[Case]:
+    teams = inputs["teams"]
+
+    def item_lines():
+        for index, params in enumerate(teams):
+            Display.dynamic_iteration(index + 1, len(teams), params)
+            Display.dynamic_iteration_result(True)
+
+    def parallel_lines():
+        for index in range(len(teams)):
+            Display.iteration_line(index + 1, len(teams), True)
+
+    def progress_line():
+        progress = ProgressLine("teams", len(teams), interval=10.0)
+        for index, params in enumerate(teams):
+            progress.item_done(index + 1, params, True, 0.001)
+        progress.close()
+
+    return [
+        ("display item lines", len(teams), item_lines, None),
+        ("display parallel lines", len(teams), parallel_lines, None),
+        ("display compact progress", len(teams), progress_line, None),
+    ]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the provisioner's per-item CPU overhead in-process")
+    parser.add_argument("--orgs", type=int, default=500, help="generated organizations, ten items each (default: 500)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, the best is reported (default: 3)")
+    parser.add_argument("--only", help="run the cases whose name contains this text")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    inputs = generate_inputs(args.orgs)
+    with tempfile.TemporaryDirectory(prefix="quay-microbench-") as work_dir:
+        cases = engine_cases(inputs, Path(work_dir)) + dto_cases(inputs) + display_cases(inputs)
+        if args.only:
+            cases = [case for case in cases if args.only in case[0]]
+
+        print(f"{'case':<30} {'items':>7} {'cpu us/item':>12} {'wall us/item':>13}")
+        print("-" * 65)
+        for name, count, fn, setup in cases:
+            cpu, wall = measure(fn, args.repeat, setup)
+            print(f"{name:<30} {count:>7} {cpu / count * 1e6:>12.1f} {wall / count * 1e6:>13.1f}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
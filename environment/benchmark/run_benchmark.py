@@ -0,0 +1,249 @@
+"""End-to-end throughput benchmark against the fake Quay API.
+
+For every requested size the harness starts a fresh fake_quay server,
+generates inputs for that many organizations, runs the full provisioning
+pipeline (src/main.py) in a child process and reads the run's Prometheus
+textfile back. Reported per size: wall time, HTTP requests/s, items/s,
+p95 request latency and the child's peak RSS.
+
+    python run_benchmark.py --orgs 10 1000 10000 --parallel 16 --latency 5
+
+Each organization expands to ten items: the organization, one robot, three
+teams, three team members, one default permission and one LDAP sync.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import fake_quay
+
+ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT / "src"
+PIPELINE_FILE = ROOT / "ansible-tower/pipelines/full-provisioning-pipeline.yaml"
+TOKEN = "benchmark-token"
+METRIC_PREFIX = "quay_provisioner_"
+
+_SAMPLE = re.compile(r"^(?P<name>[a-z_]+)(?:\{(?P<labels>.*)\})? (?P<value>\S+)$")
+_LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def generate_inputs(organizations: int) -> dict:
+    """Inputs for full-provisioning-pipeline.yaml, ten items per organization."""
+    inputs = {key: [] for key in (
+        "organizations", "robot_accounts", "teams", "team_members", "default_repo_permissions", "team_ldap_sync"
+    )}
+    for i in range(organizations):
+        org = f"bench-{i:05d}"
+        inputs["organizations"].append({"name": org, "email": f"{org}@bench.example.com"})
+        inputs["robot_accounts"].append({"organization": org, "robot_shortname": "deployer", "description": "CI"})
+        for team, role in (("developers", "creator"), ("viewers", "member"), ("ldap-readers", "member")):
+            inputs["teams"].append({"organization": org, "team_name": team, "role": role})
+        for team, member in (("developers", "admin"), ("developers", f"{org}+deployer"), ("viewers", "admin")):
+            inputs["team_members"].append({"organization": org, "team_name": team, "member_name": member})
+        inputs["default_repo_permissions"].append(
+            {"organization": org, "delegate": {"kind": "team", "name": "developers"}, "role": "write"}
+        )
+        inputs["team_ldap_sync"].append(
+            {"organization": org, "team_name": "ldap-readers", "group_dn": f"cn={org},ou=groups,dc=example,dc=com"}
+        )
+    return inputs
+
+
+def parse_metrics(text: str) -> Dict[str, List[Tuple[Dict[str, str], float]]]:
+    """Samples of a Prometheus textfile by metric name (prefix stripped)."""
+    samples: Dict[str, List[Tuple[Dict[str, str], float]]] = {}
+    for line in text.splitlines():
+        match = _SAMPLE.match(line)
+        if not match:
+            continue
+        labels = dict(_LABEL.findall(match.group("labels") or ""))
+        value = math.inf if match.group("value") == "+Inf" else float(match.group("value"))
+        samples.setdefault(match.group("name").removeprefix(METRIC_PREFIX), []).append((labels, value))
+    return samples
+
+
+def latency_percentile(samples: Dict[str, list], p: float) -> float:
+    """Percentile over all endpoints, interpolated within buckets like histogram_quantile()."""
+    buckets: Dict[float, float] = {}
+    for labels, count in samples.get("api_request_duration_seconds_bucket", []):
+        le = math.inf if labels["le"] == "+Inf" else float(labels["le"])
+        buckets[le] = buckets.get(le, 0) + count
+    if not buckets or not buckets.get(math.inf):
+        return 0.0
+    rank = buckets[math.inf] * p / 100
+    lower, below = 0.0, 0.0
+    for bound in sorted(buckets):
+        seen = buckets[bound]
+        if seen >= rank:
+            if bound == math.inf:
+                return lower
+            return lower + (bound - lower) * (rank - below) / max(seen - below, 1)
+        lower, below = bound, seen
+    return lower
+
+
+def _total(samples: Dict[str, list], name: str, **match) -> float:
+    return sum(value for labels, value in samples.get(name, [])
+               if all(labels.get(k) == v for k, v in match.items()))
+
+
+def _peak_rss_mb(rusage) -> float:
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return rusage.ru_maxrss * scale / (1024 * 1024)
+
+
+def run_size(organizations: int, work_dir: Path, args, extra_env: Dict[str, str]) -> dict:
+    run_dir = work_dir / f"orgs-{organizations}"
+    run_dir.mkdir(parents=True, exist_ok=True)
+    inputs_file = run_dir / "inputs.yaml"
+    # JSON is valid YAML and much faster to write and read at 100k items
+    inputs_file.write_text(json.dumps(generate_inputs(organizations)))
+    metrics_file = run_dir / "metrics.prom"
+
+    faults = fake_quay.Faults(args.latency, args.jitter, args.error_rate, args.throttle_rate, args.retry_after, 1)
+    server = fake_quay.serve(faults=faults, token=TOKEN)
+    try:
+        env = dict(os.environ)
+        env.update({
+            "API_HOST": "http://127.0.0.1",
+            "API_PORT": str(server.server_address[1]),
+            "API_BASE_PATH": fake_quay.BASE_PATH,
+            "API_TOKEN": TOKEN,
+            "API_AUTH_TYPE": "bearer",
+            "PIPELINE_FILE": str(PIPELINE_FILE),
+            "INPUTS_FILE": str(inputs_file),
+            "MAX_PARALLEL": str(args.parallel),
+            "METRICS_TEXTFILE": str(metrics_file),
+            "REQUEST_STATS_FILE": str(run_dir / "request-stats.json"),
+            "PUSHGATEWAY_URL": "",
+            "LOG_LEVEL": "ERROR",
+            "PROGRESS_MODE": "compact",
+            "DEBUG_ENABLED": "false",
+            "SHOW_CURL": "false",
+        })
+        env.update(extra_env)
+
+        started = time.perf_counter()
+        with open(run_dir / "output.log", "wb") as output:
+            process = subprocess.Popen([sys.executable, "main.py"], cwd=SRC_DIR, env=env,
+                                       stdout=output, stderr=subprocess.STDOUT)
+            _, status, rusage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+        wall = time.perf_counter() - started
+        server_stats = server.stats()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    samples = parse_metrics(metrics_file.read_text()) if metrics_file.exists() else {}
+    duration = _total(samples, "run_duration_seconds") or wall
+    requests = _total(samples, "api_requests_total")
+    items = _total(samples, "items_total", outcome="succeeded") + _total(samples, "items_total", outcome="failed")
+    return {
+        "organizations": organizations,
+        "exit_code": process.returncode,
+        "wall_seconds": round(wall, 3),
+        "run_seconds": round(duration, 3),
+        "items": int(items),
+        "failed_items": int(_total(samples, "items_total", outcome="failed")),
+        "requests": int(requests),
+        "request_errors": int(_total(samples, "api_errors_total")),
+        "retries": int(_total(samples, "api_retries_total")),
+        "requests_per_second": round(requests / duration, 1) if duration else 0.0,
+        "items_per_second": round(items / duration, 1) if duration else 0.0,
+        "p95_latency_ms": round(latency_percentile(samples, 95) * 1000, 2),
+        "peak_rss_mb": round(_peak_rss_mb(rusage), 1),
+        "server_requests": server_stats["total"],
+        "injected_faults": server_stats["injected"],
+        "output": str(run_dir / "output.log"),
+    }
+
+
+def print_report(results: List[dict]) -> None:
+    columns = [
+        ("orgs", "organizations", 7, "d"),
+        ("items", "items", 8, "d"),
+        ("failed", "failed_items", 7, "d"),
+        ("run s", "run_seconds", 9, ".2f"),
+        ("requests", "requests", 9, "d"),
+        ("req/s", "requests_per_second", 9, ".1f"),
+        ("items/s", "items_per_second", 9, ".1f"),
+        ("p95 ms", "p95_latency_ms", 8, ".2f"),
+        ("peak MB", "peak_rss_mb", 8, ".1f"),
+    ]
+    header = "  ".join(f"{title:>{width}}" for title, _, width, _ in columns)
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        print("  ".join(f"{result[key]:>{width}{spec}}" for _, key, width, spec in columns))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the full provisioning pipeline against a fake Quay API")
+    parser.add_argument("--orgs", type=int, nargs="+", default=[10, 1000, 10000],
+                        help="organization counts to run (default: 10 1000 10000)")
+    parser.add_argument("--parallel", type=int, default=8, help="MAX_PARALLEL of the provisioner (default: 8)")
+    parser.add_argument("--latency", type=float, default=0.0, help="fake server latency per request in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="uniform +/- latency jitter in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=0.1, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE",
+                        help="extra provisioner setting, repeatable (e.g. --env ASYNC_IO=true)")
+    parser.add_argument("--work-dir", help="keep inputs, metrics and logs here (default: a temporary directory)")
+    parser.add_argument("-o", "--output", help="also write the results as JSON to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    extra_env = {}
+    for item in args.env:
+        key, sep, value = item.partition("=")
+        if not sep:
+            print(f"--env expects KEY=VALUE, got: {item}", file=sys.stderr)
+            return 2
+        extra_env[key] = value
+
+    temp: Optional[tempfile.TemporaryDirectory] = None
+    if args.work_dir:
+        work_dir = Path(args.work_dir).resolve()
+    else:
+        temp = tempfile.TemporaryDirectory(prefix="quay-bench-")
+        work_dir = Path(temp.name)
+
+    results = []
+    try:
+        for organizations in args.orgs:
+            print(f"Running {organizations} organizations ({organizations * 10} items)...", flush=True)
+            result = run_size(organizations, work_dir, args, extra_env)
+            results.append(result)
+            if result["exit_code"]:
+                where = f", see {result['output']}" if args.work_dir else " (use --work-dir to keep its output)"
+                print(f"  run exited with {result['exit_code']}{where}", flush=True)
+            if not args.work_dir:
+                del result["output"]
+    finally:
+        if results:
+            print()
+            print_report(results)
+        if args.output and results:
+            Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+        if temp:
+            temp.cleanup()
+
+    return 1 if any(result["exit_code"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
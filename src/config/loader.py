@@ -41,13 +41,51 @@ class Config:
 
         debug_cfg = data.get("debug", {})
         self.debug = os.getenv("DEBUG_ENABLED", str(debug_cfg.get("enabled", "false"))).lower() == "true"
-        log.configure(self.debug)
+        logging_cfg = data.get("logging", {})
+        self.log_level = os.getenv("LOG_LEVEL", logging_cfg.get("level", "INFO")).upper()
+        self.log_format = os.getenv("LOG_FORMAT", logging_cfg.get("format", "text")).lower()
+        log.configure(self.debug, self.log_level, self.log_format)
 
         BASE_DIR = Path(__file__).resolve().parent.parent
 
         self.pipeline_file = Path(os.getenv("PIPELINE_FILE", BASE_DIR / "pipelines/pipeline.yaml")).resolve()
         self.inputs_file = Path(os.getenv("INPUTS_FILE", BASE_DIR / "pipelines/inputs.yaml")).resolve()
 
+        # --- EXECUTION CONFIG ---
+        execution = data.get("execution", {})
+        try:
+            self.max_parallel = int(os.getenv("MAX_PARALLEL", execution.get("max_parallel", 1)))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"MAX_PARALLEL must be a valid integer: {e}") from e
+
+        if self.max_parallel < 1:
+            raise ValueError(f"MAX_PARALLEL must be at least 1, got: {self.max_parallel}")
+
+        self.adaptive = os.getenv(
+            "ADAPTIVE_CONCURRENCY", str(execution.get("adaptive", "false"))
+        ).lower() == "true"
+        self.optimistic = os.getenv(
+            "OPTIMISTIC_WRITES", str(execution.get("optimistic", "false"))
+        ).lower() == "true"
+        self.plan = os.getenv("PLAN_MODE", str(execution.get("plan", "false"))).lower() == "true"
+        plan_snapshot = os.getenv("PLAN_SNAPSHOT", execution.get("plan_snapshot") or "")
+        self.plan_snapshot = Path(plan_snapshot).resolve() if plan_snapshot else None
+        self.async_io = os.getenv("ASYNC_IO", str(execution.get("async_io", "false"))).lower() == "true"
+        self.streaming = os.getenv("STREAMING", str(execution.get("streaming", "false"))).lower() == "true"
+
+        # --- DISPLAY CONFIG ---
+        display = data.get("display", {})
+        self.progress_mode = os.getenv("PROGRESS_MODE", display.get("progress", "items")).lower()
+        if self.progress_mode not in ("items", "compact", "auto"):
+            raise ValueError(f"PROGRESS_MODE must be items, compact or auto, got: {self.progress_mode}")
+        try:
+            self.progress_interval = float(os.getenv("PROGRESS_INTERVAL", display.get("progress_interval", 10)))
+            self.progress_auto_threshold = int(
+                os.getenv("PROGRESS_AUTO_THRESHOLD", display.get("progress_auto_threshold", 100))
+            )
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"PROGRESS_INTERVAL/PROGRESS_AUTO_THRESHOLD must be numbers: {e}") from e
+
         api = data["api"]
         auth = data.get("auth", {})
 
@@ -75,13 +113,101 @@ class Config:
         self.base_url = f"{self.host}:{self.port}{self.base_path}"
 
         if self.debug:
-            log.debug("Config", f"Config raw_host={raw_host}")
-            log.debug("Config", f"Config normalized_host={self.host}")
-            log.debug("Config", f"Config port={self.port}")
-            log.debug("Config", f"Config raw_base_path={raw_base_path}")
-            log.debug("Config", f"Config normalized_base_path={self.base_path}")
-            log.debug("Config", f"Config base_url={self.base_url}")
-            log.debug("Config", f"App version={self.version}")
+            log.debug("Config", "Config raw_host=%s", raw_host)
+            log.debug("Config", "Config normalized_host=%s", self.host)
+            log.debug("Config", "Config port=%s", self.port)
+            log.debug("Config", "Config raw_base_path=%s", raw_base_path)
+            log.debug("Config", "Config normalized_base_path=%s", self.base_path)
+            log.debug("Config", "Config base_url=%s", self.base_url)
+            log.debug("Config", "App version=%s", self.version)
+            log.debug("Config", "Execution max_parallel=%s adaptive=%s", self.max_parallel, self.adaptive)
+            log.debug("Config", "Execution optimistic=%s", self.optimistic)
+            log.debug("Config", "Execution plan=%s async_io=%s streaming=%s", self.plan, self.async_io, self.streaming)
+
+        # --- RETRY CONFIG ---
+        retry = data.get("retry", {})
+        try:
+            self.retry_max = int(os.getenv("RETRY_MAX", retry.get("max_retries", 3)))
+            self.retry_backoff_base = float(os.getenv("RETRY_BACKOFF_BASE", retry.get("backoff_base", 0.5)))
+            self.retry_backoff_max = float(os.getenv("RETRY_BACKOFF_MAX", retry.get("backoff_max", 30)))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Retry settings must be numeric: {e}") from e
+
+        if self.retry_max < 0:
+            raise ValueError(f"RETRY_MAX must not be negative, got: {self.retry_max}")
+
+        self.retry_all_methods = os.getenv(
+            "RETRY_ALL_METHODS", str(retry.get("all_methods", "false"))
+        ).lower() == "true"
+
+        if self.debug:
+            log.debug("Config", "Retry max=%s base=%ss cap=%ss all_methods=%s",
+                      self.retry_max, self.retry_backoff_base, self.retry_backoff_max, self.retry_all_methods)
+
+        # --- RATE LIMIT CONFIG ---
+        rate_limit = data.get("rate_limit", {})
+        try:
+            self.rate_limit_rps = float(os.getenv("RATE_LIMIT_RPS", rate_limit.get("requests_per_second", 0)))
+            self.rate_limit_burst = float(os.getenv("RATE_LIMIT_BURST", rate_limit.get("burst", 0)))
+            self.rate_limit_read_rps = float(os.getenv("RATE_LIMIT_READ_RPS", rate_limit.get("read_per_second", 0)))
+            self.rate_limit_write_rps = float(
+                os.getenv("RATE_LIMIT_WRITE_RPS", rate_limit.get("write_per_second", 0))
+            )
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Rate limit settings must be numeric: {e}") from e
+
+        if min(self.rate_limit_rps, self.rate_limit_burst, self.rate_limit_read_rps, self.rate_limit_write_rps) < 0:
+            raise ValueError("Rate limit settings must not be negative")
+
+        if self.debug:
+            log.debug("Config", "Rate limit rps=%s burst=%s read_rps=%s write_rps=%s",
+                      self.rate_limit_rps, self.rate_limit_burst, self.rate_limit_read_rps, self.rate_limit_write_rps)
+
+        # --- JOURNAL CONFIG ---
+        journal = data.get("journal", {})
+        journal_path = os.getenv("JOURNAL_PATH", journal.get("path") or "")
+        self.journal_path = Path(journal_path).resolve() if journal_path else None
+        self.resume = os.getenv("RESUME", str(journal.get("resume", "false"))).lower() == "true"
+        try:
+            self.journal_sync_every = int(os.getenv("JOURNAL_SYNC_EVERY", journal.get("sync_every", 50)))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"JOURNAL_SYNC_EVERY must be a valid integer: {e}") from e
+
+        if self.debug:
+            log.debug("Config", "Journal path=%s resume=%s sync_every=%s",
+                      self.journal_path, self.resume, self.journal_sync_every)
+
+        # --- STATE STORE CONFIG ---
+        state_store = data.get("state_store", {})
+        state_store_path = os.getenv("STATE_STORE_PATH", state_store.get("path") or "")
+        self.state_store_path = Path(state_store_path).resolve() if state_store_path else None
+        self.full_reconcile = os.getenv(
+            "FULL_RECONCILE", str(state_store.get("full_reconcile", "false"))
+        ).lower() == "true"
+
+        if self.debug:
+            log.debug("Config", "State store path=%s full_reconcile=%s", self.state_store_path, self.full_reconcile)
+
+        # --- METRICS CONFIG ---
+        metrics = data.get("metrics", {})
+        request_stats_file = os.getenv("REQUEST_STATS_FILE", metrics.get("request_stats_file") or "")
+        self.request_stats_file = Path(request_stats_file).resolve() if request_stats_file else None
+        metrics_textfile = os.getenv("METRICS_TEXTFILE", metrics.get("textfile") or "")
+        self.metrics_textfile = Path(metrics_textfile).resolve() if metrics_textfile else None
+        self.pushgateway_url = os.getenv("PUSHGATEWAY_URL", metrics.get("pushgateway_url") or "")
+        self.metrics_job = os.getenv("METRICS_JOB", metrics.get("job") or "quay_provisioner")
+
+        # --- TRACING CONFIG ---
+        tracing = data.get("tracing", {})
+        trace_file = os.getenv("TRACE_FILE", tracing.get("file") or "")
+        self.trace_file = Path(trace_file).resolve() if trace_file else None
+        self.trace_format = os.getenv("TRACE_FORMAT", tracing.get("format", "chrome")).lower()
+        if self.trace_format not in ("chrome", "otlp"):
+            raise ValueError(f"TRACE_FORMAT must be chrome or otlp, got: {self.trace_format}")
+        try:
+            self.trace_max_spans = int(os.getenv("TRACE_MAX_SPANS", tracing.get("max_spans", 500000)))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"TRACE_MAX_SPANS must be a valid integer: {e}") from e
 
         # --- AUTH CONFIG ---
         self.auth_type = os.getenv("API_AUTH_TYPE", auth.get("type", "bearer"))
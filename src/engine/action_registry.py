@@ -1,50 +1,141 @@
-from quay.actions.team.add_team_member import AddTeamMemberAction
-from quay.actions.organization.create_organization import CreateOrganizationAction
-from quay.actions.robot_account.create_robot_account import CreateRobotAccountAction
-from quay.actions.team.create_team import CreateTeamAction
-from quay.actions.organization.delete_organization import DeleteOrganizationAction
-from quay.actions.robot_account.delete_robot_account import DeleteRobotAccountAction
-from quay.actions.team.delete_team import DeleteTeamAction
-from quay.actions.organization.get_organization import GetOrganizationAction
-from quay.actions.robot_account.get_robot_account import GetRobotAccountAction
-from quay.actions.team.get_team import GetTeamAction
-from quay.actions.organization.list_organizations import ListOrganizationsAction
-from quay.actions.robot_account.list_robot_accounts import ListRobotAccountsAction
-from quay.actions.team.sync_team_ldap import SyncTeamLdapAction
-from quay.actions.team.get_team_sync_status import GetTeamSyncStatusAction
-from quay.actions.team.remove_team_member import RemoveTeamMemberAction
-from quay.actions.team.unsync_team_ldap import UnsyncTeamLdapAction
-from quay.actions.team.set_team_repository_permission import SetTeamRepositoryPermissionAction
-from quay.actions.team.remove_team_repository_permission import RemoveTeamRepositoryPermissionAction
-from quay.actions.team.invite_team_member import InviteTeamMemberAction
-from quay.actions.team.delete_team_invite import DeleteTeamInviteAction
-from quay.actions.team.set_default_repository_permission import SetDefaultRepositoryPermissionAction
-from quay.actions.team.remove_default_repository_permission import RemoveDefaultRepositoryPermissionAction
-
-ACTION_REGISTRY = {
+"""Job name -> action class, with action modules imported on first use."""
+
+import importlib
+import threading
+import time
+from typing import Dict, Iterator, List, Union
+
+from utils.logger import Logger as log
+
+# Third-party actions register here: [project.entry-points."quay_provisioner.actions"]
+ENTRY_POINT_GROUP = "quay_provisioner.actions"
+
+BUILTIN_ACTIONS: Dict[str, str] = {
     # Organization actions
-    "create_organization": CreateOrganizationAction,
-    "delete_organization": DeleteOrganizationAction,
-    "get_organization": GetOrganizationAction,
-    "list_organizations": ListOrganizationsAction,
+    "create_organization": "quay.actions.organization.create_organization:CreateOrganizationAction",
+    "delete_organization": "quay.actions.organization.delete_organization:DeleteOrganizationAction",
+    "get_organization": "quay.actions.organization.get_organization:GetOrganizationAction",
+    "list_organizations": "quay.actions.organization.list_organizations:ListOrganizationsAction",
     # Robot account actions
-    "create_robot_account": CreateRobotAccountAction,
-    "delete_robot_account": DeleteRobotAccountAction,
-    "list_robot_accounts": ListRobotAccountsAction,
-    "get_robot_account": GetRobotAccountAction,
+    "create_robot_account": "quay.actions.robot_account.create_robot_account:CreateRobotAccountAction",
+    "delete_robot_account": "quay.actions.robot_account.delete_robot_account:DeleteRobotAccountAction",
+    "list_robot_accounts": "quay.actions.robot_account.list_robot_accounts:ListRobotAccountsAction",
+    "get_robot_account": "quay.actions.robot_account.get_robot_account:GetRobotAccountAction",
     # Team actions
-    "create_team": CreateTeamAction,
-    "delete_team": DeleteTeamAction,
-    "get_team": GetTeamAction,
-    "add_team_member": AddTeamMemberAction,
-    "remove_team_member": RemoveTeamMemberAction,
-    "set_team_repository_permission": SetTeamRepositoryPermissionAction,
-    "remove_team_repository_permission": RemoveTeamRepositoryPermissionAction,
-    "invite_team_member": InviteTeamMemberAction,
-    "delete_team_invite": DeleteTeamInviteAction,
-    "set_default_repository_permission": SetDefaultRepositoryPermissionAction,
-    "remove_default_repository_permission": RemoveDefaultRepositoryPermissionAction,
-    "sync_team_ldap": SyncTeamLdapAction,
-    "unsync_team_ldap": UnsyncTeamLdapAction,
-    "get_team_sync_status": GetTeamSyncStatusAction,
+    "create_team": "quay.actions.team.create_team:CreateTeamAction",
+    "delete_team": "quay.actions.team.delete_team:DeleteTeamAction",
+    "get_team": "quay.actions.team.get_team:GetTeamAction",
+    "add_team_member": "quay.actions.team.add_team_member:AddTeamMemberAction",
+    "remove_team_member": "quay.actions.team.remove_team_member:RemoveTeamMemberAction",
+    "reconcile_team_members": "quay.actions.team.reconcile_team_members:ReconcileTeamMembersAction",
+    "set_team_repository_permission":
+        "quay.actions.team.set_team_repository_permission:SetTeamRepositoryPermissionAction",
+    "remove_team_repository_permission":
+        "quay.actions.team.remove_team_repository_permission:RemoveTeamRepositoryPermissionAction",
+    "invite_team_member": "quay.actions.team.invite_team_member:InviteTeamMemberAction",
+    "delete_team_invite": "quay.actions.team.delete_team_invite:DeleteTeamInviteAction",
+    "set_default_repository_permission":
+        "quay.actions.team.set_default_repository_permission:SetDefaultRepositoryPermissionAction",
+    "remove_default_repository_permission":
+        "quay.actions.team.remove_default_repository_permission:RemoveDefaultRepositoryPermissionAction",
+    "sync_team_ldap": "quay.actions.team.sync_team_ldap:SyncTeamLdapAction",
+    "unsync_team_ldap": "quay.actions.team.unsync_team_ldap:UnsyncTeamLdapAction",
+    "get_team_sync_status": "quay.actions.team.get_team_sync_status:GetTeamSyncStatusAction",
 }
+
+
+def _import_target(target: str) -> type:
+    module_name, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+class ActionRegistry:
+    """Mapping of job name -> action class that imports action modules lazily.
+
+    Built-in jobs map to "module:Class" paths; a module is imported the
+    first time a step resolves its job, so a pipeline only pays for the
+    actions it uses. Third-party actions are discovered from the
+    ENTRY_POINT_GROUP entry points (name = job, value = "module:Class")
+    the first time a job is not a built-in or the job list is needed;
+    built-ins take precedence. Classes or paths can also be registered
+    directly. The import time of every resolved job is kept in `load_times`.
+    """
+
+    def __init__(self, targets: Dict[str, str]):
+        self._targets: Dict[str, Union[str, type]] = dict(targets)
+        self._classes: Dict[str, type] = {}
+        self._discovered = False
+        self._lock = threading.Lock()
+        self.load_times: Dict[str, float] = {}
+
+    def register(self, job: str, target: Union[str, type]) -> None:
+        """Map a job to an action class or a "module:Class" path."""
+        with self._lock:
+            self._targets[job] = target
+            self._classes.pop(job, None)
+
+    __setitem__ = register
+
+    def _discover(self) -> None:
+        if self._discovered:
+            return
+        with self._lock:
+            if self._discovered:
+                return
+            # importlib.metadata scans site-packages; only pay for it when a job is not built in
+            from importlib.metadata import entry_points
+            try:
+                found = entry_points(group=ENTRY_POINT_GROUP)
+            except Exception as e:
+                log.error("ActionRegistry", f"Failed to read '{ENTRY_POINT_GROUP}' entry points: {e}")
+                found = []
+            for entry_point in found:
+                if entry_point.name in self._targets:
+                    log.debug("ActionRegistry", "Ignoring entry point '%s': job already registered", entry_point.name)
+                    continue
+                self._targets[entry_point.name] = entry_point.value
+                log.debug("ActionRegistry", "Discovered action '%s' -> %s", entry_point.name, entry_point.value)
+            self._discovered = True
+
+    def __contains__(self, job: object) -> bool:
+        if job in self._targets:
+            return True
+        self._discover()
+        return job in self._targets
+
+    def keys(self) -> List[str]:
+        self._discover()
+        return list(self._targets)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __getitem__(self, job: str) -> type:
+        action_class = self._classes.get(job)
+        if action_class is not None:
+            return action_class
+        if job not in self:
+            raise KeyError(job)
+
+        with self._lock:
+            if job in self._classes:
+                return self._classes[job]
+            target = self._targets[job]
+            started = time.perf_counter()
+            try:
+                action_class = target if isinstance(target, type) else _import_target(target)
+            except (ImportError, AttributeError) as e:
+                raise ValueError(f"Cannot load action for job '{job}' from '{target}': {e}") from e
+            self.load_times[job] = time.perf_counter() - started
+            self._classes[job] = action_class
+        log.debug("ActionRegistry", "Loaded '%s' in %.1fms", job, self.load_times[job] * 1000)
+        return action_class
+
+    def get(self, job: str, default=None):
+        return self[job] if job in self else default
+
+
+ACTION_REGISTRY = ActionRegistry(BUILTIN_ACTIONS)
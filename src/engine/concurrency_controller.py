@@ -0,0 +1,98 @@
+"""AIMD concurrency control for parallel params_list iterations."""
+
+import math
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from utils.logger import Logger as log
+
+CONGESTION_STATUSES = {429, 500, 502, 503, 504}
+LATENCY_TOLERANCE = 2.0  # p95 above this multiple of the baseline counts as a spike
+DECREASE_FACTOR = 0.5
+MIN_WINDOW = 10  # samples needed before a latency-based decision
+BASELINE_WEIGHT = 0.2  # EWMA weight of each window's p95 in the baseline
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class AdaptiveConcurrency:
+    """Additive-increase / multiplicative-decrease limit on in-flight items.
+
+    The controller listens to every ApiClient attempt. A 429, 5xx or
+    transport error halves the limit immediately. Otherwise, once a window
+    of max(limit, MIN_WINDOW) samples has been collected:
+    - a p95 latency above LATENCY_TOLERANCE x baseline halves the limit
+    - otherwise the limit doubles (slow start, until the first decrease)
+      or grows by one
+    The baseline is a slow EWMA of window p95s, so the limit settles where
+    latency starts to climb and recovers once latency is stable again.
+    After a decrease, errors are only acted on at the end of the next
+    window, so one burst (including retries of items already in flight)
+    cuts the limit once. Every change is recorded in `history`.
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1, initial: Optional[int] = None):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self._limit = max(self.min_limit, min(initial or self.min_limit, self.max_limit))
+        self._slow_start = True
+        self._baseline: Optional[float] = None
+        self._window: List[float] = []
+        self._congested = False
+        self._lock = threading.Lock()
+        self._cooldown = 0
+        self._started = time.monotonic()
+        self.history: List[Tuple[float, int]] = [(0.0, self._limit)]
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def on_request(self, method: str, template: str, status: Optional[int], latency: float) -> None:
+        """RequestStats listener."""
+        with self._lock:
+            if self._cooldown:
+                self._cooldown -= 1
+            if status is None or status in CONGESTION_STATUSES:
+                self._congested = True
+            else:
+                self._window.append(latency)
+
+            if (self._congested and not self._cooldown) or len(self._window) >= max(self._limit, MIN_WINDOW):
+                self._adjust()
+
+    def _adjust(self) -> None:
+        p95 = percentile(self._window, 95)
+        if self._congested:
+            reason = "errors"
+            new_limit = int(self._limit * DECREASE_FACTOR)
+        elif self._baseline is not None and p95 > self._baseline * LATENCY_TOLERANCE:
+            reason = f"p95 {p95 * 1000:.0f}ms > {LATENCY_TOLERANCE}x baseline {self._baseline * 1000:.0f}ms"
+            new_limit = int(self._limit * DECREASE_FACTOR)
+        else:
+            reason = None
+            new_limit = self._limit * 2 if self._slow_start else self._limit + 1
+
+        if reason:
+            self._slow_start = False
+        if self._window:
+            self._baseline = p95 if self._baseline is None else (
+                self._baseline * (1 - BASELINE_WEIGHT) + p95 * BASELINE_WEIGHT
+            )
+
+        self._window = []
+        self._congested = False
+        new_limit = max(self.min_limit, min(self.max_limit, new_limit))
+        if reason:
+            self._cooldown = max(new_limit, MIN_WINDOW)
+        if new_limit != self._limit:
+            log.debug("AdaptiveConcurrency", f"limit {self._limit} -> {new_limit}" + (f" ({reason})" if reason else ""))
+            self._limit = new_limit
+            self.history.append((time.monotonic() - self._started, new_limit))
@@ -0,0 +1,179 @@
+"""Export run metrics in the Prometheus text exposition format."""
+
+import math
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from gateway.request_stats import EndpointStats
+from utils.display import PipelineStats
+from utils.logger import Logger as log
+
+PREFIX = "quay_provisioner"
+PUSH_TIMEOUT = 10  # seconds
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Writer:
+    """Collects samples grouped by metric family (HELP/TYPE once per family)."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def family(self, name: str, kind: str, help_text: str) -> str:
+        name = f"{PREFIX}_{name}"
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+        return name
+
+    def sample(self, name: str, value: float, **labels) -> None:
+        self.lines.append(f"{name}{_labels(**labels)} {_number(value)}")
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def render_metrics(
+    stats: PipelineStats,
+    duration: float,
+    endpoints: Dict[str, EndpointStats],
+    retries: Dict[str, int],
+    finished_at: Optional[float] = None
+) -> str:
+    """Render the metrics of one run; `endpoints`/`retries` come from RequestStats."""
+    out = _Writer()
+
+    name = out.family("run_success", "gauge", "1 if the last run had no failed step, else 0.")
+    out.sample(name, 0 if stats.failed_steps else 1)
+    name = out.family("run_duration_seconds", "gauge", "Wall time of the last run.")
+    out.sample(name, round(duration, 6))
+    name = out.family("run_finished_timestamp_seconds", "gauge", "Unix time the last run finished.")
+    out.sample(name, round(finished_at or time.time(), 3))
+
+    name = out.family("steps", "gauge", "Steps of the last run by status.")
+    out.sample(name, stats.successful_steps, status="successful")
+    out.sample(name, stats.failed_steps, status="failed")
+    out.sample(name, stats.skipped_steps, status="skipped")
+
+    name = out.family("step_duration_seconds", "gauge", "Duration of each step of the last run.")
+    for result in stats.results:
+        out.sample(name, round(result.duration, 6), step=result.name, job=result.job)
+    name = out.family("step_success", "gauge", "1 if the step succeeded, else 0.")
+    for result in stats.results:
+        out.sample(name, 1 if result.success else 0, step=result.name, job=result.job)
+
+    durations = {result.name: result.duration for result in stats.results}
+    name = out.family("items_total", "counter", "params items by step and outcome (succeeded, failed, skipped).")
+    for step, counts in sorted(stats.items.items()):
+        for outcome, count in sorted(counts.items()):
+            out.sample(name, count, step=step, outcome=outcome)
+    name = out.family("items_per_second", "gauge", "Items executed per second of step duration.")
+    for step, counts in sorted(stats.items.items()):
+        executed = counts.get("succeeded", 0) + counts.get("failed", 0)
+        if durations.get(step):
+            out.sample(name, round(executed / durations[step], 3), step=step)
+
+    keys = sorted(endpoints)
+    name = out.family("api_requests_total", "counter", "HTTP attempts (retries included) by endpoint template.")
+    for key in keys:
+        method, _, template = key.partition(" ")
+        out.sample(name, endpoints[key].count, method=method, endpoint=template)
+    name = out.family(
+        "api_errors_total", "counter", "Failed HTTP attempts (transport errors, HTTP errors except GET 404)."
+    )
+    for key in keys:
+        method, _, template = key.partition(" ")
+        out.sample(name, endpoints[key].errors, method=method, endpoint=template)
+    name = out.family("api_response_bytes_total", "counter", "Response body bytes by endpoint template.")
+    for key in keys:
+        method, _, template = key.partition(" ")
+        out.sample(name, endpoints[key].bytes, method=method, endpoint=template)
+    name = out.family("api_retries_total", "counter", "Retried HTTP attempts by endpoint template.")
+    for key, count in sorted(retries.items()):
+        method, _, template = key.partition(" ")
+        out.sample(name, count, method=method, endpoint=template)
+
+    name = out.family("api_request_duration_seconds", "histogram", "HTTP attempt latency by endpoint template.")
+    for key in keys:
+        method, _, template = key.partition(" ")
+        latency = endpoints[key].latency
+        for bound, count in latency.cumulative():
+            le = "+Inf" if bound == math.inf else f"{bound:g}"
+            out.sample(f"{name}_bucket", count, method=method, endpoint=template, le=le)
+        out.sample(f"{name}_sum", round(latency.total, 6), method=method, endpoint=template)
+        out.sample(f"{name}_count", latency.count, method=method, endpoint=template)
+
+    lookups = stats.cache_hits + stats.cache_misses
+    name = out.family("cache_hits_total", "counter", "Existence cache hits.")
+    out.sample(name, stats.cache_hits)
+    name = out.family("cache_misses_total", "counter", "Existence cache misses.")
+    out.sample(name, stats.cache_misses)
+    name = out.family("cache_hit_ratio", "gauge", "Existence cache hits / lookups (0 without lookups).")
+    out.sample(name, round(stats.cache_hits / lookups, 6) if lookups else 0)
+
+    return out.text()
+
+
+def write_textfile(text: str, path: Path) -> None:
+    """Write for node_exporter's textfile collector, which must never see a partial file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def push(text: str, url: str, job: str) -> None:
+    """Replace the metrics of `job` on a Pushgateway-compatible endpoint."""
+    import requests
+
+    target = f"{url.rstrip('/')}/metrics/job/{quote(job, safe='')}"
+    response = requests.put(
+        target,
+        data=text.encode("utf-8"),
+        headers={"Content-Type": "text/plain; version=0.0.4"},
+        timeout=PUSH_TIMEOUT
+    )
+    response.raise_for_status()
+
+
+def export_metrics(cfg, stats: PipelineStats, duration: float, endpoints: Dict[str, EndpointStats],
+                   retries: Dict[str, int]) -> None:
+    """Write and/or push the run metrics as configured; failures are logged, not raised."""
+    if not cfg.metrics_textfile and not cfg.pushgateway_url:
+        return
+    text = render_metrics(stats, duration, endpoints, retries)
+
+    if cfg.metrics_textfile:
+        try:
+            write_textfile(text, cfg.metrics_textfile)
+            log.info("MetricsExporter", f"Wrote metrics to {cfg.metrics_textfile}")
+        except OSError as e:
+            log.error("MetricsExporter", f"Failed to write metrics to {cfg.metrics_textfile}: {e}")
+
+    if cfg.pushgateway_url:
+        import requests
+
+        try:
+            push(text, cfg.pushgateway_url, cfg.metrics_job)
+            log.info("MetricsExporter", f"Pushed metrics to {cfg.pushgateway_url} (job={cfg.metrics_job})")
+        except requests.RequestException as e:
+            log.error("MetricsExporter", f"Failed to push metrics to {cfg.pushgateway_url}: {e}")
@@ -8,28 +8,29 @@ from utils.logger import Logger as log
 
 class PipelineEngine:
 
-    def __init__(self, config):
+    def __init__(self, config, gateway=None):
         self.reader = PipelineReader()
         self.validator = PipelineValidator()
-        self.executor = PipelineExecutor()
+        self.executor = PipelineExecutor(gateway)
         self.config = config
 
     def load_pipeline(self, pipeline_file: str):
         try:
-            log.debug("PipelineEngine", f"Loading pipeline file: {pipeline_file}")
+            log.debug("PipelineEngine", "Loading pipeline file: %s", pipeline_file)
 
             pipeline = self.reader.load_pipeline(pipeline_file)
-            log.debug("PipelineEngine", f"Raw pipeline structure: {pipeline}")
+            log.debug("PipelineEngine", "Raw pipeline structure: %s", pipeline)
 
             inputs = self.reader.load_inputs(self.config.inputs_file)
-            log.debug("PipelineEngine", f"Loaded inputs from: {self.config.inputs_file}")
-            log.debug("PipelineEngine", f"Inputs resolved: {inputs}")
+            log.debug("PipelineEngine", "Loaded inputs from: %s", self.config.inputs_file)
+            log.debug("PipelineEngine", "Inputs resolved: %s", inputs)
 
             pipeline = self.reader.resolve_templates(pipeline, inputs)
-            log.debug("PipelineEngine", f"Pipeline after template resolution: {pipeline}")
+            log.debug("PipelineEngine", "Pipeline after template resolution: %s", pipeline)
             log.debug("PipelineEngine", "Template resolution completed")
 
             self.validator.validate_jobs(pipeline)
+            self.validator.validate_dependencies(pipeline)
             log.info("PipelineEngine", "Pipeline validation completed")
             return pipeline
 
@@ -44,10 +45,10 @@ class PipelineEngine:
     def run(self, pipeline):
         try:
             log.info("PipelineEngine", "Pipeline execution started")
-            log.debug("PipelineEngine", f"Executing pipeline with input file: {self.config.inputs_file}")
+            log.debug("PipelineEngine", "Executing pipeline with input file: %s", self.config.inputs_file)
 
             self.executor.run_pipeline(pipeline, self.config.inputs_file)
         except Exception as e:
-            log.debug("PipelineEngine", f"Execution error: {e}")
+            log.debug("PipelineEngine", "Execution error: %s", e)
             log.error("PipelineEngine", f"Pipeline execution failed: {e}")
             raise PipelineError(f"Execution failed: {e}") from e
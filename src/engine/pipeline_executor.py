@@ -1,22 +1,161 @@
+import asyncio
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Dict, List
 
 from config.loader import Config
 from engine.action_registry import ACTION_REGISTRY
+from engine.concurrency_controller import AdaptiveConcurrency
+from engine.pipeline_planner import PipelinePlanner, organization_of
+from engine.run_journal import RunJournal, item_hash
+from engine.state_store import AppliedStateStore
+from engine.step_graph import step_dependencies, topological_order, uses_dependencies
 from engine_reader.pipeline_reader import PipelineReader
-from quay.quay_gateway import QuayGateway
-from utils.display import Display, PipelineStats, StepResult
+from gateway.request_stats import RequestStats
+from quay.existence_cache import ExistenceCache
+from quay.prototype_index import PrototypeIndex
+from utils.display import Display, PipelineStats, ProgressLine, StepResult
+from utils import tracing
 from utils.logger import Logger as log
 
 
 class PipelineExecutor:
 
-    def __init__(self):
+    def __init__(self, gateway=None):
+        """`gateway` (default: a new QuayGateway) serves every action and the exists()
+        helpers, e.g. InMemoryQuayGateway; it may offer `async_client(limit)` for ASYNC_IO."""
         self.reader = PipelineReader()
         self.cfg = Config()
         self.stats = PipelineStats()
-        self.gateway = QuayGateway()
+        self._gateway = gateway
+        self._gateway_ready = False
+        self._gateway_lock = threading.Lock()
+        self.journal = None
+        self.state_store = None
+
+    @property
+    def gateway(self):
+        """The gateway, created and shared with the exists() helpers when a step first needs it."""
+        if not self._gateway_ready:
+            with self._gateway_lock:
+                if not self._gateway_ready:
+                    from quay.quay_gateway import QuayGateway
+                    if self._gateway is None:
+                        self._gateway = QuayGateway()
+                    QuayGateway.use(self._gateway)
+                    self._gateway_ready = True
+        return self._gateway
 
     def run_pipeline(self, pipeline, inputs_file):
+        # The redirect cache and metrics exporter (requests) load only once a pipeline runs
+        from engine.metrics_exporter import export_metrics
+        from gateway.redirect_cache import RedirectCache
+
+        started = time.time()
+        ExistenceCache.reset()
+        PrototypeIndex.reset()
+        RequestStats.reset()
+        RedirectCache.reset()
+        self.journal = self._open_journal()
+        self.state_store = self._open_state_store()
+        tracer = tracing.start(self.cfg.trace_max_spans) if self.cfg.trace_file else None
+        finished = False
+        try:
+            with tracing.span("pipeline", inputs=str(inputs_file)) as span:
+                span.set("steps", len(pipeline.pipeline))
+                self._run_steps(pipeline, inputs_file)
+            finished = self.stats.failed_steps == 0
+        finally:
+            if tracer:
+                self._write_trace(tracing.stop())
+            if self.journal:
+                self.journal.close(finished=finished)
+            if self.state_store:
+                self.state_store.close()
+            cache = ExistenceCache()
+            self.stats.cache_hits = cache.hits
+            self.stats.cache_misses = cache.misses
+            request_stats = RequestStats()
+            self.stats.retries = dict(request_stats.retries)
+            self.stats.endpoints = request_stats.summary()
+            redirects = RedirectCache()
+            self.stats.redirects_avoided = redirects.avoided
+            log.debug("PipelineExecutor", "Redirect cache: %s redirects avoided, %s remembered",
+                      redirects.avoided, redirects.size)
+            if self.cfg.request_stats_file:
+                request_stats.write(self.cfg.request_stats_file)
+            export_metrics(self.cfg, self.stats, time.time() - started, request_stats.endpoints, self.stats.retries)
+
+    def _write_trace(self, tracer) -> None:
+        try:
+            written = tracer.write(self.cfg.trace_file, self.cfg.trace_format)
+        except (OSError, ValueError) as e:
+            log.error("PipelineExecutor", f"Failed to write trace to {self.cfg.trace_file}: {e}")
+            return
+        dropped = f", {tracer.dropped} dropped (TRACE_MAX_SPANS)" if tracer.dropped else ""
+        log.info("PipelineExecutor",
+                 f"Wrote {written} spans to {self.cfg.trace_file} ({self.cfg.trace_format}{dropped})")
+
+    def _open_journal(self):
+        if self.cfg.journal_path is None:
+            if self.cfg.resume:
+                log.info("PipelineExecutor", "Resume requested but no JOURNAL_PATH is set; running everything")
+            return None
+        return RunJournal(self.cfg.journal_path, resume=self.cfg.resume, sync_every=self.cfg.journal_sync_every)
+
+    def _open_state_store(self):
+        if self.cfg.state_store_path is None:
+            if self.cfg.full_reconcile:
+                log.info("PipelineExecutor", "Full reconcile requested but no STATE_STORE_PATH is set")
+            return None
+        store = AppliedStateStore(self.cfg.state_store_path)
+        if self.cfg.full_reconcile:
+            store.reset()
+        return store
+
+    def _skip_completed(self, step, items: list) -> list:
+        """Drop the items already applied: by an interrupted run (journal) or a previous run (state store)."""
+        resuming = self.journal is not None and self.cfg.resume
+        store = self._state_store_for(step)
+        if not resuming and not store:
+            return items
+        pending, journaled, applied = [], 0, 0
+        for item in items:
+            digest = item_hash(step.job, item)
+            if resuming and self.journal.completed(step.name, digest):
+                journaled += 1
+            elif store and store.applied(step.name, digest):
+                applied += 1
+            else:
+                pending.append(item)
+        if journaled or applied:
+            self.stats.count_items(step.name, "skipped", journaled + applied)
+        if journaled:
+            Display.resume_skipped(journaled)
+        if applied:
+            Display.unchanged_skipped(applied)
+        return pending
+
+    def _record_outcome(self, step, params, success: bool) -> None:
+        self.stats.count_items(step.name, "succeeded" if success else "failed")
+        store = self._state_store_for(step)
+        if not self.journal and not store:
+            return
+        digest = item_hash(step.job, params)
+        if self.journal:
+            self.journal.record(step.name, digest, success)
+        if store:
+            store.record(step.name, digest, success)
+
+    def _state_store_for(self, step):
+        """The state store if the step's action opts in (remember_applied), else None."""
+        if self.state_store is None:
+            return None
+        action_class = ACTION_REGISTRY.get(step.job)
+        return self.state_store if getattr(action_class, "remember_applied", False) else None
+
+    def _run_steps(self, pipeline, inputs_file):
         inputs = self.reader.load_inputs(inputs_file)
 
         Display.inputs_overview(inputs, debug=self.cfg.debug)
@@ -26,6 +165,27 @@ class PipelineExecutor:
         self.stats.total_steps = len(enabled_steps)
         self.stats.skipped_steps = len(pipeline.pipeline) - len(enabled_steps)
 
+        if uses_dependencies(pipeline.pipeline) and not self.cfg.streaming:
+            max_workers = sum(s.max_parallel or self.cfg.max_parallel for s in enabled_steps)
+        else:
+            max_workers = max((s.max_parallel or self.cfg.max_parallel for s in enabled_steps), default=1)
+        if max_workers > 1:
+            self.gateway.client.ensure_pool_size(max_workers)
+
+        plans = {}
+        if self.cfg.plan:
+            planner = PipelinePlanner(self.gateway, self.cfg.max_parallel, snapshot_file=self.cfg.plan_snapshot)
+            plans = planner.plan(enabled_steps, inputs)
+            Display.plan_overview(plans)
+
+        if self.cfg.streaming:
+            self._run_steps_streaming(pipeline.pipeline, inputs, plans)
+            return
+
+        if uses_dependencies(pipeline.pipeline):
+            self._run_steps_dag(pipeline.pipeline, inputs, plans)
+            return
+
         step_num = 0
         for step in pipeline.pipeline:
             step_num += 1
@@ -33,90 +193,519 @@ class PipelineExecutor:
                 Display.step_skipped(step_num, self.stats.total_steps + self.stats.skipped_steps, step.name)
                 continue
 
-            action_class = ACTION_REGISTRY.get(step.job)
-            if action_class is None:
-                raise ValueError(f"Unknown job type: '{step.job}'. Check ACTION_REGISTRY.")
-            action = action_class(gateway=self.gateway)
-
-            # Show step start
-            Display.step_start(
-                step_num - self.stats.skipped_steps,
-                self.stats.total_steps,
-                step.name,
-                step.job
-            )
-            step_start_time = time.time()
+            self._run_step(step, step_num - self.stats.skipped_steps, inputs, plans)
+
+    def _run_steps_dag(self, steps, inputs: dict, plans: dict):
+        """Run steps as soon as the steps they depend on have succeeded.
 
-            if step.params_list:
-                key = step.params_list.replace("{{ ", "").replace(" }}", "")
-                items = inputs.get(key, [])
+        Independent steps run concurrently, each on its own thread (and with
+        its own item parallelism), and their output lines are prefixed with
+        the step name. Disabled steps count as done. When a step
+        fails, no further steps are started; steps already running finish,
+        and the first failure is re-raised.
+        """
+        dependencies = step_dependencies(steps)
+        numbers = self._number_steps(steps)
 
-                if self.cfg.debug:
-                    log.debug("PipelineExecutor", f"Dynamic params for '{key}': {len(items)} items")
+        done = {step.name for step in steps if not step.enabled}
+        pending = [step for step in steps if step.enabled]
+        running = {}
+        failure = None
+        with ThreadPoolExecutor(max_workers=max(1, len(pending)), thread_name_prefix="pipeline-step") as pool:
+            while pending or running:
+                if failure is None:
+                    for step in [s for s in pending if all(d in done for d in dependencies[s.name])]:
+                        if self.cfg.debug:
+                            log.debug("PipelineExecutor", "Starting step '%s' (dependencies satisfied)", step.name)
+                        pending.remove(step)
+                        run_step = tracing.bind(self._run_labelled_step)
+                        running[pool.submit(run_step, step, numbers[step.name], inputs, plans)] = step
 
-                if not isinstance(items, list):
-                    log.error("PipelineExecutor",
-                              f"Invalid params list for key='{key}'. Expected list, got: {type(items)}")
-                    raise ValueError(f"Invalid params list for key='{key}'")
+                if not running:
+                    break
 
-                all_success = True
-                for index, params in enumerate(items):
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
                     try:
-                        Display.dynamic_iteration(index + 1, len(items), params)
+                        future.result()
+                        done.add(step.name)
+                    except Exception as ex:
+                        if failure is None:
+                            failure = ex
 
-                        if self.cfg.debug:
-                            log.debug("PipelineExecutor",
-                                      f"[{step.name}] Executing dynamic iteration {index + 1}/{len(items)} with params={params}")
+        if failure is not None:
+            raise failure
+        if pending:
+            blocked = ", ".join(step.name for step in pending)
+            raise RuntimeError(f"Steps never became ready: {blocked}")
 
-                        if not isinstance(params, dict):
-                            log.error(
-                                "PipelineExecutor",
-                                f"Iteration {index + 1}: expected dict but received {type(params)} – value={params}"
-                            )
-                            raise ValueError(f"Invalid params in dynamic list for step '{step.name}'")
+    def _run_labelled_step(self, step, step_num: int, inputs: dict, plans: dict):
+        """_run_step with its output lines prefixed by the step name (DAG steps overlap)."""
+        with Display.step_label(step.name):
+            self._run_step(step, step_num, inputs, plans)
 
-                        response = action.execute(params)
-                        Display.dynamic_iteration_result(response.success)
+    def _run_steps_streaming(self, steps, inputs: dict, plans: dict):
+        """Streaming mode: each organization flows through the steps on its own.
 
-                        if not response.success:
-                            all_success = False
-                            log.error("PipelineExecutor", f"Iteration {index + 1} failed: {response.message}")
+        Steps are taken in dependency order. Consecutive params_list steps
+        whose items all name an organization form a stream; their items are
+        partitioned by organization and each organization runs its items in
+        step order, then input order, on up to max_parallel workers. An
+        organization whose item fails stops there while the others carry on.
+        Any other step runs normally and acts as a barrier between streams.
+        """
+        numbers = self._number_steps(steps)
+        segment = []
+        for step in topological_order(steps):
+            if not step.enabled:
+                continue
+            if self._streamable(step, inputs):
+                segment.append(step)
+                continue
+            self._stream_segment(segment, numbers, inputs, plans)
+            segment = []
+            self._run_step(step, numbers[step.name], inputs, plans)
+        self._stream_segment(segment, numbers, inputs, plans)
+
+    @staticmethod
+    def _streamable(step, inputs: dict) -> bool:
+        """True for params_list steps whose items all name an organization."""
+        if not step.params_list:
+            return False
+        key = step.params_list.replace("{{ ", "").replace(" }}", "")
+        items = inputs.get(key, [])
+        return isinstance(items, list) and all(organization_of(step.job, item) for item in items)
+
+    def _stream_segment(self, segment: list, numbers: Dict[str, int], inputs: dict, plans: dict):
+        if len(segment) < 2:
+            for step in segment:
+                self._run_step(step, numbers[step.name], inputs, plans)
+            return
+
+        actions = {step.name: self._create_action(step) for step in segment}
+        work: Dict[str, list] = {}
+        for step in segment:
+            plan = plans.get(step.name)
+            items = plan.pending if plan is not None else PipelinePlanner.step_items(step, inputs)
+            if plan is not None and plan.in_sync:
+                self.stats.count_items(step.name, "skipped", plan.in_sync)
+            for item in self._skip_completed(step, items):
+                work.setdefault(organization_of(step.job, item), []).append((step, item))
+
+        workers = max(step.max_parallel or self.cfg.max_parallel for step in segment)
+        Display.stream_start([step.name for step in segment], len(work), workers)
 
+        started = time.time()
+        finished: Dict[str, float] = {}
+        failed: Dict[str, List[str]] = {step.name: [] for step in segment}
+        not_run: Dict[str, List[str]] = {step.name: [] for step in segment}
+        lock = threading.Lock()
+
+        def run_organization(org: str, entries: list):
+            with tracing.span("organization", organization=org) as span:
+                for index, (step, item) in enumerate(entries):
+                    try:
+                        response = self._execute_iteration(actions[step.name], step, index, len(entries), item)
+                        success, message = response.success, response.message
                     except Exception as ex:
-                        Display.dynamic_iteration_result(False)
-                        log.error("PipelineExecutor",
-                                  f"Exception while executing step '{step.name}' with dynamic params: {ex}")
-                        step_duration = time.time() - step_start_time
-                        self.stats.add_result(StepResult(step.name, step.job, False, str(ex), step_duration))
-                        raise
+                        success, message = False, str(ex)
+                    with lock:
+                        finished[step.name] = time.time() - started
+                    if not success:
+                        log.error("PipelineExecutor", f"[{org}] {step.name} failed: {message}")
+                        span.fail(f"{step.name}: {message}")
+                        remaining = {later.name for later, _ in entries[index + 1:]} - {step.name}
+                        return step.name, message, remaining
+                return None, None, set()
 
-                step_duration = time.time() - step_start_time
-                self.stats.add_result(StepResult(step.name, step.job, all_success, None, step_duration))
-                Display.step_result(all_success, None, step_duration)
+        steps = ",".join(step.name for step in segment)
+        with tracing.span("stream", steps=steps), \
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stream") as pool:
+            futures = {
+                pool.submit(tracing.bind(run_organization), org, entries): org for org, entries in work.items()
+            }
+            for future in as_completed(futures):
+                org = futures[future]
+                failed_step, message, remaining = future.result()
+                elapsed = time.time() - started
+                if failed_step is None:
+                    if self.stats.first_org_ready is None:
+                        self.stats.first_org_ready = elapsed
+                    Display.stream_organization(org, True, elapsed)
+                    continue
+                failed[failed_step].append(org)
+                for name in remaining:
+                    not_run[name].append(org)
+                Display.stream_organization(org, False, elapsed, f"{failed_step}: {message}")
 
-                if not all_success:
-                    raise RuntimeError(f"Step '{step.name}' failed during dynamic iteration")
+        for step in segment:
+            message = None
+            if failed[step.name]:
+                message = f"Failed for organizations: {', '.join(sorted(failed[step.name]))}"
+            elif not_run[step.name]:
+                message = f"Not run after an earlier failure for: {', '.join(sorted(not_run[step.name]))}"
+            success = message is None
+            duration = finished.get(step.name, 0.0)
+            Display.step_start(numbers[step.name], self.stats.total_steps, step.name, step.job)
+            self.stats.add_result(StepResult(step.name, step.job, success, message, duration))
+            Display.step_result(success, message, duration)
+        log.flush()
 
-                continue
+        failed_orgs = sorted({org for orgs in failed.values() for org in orgs})
+        if failed_orgs:
+            raise RuntimeError(f"Streaming failed for organizations: {', '.join(failed_orgs)}")
+
+    @staticmethod
+    def _number_steps(steps) -> Dict[str, int]:
+        """Display numbers of the enabled steps; prints the disabled ones as skipped."""
+        numbers = {}
+        for position, step in enumerate(steps, 1):
+            if step.enabled:
+                numbers[step.name] = len(numbers) + 1
+            else:
+                Display.step_skipped(position, len(steps), step.name)
+        return numbers
+
+    def _create_action(self, step):
+        action_class = ACTION_REGISTRY.get(step.job)
+        if action_class is None:
+            raise ValueError(f"Unknown job type: '{step.job}'. Check ACTION_REGISTRY.")
+        optimistic = self.cfg.optimistic if step.optimistic is None else step.optimistic
+        return action_class(gateway=self.gateway, optimistic=optimistic)
+
+    def _run_step(self, step, step_num: int, inputs: dict, plans: dict):
+        """Run one enabled step; raises if the step fails."""
+        try:
+            with tracing.span(f"step {step.name}", step=step.name, job=step.job):
+                self._execute_step(step, step_num, inputs, plans)
+        finally:
+            # JSON log lines of the step are written with it, not at the next flush
+            log.flush()
+
+    def _execute_step(self, step, step_num: int, inputs: dict, plans: dict):
+        action = self._create_action(step)
+
+        # Show step start
+        Display.step_start(step_num, self.stats.total_steps, step.name, step.job)
+        step_start_time = time.time()
+
+        if step.params_list:
+            key = step.params_list.replace("{{ ", "").replace(" }}", "")
+            items = inputs.get(key, [])
 
             if self.cfg.debug:
-                log.debug("PipelineExecutor", f"Executing step {step.name} with params: {step.params or {} }")
+                log.debug("PipelineExecutor", "Dynamic params for '%s': %s items", key, len(items))
+
+            if not isinstance(items, list):
+                log.error("PipelineExecutor",
+                          f"Invalid params list for key='{key}'. Expected list, got: {type(items)}")
+                raise ValueError(f"Invalid params list for key='{key}'")
+
+            plan = plans.get(step.name)
+            if plan is not None and plan.in_sync:
+                Display.plan_skipped(plan.in_sync)
+                self.stats.count_items(step.name, "skipped", plan.in_sync)
+                items = plan.pending
+            items = self._skip_completed(step, items)
+
+            workers = step.max_parallel or self.cfg.max_parallel
+            if workers > 1 and len(items) > 1 and self.cfg.async_io:
+                all_success = self._run_iterations_async(action, step, items, workers, step_start_time)
+            elif workers > 1 and len(items) > 1:
+                all_success = self._run_iterations_parallel(action, step, items, workers, step_start_time)
+            else:
+                all_success = self._run_iterations_sequential(action, step, items, step_start_time)
+
+            step_duration = time.time() - step_start_time
+            self.stats.add_result(StepResult(step.name, step.job, all_success, None, step_duration))
+            Display.step_result(all_success, None, step_duration)
+
+            if not all_success:
+                raise RuntimeError(f"Step '{step.name}' failed during dynamic iteration")
+
+            return
+
+        plan = plans.get(step.name)
+        if plan is not None and not plan.pending:
+            Display.plan_skipped(plan.in_sync)
+            self.stats.count_items(step.name, "skipped", plan.in_sync)
+            self.stats.add_result(StepResult(step.name, step.job, True, "Already in sync", 0.0))
+            Display.step_result(True)
+            return
 
+        if not self._skip_completed(step, [step.params or {}]):
+            self.stats.add_result(StepResult(step.name, step.job, True, "Completed in a previous run", 0.0))
+            Display.step_result(True)
+            return
+
+        if self.cfg.debug:
+            log.debug("PipelineExecutor", "Executing step %s with params: %s", step.name, step.params or {})
+
+        try:
+            response = action.execute(step.params or {})
+            step_duration = time.time() - step_start_time
+            self._record_outcome(step, step.params or {}, response.success)
+
+            self.stats.add_result(StepResult(
+                step.name, step.job, response.success, response.message, step_duration
+            ))
+            Display.step_result(response.success, response.message, step_duration)
+
+            if not response.success:
+                raise RuntimeError(f"Step '{step.name}' failed: {response.message}")
+
+        except Exception as ex:
+            step_duration = time.time() - step_start_time
+            if step.name not in [r.name for r in self.stats.results]:
+                self.stats.add_result(StepResult(step.name, step.job, False, str(ex), step_duration))
+                Display.step_result(False, str(ex), step_duration)
+            raise
+
+    def _execute_iteration(self, action, step, index: int, total: int, params):
+        """Run a single params_list item and return the action response."""
+        self._check_iteration(step, index, total, params)
+        with tracing.span(f"item {step.name}", lane=True, step=step.name, item=index + 1) as span:
+            span.set_attributes(params)
             try:
-                response = action.execute(step.params or {})
-                step_duration = time.time() - step_start_time
+                response = action.execute(params)
+            except Exception:
+                self.stats.count_items(step.name, "failed")
+                raise
+            if not response.success:
+                span.fail(response.message)
+        self._record_outcome(step, params, response.success)
+        return response
+
+    async def _execute_iteration_async(self, action, step, index: int, total: int, params):
+        """Awaitable _execute_iteration for the asyncio path."""
+        self._check_iteration(step, index, total, params)
+        with tracing.span(f"item {step.name}", lane=True, step=step.name, item=index + 1) as span:
+            span.set_attributes(params)
+            try:
+                response = await action.execute_async(params)
+            except Exception:
+                self.stats.count_items(step.name, "failed")
+                raise
+            if not response.success:
+                span.fail(response.message)
+        self._record_outcome(step, params, response.success)
+        return response
+
+    def _check_iteration(self, step, index: int, total: int, params) -> None:
+        if self.cfg.debug:
+            log.debug("PipelineExecutor",
+                      "[%s] Executing dynamic iteration %s/%s with params=%s", step.name, index + 1, total, params)
+
+        if not isinstance(params, dict):
+            log.error(
+                "PipelineExecutor",
+                f"Iteration {index + 1}: expected dict but received {type(params)} – value={params}"
+            )
+            raise ValueError(f"Invalid params in dynamic list for step '{step.name}'")
+
+    def _fail_dynamic_step(self, step, ex: Exception, step_start_time: float):
+        log.error("PipelineExecutor",
+                  f"Exception while executing step '{step.name}' with dynamic params: {ex}")
+        step_duration = time.time() - step_start_time
+        self.stats.add_result(StepResult(step.name, step.job, False, str(ex), step_duration))
 
-                self.stats.add_result(StepResult(
-                    step.name, step.job, response.success, response.message, step_duration
-                ))
-                Display.step_result(response.success, response.message, step_duration)
+    def _progress(self, step, count: int):
+        """ProgressLine for the step in compact progress mode, None for per-item output."""
+        mode = self.cfg.progress_mode
+        if mode == "compact" or (mode == "auto" and count >= self.cfg.progress_auto_threshold):
+            return ProgressLine(step.name, count, self.cfg.progress_interval)
+        return None
 
-                if not response.success:
-                    raise RuntimeError(f"Step '{step.name}' failed: {response.message}")
+    @staticmethod
+    def _report_item(progress, index: int, items: list, success: bool, started: float, message=None):
+        if progress is None:
+            Display.iteration_line(index + 1, len(items), success)
+        else:
+            progress.item_done(index + 1, items[index], success, time.perf_counter() - started, message)
 
+    def _report_drained(self, progress, items: list, in_flight: dict) -> None:
+        """Report the items that were still in flight when another item raised (they ran and are counted)."""
+        for future, (index, started) in sorted(in_flight.items(), key=lambda entry: entry[1][0]):
+            try:
+                response = future.result()
             except Exception as ex:
-                step_duration = time.time() - step_start_time
-                if step.name not in [r.name for r in self.stats.results]:
-                    self.stats.add_result(StepResult(step.name, step.job, False, str(ex), step_duration))
-                    Display.step_result(False, str(ex), step_duration)
-                raise
+                self._report_item(progress, index, items, False, started, str(ex))
+                continue
+            self._report_item(progress, index, items, response.success, started, response.message)
+            if not response.success:
+                log.error("PipelineExecutor", f"Iteration {index + 1} failed: {response.message}")
+        in_flight.clear()
+
+    def _run_iterations_sequential(self, action, step, items: list, step_start_time: float) -> bool:
+        all_success = True
+        progress = self._progress(step, len(items))
+        try:
+            for index, params in enumerate(items):
+                started = time.perf_counter()
+                try:
+                    if progress is None:
+                        Display.dynamic_iteration(index + 1, len(items), params)
+                    response = self._execute_iteration(action, step, index, len(items), params)
+                    if progress is None:
+                        Display.dynamic_iteration_result(response.success)
+                    else:
+                        self._report_item(progress, index, items, response.success, started, response.message)
+
+                    if not response.success:
+                        all_success = False
+                        log.error("PipelineExecutor", f"Iteration {index + 1} failed: {response.message}")
+
+                except Exception as ex:
+                    if progress is None:
+                        Display.dynamic_iteration_result(False)
+                    else:
+                        self._report_item(progress, index, items, False, started, str(ex))
+                    self._fail_dynamic_step(step, ex, step_start_time)
+                    raise
+        finally:
+            if progress:
+                progress.close()
+
+        return all_success
+
+    def _run_iterations_parallel(self, action, step, items: list, workers: int, step_start_time: float) -> bool:
+        """Run params_list items on a bounded worker pool.
+
+        Items are dispatched in a sliding window: a new item is submitted only
+        while fewer than the current limit are in flight. The limit is fixed at
+        `workers`, or driven by AdaptiveConcurrency (with `workers` as upper
+        bound) when adaptive concurrency is enabled.
+
+        Results are reported from the calling thread in completion order, so
+        Display output is never interleaved between workers. An exception in
+        any item stops dispatching further items and is re-raised once the
+        in-flight items finished and were reported, matching the sequential
+        behaviour.
+        """
+        controller = self._start_controller(step, len(items), workers)
+        progress = self._progress(step, len(items))
+
+        all_success = True
+        next_index = 0
+        in_flight = {}
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"step-{step.name}") as pool:
+                while next_index < len(items) or in_flight:
+                    limit = controller.limit if controller else workers
+                    while next_index < len(items) and len(in_flight) < limit:
+                        # bound per item: a context can only be entered by one thread at a time
+                        execute = tracing.bind(self._execute_iteration)
+                        future = pool.submit(execute, action, step, next_index, len(items), items[next_index])
+                        in_flight[future] = (next_index, time.perf_counter())
+                        next_index += 1
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index, started = in_flight.pop(future)
+                        try:
+                            response = future.result()
+                        except Exception as ex:
+                            self._report_item(progress, index, items, False, started, str(ex))
+                            next_index = len(items)
+                            wait(in_flight)
+                            self._report_drained(progress, items, in_flight)
+                            self._fail_dynamic_step(step, ex, step_start_time)
+                            raise
+
+                        self._report_item(progress, index, items, response.success, started, response.message)
+                        if not response.success:
+                            all_success = False
+                            log.error("PipelineExecutor", f"Iteration {index + 1} failed: {response.message}")
+        finally:
+            self._stop_controller(step, controller)
+            if progress:
+                progress.close()
+
+        return all_success
+
+    def _run_iterations_async(self, action, step, items: list, workers: int, step_start_time: float) -> bool:
+        """Run params_list items as coroutines on a single event loop.
+
+        Same sliding window, reporting and failure semantics as
+        _run_iterations_parallel, but an in-flight item costs a coroutine
+        instead of a thread, so `workers` can be in the thousands. Actions
+        send requests through an AsyncQuayGateway whose connection pool is
+        sized to `workers`; actions without a native execute_async fall
+        back to the loop's default thread pool, which is sized to `workers`
+        as well (threads are only started if such an action runs).
+        """
+        return asyncio.run(self._iterate_async(action, step, items, workers, step_start_time))
+
+    async def _iterate_async(self, action, step, items: list, workers: int, step_start_time: float) -> bool:
+        # aiohttp is only imported when a step actually runs on the event loop
+        from quay.async_quay_gateway import AsyncQuayGateway
+        make_client = getattr(self.gateway, "async_client", None)
+        if make_client is None:
+            from gateway.async_client import AsyncApiClient
+            make_client = AsyncApiClient
+
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"step-{step.name}")
+        )
+        controller = self._start_controller(step, len(items), workers)
+        progress = self._progress(step, len(items))
+        all_success = True
+        next_index = 0
+        in_flight = {}
+        try:
+            async with make_client(limit=workers) as client:
+                action.async_gateway = AsyncQuayGateway(client)
+                while next_index < len(items) or in_flight:
+                    limit = controller.limit if controller else workers
+                    while next_index < len(items) and len(in_flight) < limit:
+                        task = asyncio.create_task(self._execute_iteration_async(
+                            action, step, next_index, len(items), items[next_index]
+                        ))
+                        in_flight[task] = (next_index, time.perf_counter())
+                        next_index += 1
+
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        index, started = in_flight.pop(task)
+                        try:
+                            response = task.result()
+                        except Exception as ex:
+                            self._report_item(progress, index, items, False, started, str(ex))
+                            next_index = len(items)
+                            if in_flight:
+                                await asyncio.wait(in_flight)
+                            self._report_drained(progress, items, in_flight)
+                            self._fail_dynamic_step(step, ex, step_start_time)
+                            raise
+
+                        self._report_item(progress, index, items, response.success, started, response.message)
+                        if not response.success:
+                            all_success = False
+                            log.error("PipelineExecutor", f"Iteration {index + 1} failed: {response.message}")
+        finally:
+            action.async_gateway = None
+            self._stop_controller(step, controller)
+            if progress:
+                progress.close()
+
+        return all_success
+
+    def _start_controller(self, step, count: int, workers: int):
+        """Subscribe an AdaptiveConcurrency for the step when adaptive mode is on."""
+        controller = None
+        if self.cfg.adaptive:
+            controller = AdaptiveConcurrency(max_limit=workers)
+            RequestStats().subscribe(controller.on_request)
+
+        if self.cfg.debug:
+            mode = "adaptive" if controller else "fixed"
+            io = "async" if self.cfg.async_io else "threaded"
+            log.debug("PipelineExecutor", "[%s] Running %s items, %s %s max_parallel=%s",
+                      step.name, count, io, mode, workers)
+        return controller
+
+    def _stop_controller(self, step, controller) -> None:
+        if controller:
+            RequestStats().unsubscribe(controller.on_request)
+            self.stats.concurrency[step.name] = list(controller.history)
@@ -0,0 +1,187 @@
+"""Plan mode: snapshot Quay state and keep only the items that would change it."""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from quay.existence_cache import ExistenceCache
+from quay.prototype_index import PrototypeIndex
+from quay.snapshot_file import read_snapshot
+from quay.state_snapshot import OrganizationState, StateSnapshot
+from utils.logger import Logger as log
+
+# Snapshot parts needed to diff each supported job
+PLANNED_JOBS = {
+    "create_organization": set(),
+    "create_robot_account": {"robots"},
+    "create_team": set(),
+    "add_team_member": {"members"},
+    "reconcile_team_members": {"members"},
+    "set_default_repository_permission": {"prototypes"},
+    "sync_team_ldap": {"sync"},
+}
+
+TEAM_JOBS = {"create_team", "add_team_member", "reconcile_team_members", "sync_team_ldap"}
+
+
+def organization_of(job: str, item) -> Optional[str]:
+    """Organization an item of `job` belongs to (create_organization items are keyed by name)."""
+    if not isinstance(item, dict):
+        return None
+    if job == "create_organization":
+        return item.get("name")
+    return item.get("organization")
+
+
+@dataclass
+class StepPlan:
+    """Items of one step that still have to be applied."""
+    name: str
+    job: str
+    total: int
+    pending: list
+    planned: bool = True
+
+    @property
+    def in_sync(self) -> int:
+        return self.total - len(self.pending)
+
+
+class PipelinePlanner:
+    """Three-phase planner: snapshot current state, diff it against the
+    pipeline inputs, and hand the executor only the missing operations.
+
+    Jobs without a diff rule (deletes, lookups, ...) are passed through
+    unchanged, and any item whose organization could not be snapshotted is
+    treated as pending, so plan mode never skips work it cannot prove done.
+    """
+
+    def __init__(self, gateway, max_workers: int = 1, snapshot_file: Optional[Path] = None):
+        self.gateway = gateway
+        self.max_workers = max_workers
+        # Offline planning: diff against a file written by export_snapshot.py
+        self.snapshot_file = snapshot_file
+
+    @staticmethod
+    def step_items(step, inputs: dict) -> list:
+        if step.params_list:
+            key = step.params_list.replace("{{ ", "").replace(" }}", "")
+            items = inputs.get(key, [])
+            return items if isinstance(items, list) else []
+        return [step.params or {}]
+
+    def plan(self, steps, inputs: dict) -> Dict[str, StepPlan]:
+        # --- PHASE 1: SNAPSHOT ---
+        organizations: Dict[str, set] = {}
+        parts = set()
+        for step in steps:
+            if step.job not in PLANNED_JOBS:
+                continue
+            parts |= PLANNED_JOBS[step.job]
+            for item in self.step_items(step, inputs):
+                org = organization_of(step.job, item)
+                if not org:
+                    continue
+                teams = organizations.setdefault(org, set())
+                if step.job in TEAM_JOBS and item.get("team_name"):
+                    teams.add(item["team_name"])
+
+        if self.snapshot_file:
+            log.info("PipelinePlanner", f"Reading snapshot {self.snapshot_file}")
+            snapshot = read_snapshot(self.snapshot_file)
+            states = {org: snapshot[org] for org in organizations if org in snapshot}
+        else:
+            log.info("PipelinePlanner", f"Snapshotting {len(organizations)} organizations")
+            states = StateSnapshot(self.gateway, self.max_workers).fetch(organizations, parts)
+        self._prime_existence_cache(states)
+        self._prime_prototype_index(states)
+
+        # --- PHASE 2: DIFF ---
+        plans = {}
+        for step in steps:
+            items = self.step_items(step, inputs)
+            if step.job not in PLANNED_JOBS:
+                plans[step.name] = StepPlan(step.name, step.job, len(items), list(items), planned=False)
+                continue
+            pending = [item for item in items if not self._is_applied(step.job, item, states)]
+            plans[step.name] = StepPlan(step.name, step.job, len(items), pending)
+            log.debug("PipelinePlanner", "[%s] %s/%s items pending", step.name, len(pending), len(items))
+
+        return plans
+
+    @staticmethod
+    def _prime_existence_cache(states: Dict[str, OrganizationState]) -> None:
+        cache = ExistenceCache()
+        for org, state in states.items():
+            cache.set(ExistenceCache.organization_key(org), state.exists)
+            for team, team_state in state.teams.items():
+                cache.set(ExistenceCache.team_key(org, team), team_state is not None)
+
+    @staticmethod
+    def _prime_prototype_index(states: Dict[str, OrganizationState]) -> None:
+        index = PrototypeIndex()
+        for org, state in states.items():
+            if state.prototypes is not None:
+                index.prime(org, state.prototypes)
+
+    def _is_applied(self, job: str, item, states: Dict[str, OrganizationState]) -> bool:
+        """True only if the snapshot proves the item needs no change."""
+        org = organization_of(job, item)
+        state = states.get(org) if org else None
+        if state is None:
+            return False
+
+        if job == "create_organization":
+            return state.exists
+
+        if not state.exists:
+            return False
+
+        if job == "create_robot_account":
+            robot = item.get("robot_shortname")
+            return state.robots is not None and f"{org}+{robot}" in state.robots
+
+        if job == "set_default_repository_permission":
+            return self._has_prototype(state.prototypes, item)
+
+        team = state.teams.get(item.get("team_name"))
+        if team is None:
+            return False
+
+        if job == "create_team":
+            # The snapshot does not carry team descriptions, so one in the item can't be proven applied
+            if item.get("description"):
+                return False
+            return team.role is not None and team.role == item.get("role", "member")
+
+        if job == "add_team_member":
+            return team.members is not None and item.get("member_name") in team.members
+
+        if job == "reconcile_team_members":
+            if team.members is None or not isinstance(item.get("members"), list):
+                return False
+            desired = set(item["members"])
+            if item.get("remove_unlisted", True):
+                return desired == team.members
+            return desired <= team.members
+
+        if job == "sync_team_ldap":
+            return team.sync_group_dn is not None and team.sync_group_dn == item.get("group_dn")
+
+        return False
+
+    @staticmethod
+    def _has_prototype(prototypes: Optional[List[dict]], item: dict) -> bool:
+        delegate = item.get("delegate")
+        if prototypes is None or not isinstance(delegate, dict):
+            return False
+        role = item.get("role", "read")
+        for entry in prototypes:
+            existing = entry.get("delegate", {})
+            activating_user = (entry.get("activating_user") or {}).get("name")
+            if (existing.get("name") == delegate.get("name")
+                    and existing.get("kind") == delegate.get("kind")
+                    and entry.get("role") == role
+                    and activating_user == (item.get("activating_user") or None)):
+                return True
+        return False
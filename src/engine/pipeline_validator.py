@@ -1,4 +1,5 @@
 from engine.action_registry import ACTION_REGISTRY
+from engine.step_graph import find_cycle, step_dependencies, uses_dependencies
 from utils.logger import Logger as log
 
 
@@ -8,15 +9,52 @@ class PipelineValidator:
         log.debug("PipelineValidator", "Validating jobs in pipeline")
         log.info("PipelineValidator", f"Starting job validation for {len(pipeline.pipeline)} steps")
         for step in pipeline.pipeline:
-            log.debug("PipelineValidator", f"Checking job '{step.job}' for step '{step.name}'")
+            log.debug("PipelineValidator", "Checking job '%s' for step '%s'", step.job, step.name)
             if step.job not in ACTION_REGISTRY:
                 allowed = ", ".join(ACTION_REGISTRY.keys())
 
                 log.error("PipelineValidator", f"Invalid job '{step.job}' in step '{step.name}'")
                 log.info("PipelineValidator", f"Allowed jobs: {allowed}")
-                log.debug("PipelineValidator", f"Validation failed for step '{step.name}' with job '{step.job}'")
+                log.debug("PipelineValidator", "Validation failed for step '%s' with job '%s'", step.name, step.job)
 
                 raise ValueError(
                     f"Invalid job '{step.job}' in step '{step.name}'. Allowed jobs: {allowed}"
                 )
+
+            if step.enabled:
+                # Import the action now so a broken module fails validation, not the run
+                ACTION_REGISTRY[step.job]
+
+            if step.max_parallel is not None and step.max_parallel < 1:
+                log.error("PipelineValidator", f"Invalid max_parallel={step.max_parallel} in step '{step.name}'")
+                raise ValueError(
+                    f"Invalid max_parallel '{step.max_parallel}' in step '{step.name}'. Must be at least 1"
+                )
         log.info("PipelineValidator", "Job validation completed successfully")
+
+    def validate_dependencies(self, pipeline):
+        """Check `depends_on` references and reject dependency cycles."""
+        steps = pipeline.pipeline
+        if not uses_dependencies(steps):
+            return
+
+        log.debug("PipelineValidator", "Validating step dependencies")
+        names = [step.name for step in steps]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            log.error("PipelineValidator", f"Duplicate step names: {', '.join(duplicates)}")
+            raise ValueError(
+                f"Step names must be unique when depends_on is used. Duplicates: {', '.join(duplicates)}"
+            )
+
+        for step in steps:
+            for dependency in step.depends_on or []:
+                if dependency not in names:
+                    log.error("PipelineValidator", f"Unknown dependency '{dependency}' in step '{step.name}'")
+                    raise ValueError(f"Step '{step.name}' depends on unknown step '{dependency}'")
+
+        cycle = find_cycle(step_dependencies(steps))
+        if cycle:
+            log.error("PipelineValidator", f"Dependency cycle: {' -> '.join(cycle)}")
+            raise ValueError(f"Dependency cycle between steps: {' -> '.join(cycle)}")
+        log.info("PipelineValidator", "Dependency validation completed successfully")
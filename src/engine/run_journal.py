@@ -0,0 +1,97 @@
+"""Append-only checkpoint journal of completed pipeline items."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Set, Tuple
+
+from utils.logger import Logger as log
+
+SYNC_INTERVAL = 1.0  # seconds; fsync at least this often while entries are pending
+
+
+def item_hash(job: str, item: Any) -> str:
+    """Stable short hash of a step input (job plus canonical JSON of the item)."""
+    payload = json.dumps({"job": job, "item": item}, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+class RunJournal:
+    """Journal of (step, item hash, outcome) entries, one compact JSON array per line.
+
+    Writes are buffered and fsync'ed in batches: every `sync_every` entries
+    or SYNC_INTERVAL seconds, and on close. A crash can therefore lose the
+    last batch, which only means those items are applied again on resume;
+    every action is idempotent. A torn last line is ignored when loading.
+
+    Without `resume` the journal is truncated, so a fresh run starts a fresh
+    journal. With `resume` the existing entries are loaded and successful
+    (step, hash) pairs are reported as completed. A run that finishes
+    without failures deletes the journal on close, so the next run (resumed
+    or not) applies every item again.
+    """
+
+    def __init__(self, path: Path, resume: bool = False, sync_every: int = 50):
+        self.path = Path(path)
+        self.sync_every = max(1, sync_every)
+        self._completed: Set[Tuple[str, str]] = set()
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and self.path.exists():
+            self._load()
+            log.info("RunJournal", f"Resuming with {len(self._completed)} completed items from {self.path}")
+        self._file = open(self.path, "a" if resume else "w", encoding="utf-8")
+        if resume and self._file.tell() and not self._ends_with_newline():
+            self._file.write("\n")  # terminate a torn last line before appending
+
+    def _load(self) -> None:
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    step, digest, success = json.loads(line)
+                except (ValueError, TypeError):
+                    log.debug("RunJournal", "Ignoring unreadable journal line: %s", line.strip()[:80])
+                    continue
+                if success:
+                    self._completed.add((step, digest))
+                else:
+                    self._completed.discard((step, digest))
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def completed(self, step: str, digest: str) -> bool:
+        return (step, digest) in self._completed
+
+    def record(self, step: str, digest: str, success: bool) -> None:
+        line = json.dumps([step, digest, 1 if success else 0], separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._pending += 1
+            if self._pending >= self.sync_every or time.monotonic() - self._last_sync >= SYNC_INTERVAL:
+                self._sync()
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self, finished: bool = False) -> None:
+        """Flush and close; `finished` (the run had no failures) also deletes the journal."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._sync()
+            self._file.close()
+            if finished:
+                self.path.unlink(missing_ok=True)
+                log.info("RunJournal", f"Run finished, removed journal {self.path}")
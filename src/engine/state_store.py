@@ -0,0 +1,86 @@
+"""SQLite record of params items applied successfully, kept across runs."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Set, Tuple
+
+from utils.logger import Logger as log
+
+FLUSH_EVERY = 500  # buffered outcomes written per transaction
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applied (
+    step TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    applied_at REAL NOT NULL,
+    PRIMARY KEY (step, hash)
+) WITHOUT ROWID
+"""
+
+
+class AppliedStateStore:
+    """Applied (step, item hash) pairs, used to run only new or changed items.
+
+    The whole table is read into memory when the store is opened, so
+    lookups do not touch the database. Outcomes are buffered and written
+    in one transaction per FLUSH_EVERY entries and on close; a success
+    upserts the pair and a failure deletes it, so a failed item runs again
+    next time. `reset()` empties the table for a full reconcile, which then
+    records everything it applies again.
+
+    The store only knows what this tool applied. Changes made directly in
+    Quay are not detected until the next full reconcile.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, str, bool]] = []
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(SCHEMA)
+        self._conn.commit()
+        self._applied: Set[Tuple[str, str]] = set(self._conn.execute("SELECT step, hash FROM applied"))
+        log.info("AppliedStateStore", f"Loaded {len(self._applied)} applied items from {self.path}")
+
+    def applied(self, step: str, digest: str) -> bool:
+        return (step, digest) in self._applied
+
+    def reset(self) -> None:
+        """Forget every applied item (full reconcile)."""
+        with self._lock:
+            self._pending = []
+            self._applied = set()
+            with self._conn:
+                self._conn.execute("DELETE FROM applied")
+        log.info("AppliedStateStore", "Cleared applied state for a full reconcile")
+
+    def record(self, step: str, digest: str, success: bool) -> None:
+        with self._lock:
+            self._pending.append((step, digest, success))
+            if len(self._pending) >= FLUSH_EVERY:
+                self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        now = time.time()
+        with self._conn:
+            for step, digest, success in self._pending:
+                if success:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO applied (step, hash, applied_at) VALUES (?, ?, ?)",
+                        (step, digest, now)
+                    )
+                else:
+                    self._conn.execute("DELETE FROM applied WHERE step = ? AND hash = ?", (step, digest))
+        self._pending = []
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            self._conn.close()
@@ -0,0 +1,70 @@
+"""Step dependency graph shared by PipelineValidator and PipelineExecutor."""
+
+from typing import Dict, List, Optional
+
+
+def uses_dependencies(steps) -> bool:
+    """True if any step declares `depends_on` (the pipeline then runs as a DAG)."""
+    return any(step.depends_on is not None for step in steps)
+
+
+def step_dependencies(steps) -> Dict[str, List[str]]:
+    """Map each step name to the names of the steps it waits for.
+
+    A step with `depends_on` waits for exactly those steps (`[]` = none).
+    A step without it keeps the sequential behaviour and waits for the step
+    before it in the file, so pipelines without `depends_on` form a chain.
+    """
+    dependencies = {}
+    previous = None
+    for step in steps:
+        if step.depends_on is not None:
+            dependencies[step.name] = list(step.depends_on)
+        else:
+            dependencies[step.name] = [previous] if previous else []
+        previous = step.name
+    return dependencies
+
+
+def find_cycle(dependencies: Dict[str, List[str]]) -> Optional[List[str]]:
+    """Return one dependency cycle as a list of step names, or None."""
+    visiting, done = set(), set()
+    path: List[str] = []
+
+    def visit(name: str) -> Optional[List[str]]:
+        visiting.add(name)
+        path.append(name)
+        for dependency in dependencies.get(name, []):
+            if dependency in visiting:
+                return path[path.index(dependency):] + [dependency]
+            if dependency not in done:
+                cycle = visit(dependency)
+                if cycle:
+                    return cycle
+        visiting.discard(name)
+        done.add(name)
+        path.pop()
+        return None
+
+    for name in dependencies:
+        if name not in done:
+            cycle = visit(name)
+            if cycle:
+                return cycle
+    return None
+
+
+def topological_order(steps) -> list:
+    """Steps ordered so every step comes after its dependencies, keeping file order otherwise."""
+    dependencies = step_dependencies(steps)
+    ordered, placed = [], set()
+    remaining = list(steps)
+    while remaining:
+        ready = [s for s in remaining if all(d in placed for d in dependencies[s.name])]
+        if not ready:
+            raise ValueError(f"Dependency cycle between steps: {find_cycle(dependencies)}")
+        step = ready[0]
+        ordered.append(step)
+        placed.add(step.name)
+        remaining.remove(step)
+    return ordered
@@ -6,6 +6,9 @@ from exceptions import ConfigurationError
 from model.pipeline_model import PipelineDefinition
 from utils.logger import Logger as log
 
+# libyaml (when PyYAML was built with it) parses large inputs files ~8x faster, same results
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class PipelineReader:
 
@@ -15,15 +18,15 @@ class PipelineReader:
             raise ConfigurationError(f"Pipeline file not found: {file_path}")
 
         try:
-            data = yaml.safe_load(path.read_text())
+            data = yaml.load(path.read_text(), Loader=_YAML_LOADER)
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Invalid YAML in pipeline file: {e}") from e
 
         if not data:
             raise ConfigurationError(f"Pipeline file is empty: {file_path}")
 
-        log.debug("PipelineReader", f"load_pipeline file={file_path}")
-        log.debug("PipelineReader", f"load_pipeline content={data}")
+        log.debug("PipelineReader", "load_pipeline file=%s", file_path)
+        log.debug("PipelineReader", "load_pipeline content=%s", data)
         return PipelineDefinition(**data)
 
     def load_inputs(self, file_path: str) -> dict:
@@ -32,12 +35,12 @@ class PipelineReader:
             raise ConfigurationError(f"Inputs file not found: {file_path}")
 
         try:
-            data = yaml.safe_load(path.read_text())
+            data = yaml.load(path.read_text(), Loader=_YAML_LOADER)
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Invalid YAML in inputs file: {e}") from e
 
-        log.debug("PipelineReader", f"load_inputs file={file_path}")
-        log.debug("PipelineReader", f"load_inputs content={data}")
+        log.debug("PipelineReader", "load_inputs file=%s", file_path)
+        log.debug("PipelineReader", "load_inputs content=%s", data)
         return data or {}
 
     def resolve_templates(self, pipeline: PipelineDefinition, inputs: dict):
@@ -47,7 +50,7 @@ class PipelineReader:
             if not step.params:
                 continue
 
-            log.debug("PipelineReader", f"Resolving templates for step={step.name}")
+            log.debug("PipelineReader", "Resolving templates for step=%s", step.name)
 
             for key, value in list(step.params.items()):
                 if not isinstance(value, str):
@@ -59,15 +62,16 @@ class PipelineReader:
                     resolved = inputs.get(param_key)
                     log.debug(
                         "PipelineReader",
-                        f"Template match: step={step.name} key={key} raw='{value}' "
-                        f"resolved_key='{param_key}' resolved_value={resolved}"
+                        "Template match: step=%s key=%s raw='%s' resolved_key='%s' resolved_value=%s",
+                        step.name, key, value, param_key, resolved
                     )
 
                     step.params[key] = resolved
                 else:
                     log.debug(
                         "PipelineReader",
-                        f"No template: step={step.name} key={key} value={value}"
+                        "No template: step=%s key=%s value=%s",
+                        step.name, key, value
                     )
 
         log.debug("PipelineReader", "Template resolution completed")
@@ -0,0 +1,85 @@
+import argparse
+import sys
+import time
+
+from config.loader import Config
+from quay.quay_gateway import QuayGateway
+from quay.snapshot_file import FORMATS, snapshot_format, write_snapshot
+from quay.state_snapshot import SNAPSHOT_PARTS, StateSnapshot, unwrap_list
+from utils.display import Display
+from utils.logger import Logger as log
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Export the state of Quay organizations (robots, teams with members, "
+                    "prototypes, team sync status) to a snapshot file"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        default="snapshot.jsonl",
+        help="snapshot file to write (default: snapshot.jsonl)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        help="output format (default: msgpack for .msgpack/.mpk files, otherwise jsonl)"
+    )
+    parser.add_argument(
+        "--org",
+        action="append",
+        dest="organizations",
+        metavar="NAME",
+        help="organization to export, repeatable (default: every organization listed by the API)"
+    )
+    parser.add_argument(
+        "--parts",
+        default=",".join(sorted(SNAPSHOT_PARTS)),
+        help=f"comma-separated parts to fetch (default: {','.join(sorted(SNAPSHOT_PARTS))})"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="organizations crawled concurrently (default: MAX_PARALLEL)"
+    )
+    return parser.parse_args(argv)
+
+
+def list_organization_names(gateway) -> list:
+    organizations = unwrap_list(gateway.list_organizations(), "organizations")
+    return sorted(o.get("name") if isinstance(o, dict) else o for o in organizations)
+
+
+def main():
+    args = parse_args()
+    config = Config()
+
+    parts = {p.strip() for p in args.parts.split(",") if p.strip()}
+    unknown = parts - SNAPSHOT_PARTS
+    if unknown:
+        log.error("ExportSnapshot", f"Unknown snapshot parts: {', '.join(sorted(unknown))}")
+        sys.exit(2)
+
+    Display.banner(config.version, config.debug)
+    started = time.time()
+    gateway = QuayGateway()
+
+    try:
+        names = args.organizations or list_organization_names(gateway)
+        workers = args.workers or config.max_parallel
+        log.info("ExportSnapshot", f"Snapshotting {len(names)} organizations with {workers} workers")
+
+        states = StateSnapshot(gateway, workers).fetch({name: None for name in names}, parts)
+        fmt = args.format or snapshot_format(args.output)
+        size = write_snapshot(states, args.output, fmt, parts, source=config.base_url)
+    except Exception as e:
+        log.error("ExportSnapshot", f"Snapshot export failed: {e}")
+        sys.exit(1)
+
+    Display.snapshot_written(args.output, fmt, len(states), len(names), size, time.time() - started)
+    if len(states) < len(names):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
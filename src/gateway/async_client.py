@@ -0,0 +1,174 @@
+"""asyncio counterpart of ApiClient for driving many requests from one event loop."""
+
+import asyncio
+import ssl
+import time
+from typing import Any, Optional, Union
+
+import aiohttp
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from gateway.client import DEFAULT_POOL_SIZE, RETRY_STATUS_CODES, ApiClient
+from gateway.endpoint_template import endpoint_template
+from gateway.redirect_cache import PERMANENT_REDIRECTS, RedirectCache
+from gateway.request_stats import RequestStats
+from utils import tracing
+from utils.logger import Logger as log
+
+
+def _to_response(resp: aiohttp.ClientResponse, body: bytes) -> requests.Response:
+    """Copy an aiohttp response into a requests.Response.
+
+    Callers inspect `e.response.text` on HTTP errors, so both clients raise
+    the same requests exceptions carrying the same response type.
+    """
+    response = requests.Response()
+    response.status_code = resp.status
+    response.headers = CaseInsensitiveDict(resp.headers)
+    response._content = body
+    response.url = str(resp.url)
+    response.reason = resp.reason
+    response.encoding = resp.charset
+    return response
+
+
+class AsyncApiClient(ApiClient):
+    """aiohttp-based ApiClient for a single event loop.
+
+    Configuration, auth headers, TLS options, redirect fixing, retry policy,
+    the process-wide rate limiter and response handling (404 on GET -> None,
+    empty body -> {}, non-JSON wrapping) are inherited from ApiClient; only
+    the transport is asynchronous. The aiohttp session is bound to the loop
+    that first uses it, so create the client inside that loop and close it
+    with `await client.close()` or `async with AsyncApiClient() as client`.
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        super().__init__()
+        self.limit = limit or max(DEFAULT_POOL_SIZE, self.cfg.max_parallel)
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def aio_session(self) -> aiohttp.ClientSession:
+        """Get or create the aiohttp session, with at most `limit` open connections."""
+        if self._aio_session is None:
+            connector = aiohttp.TCPConnector(limit=self.limit, ssl=self._ssl_context())
+            self._aio_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            log.debug("AsyncApiClient", "Created session with connection limit=%s", self.limit)
+        return self._aio_session
+
+    def _ssl_context(self) -> Union[bool, ssl.SSLContext]:
+        """Map ApiClient.verify onto aiohttp's ssl argument."""
+        if self.verify is False:
+            return False
+        if isinstance(self.verify, str):
+            return ssl.create_default_context(cafile=self.verify)
+        return True
+
+    async def close(self) -> None:
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Any:
+        url = self._prepare(method, endpoint, kwargs.get("json"))
+        template = endpoint_template(endpoint)
+        with tracing.span(f"{method} {template}", **{"http.method": method, "http.route": template}) as span:
+            attempt = 0
+            while True:
+                attempt += 1
+                retryable = self._can_retry(method, attempt)
+                started = time.monotonic()
+                try:
+                    response = await self._send(method, url, template, **kwargs)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    RequestStats().observe(method, template, None, time.monotonic() - started)
+                    if retryable:
+                        await asyncio.sleep(
+                            self._retry_delay(method, url, template, attempt, reason=type(e).__name__)
+                        )
+                        continue
+                    if isinstance(e, requests.Timeout):
+                        log.error("AsyncApiClient", f"Request timeout when calling {url}: {e}")
+                    else:
+                        log.error("AsyncApiClient", f"Connection refused when calling {url}: {e}")
+                    raise e
+                except requests.RequestException as e:
+                    RequestStats().observe(method, template, None, time.monotonic() - started)
+                    log.error("AsyncApiClient", f"Unexpected request error: {e}")
+                    raise e
+
+                RequestStats().observe(
+                    method, template, response.status_code, time.monotonic() - started, len(response.content)
+                )
+                if response.status_code in RETRY_STATUS_CODES and retryable:
+                    await asyncio.sleep(self._retry_delay(
+                        method, url, template, attempt,
+                        reason=f"HTTP {response.status_code}",
+                        retry_after=response.headers.get("Retry-After")
+                    ))
+                    continue
+                break
+
+            span.set("http.status_code", response.status_code)
+            span.set("http.attempts", attempt)
+            return self._handle_response(method, url, response)
+
+    async def _send(self, method: str, url: str, template: str, **kwargs) -> requests.Response:
+        """Send one request, following a single 3xx redirect manually (remembering permanent ones)."""
+        redirects = RedirectCache()
+        target = redirects.resolve(method, template, url)
+        response = await self._fetch(method, target, allow_redirects=False, **kwargs)
+
+        if response.status_code in (301, 302, 307, 308) and "Location" in response.headers:
+            redirect_url = self._redirect_url(response.headers["Location"])
+            if response.status_code in PERMANENT_REDIRECTS:
+                redirects.learn(method, template, url, redirect_url)
+            # Preserve original request body and other kwargs for the redirect
+            response = await self._fetch(method, redirect_url, allow_redirects=True, **kwargs)
+
+        return response
+
+    async def _fetch(self, method: str, url: str, allow_redirects: bool, **kwargs) -> requests.Response:
+        """One HTTP exchange; aiohttp errors are raised as their requests equivalents."""
+        delay = self.limiter.reserve(method)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            async with self.aio_session.request(
+                method,
+                url,
+                headers=self.headers,
+                allow_redirects=allow_redirects,
+                **kwargs
+            ) as resp:
+                body = await resp.read()
+                return _to_response(resp, body)
+        except asyncio.TimeoutError as e:
+            raise requests.Timeout(f"Timed out after {self.timeout}s") from e
+        except aiohttp.ClientConnectionError as e:
+            raise requests.ConnectionError(str(e)) from e
+        except aiohttp.ClientError as e:
+            raise requests.RequestException(str(e)) from e
+
+    async def get(self, endpoint, **kwargs):
+        return await self._request("GET", endpoint, **kwargs)
+
+    async def post(self, endpoint, **kwargs):
+        return await self._request("POST", endpoint, **kwargs)
+
+    async def put(self, endpoint, **kwargs):
+        return await self._request("PUT", endpoint, **kwargs)
+
+    async def delete(self, endpoint, **kwargs):
+        return await self._request("DELETE", endpoint, **kwargs)
@@ -1,21 +1,73 @@
+import json
 import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
 from typing import Any, Dict, Optional
+from urllib.parse import urlparse, urlunparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # optional, several times faster on large list responses
+except ImportError:
+    orjson = None
 
 from config.loader import Config
+from gateway.endpoint_template import endpoint_template
+from gateway.rate_limiter import RateLimiter
+from gateway.redirect_cache import PERMANENT_REDIRECTS, RedirectCache
+from gateway.request_stats import RequestStats
 from utils.display import Display
+from utils import tracing
 from utils.logger import Logger as log
 
 # Sensitive headers that should be masked in logs
 SENSITIVE_HEADERS = {"authorization", "x-api-key", "cookie", "set-cookie"}
 DEFAULT_TIMEOUT = 30  # seconds
+DEFAULT_POOL_SIZE = 10  # requests' own default per host
+
+# Retry policy: transient statuses, and methods that are safe to resend
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+def decode_json(body: bytes) -> Any:
+    """Parse a JSON response body straight from its bytes, with orjson when installed.
+
+    Bodies orjson rejects but json accepts (NaN, Infinity, UTF-16 or UTF-32
+    encoded) still decode; anything else raises ValueError.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(body)
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
 
 
 class ApiClient:
     """HTTP client with connection pooling, security features, and timeout support."""
 
     _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+    _pool_size: int = 0
+    _limiter: Optional[RateLimiter] = None
 
     def __init__(self):
         cfg = Config()
@@ -23,8 +75,8 @@ class ApiClient:
         self.timeout = int(os.getenv("API_TIMEOUT", DEFAULT_TIMEOUT))
         self.show_curl = os.getenv("SHOW_CURL", "false").lower() == "true" or cfg.debug
 
-        log.debug("ApiClient", f"base_url={cfg.base_url}")
-        log.debug("ApiClient", f"auth_type={cfg.auth_type}")
+        log.debug("ApiClient", "base_url=%s", cfg.base_url)
+        log.debug("ApiClient", "auth_type=%s", cfg.auth_type)
 
         self.base_url = cfg.base_url.rstrip("/")
         self.headers = {
@@ -48,17 +100,55 @@ class ApiClient:
             log.debug("ApiClient", "WARNING: TLS verification is disabled")
         elif ca_bundle:
             self.verify = ca_bundle
-            log.debug("ApiClient", f"Using custom CA bundle: {ca_bundle}")
+            log.debug("ApiClient", "Using custom CA bundle: %s", ca_bundle)
         else:
             self.verify = True  # Use system CA bundle
 
     @property
     def session(self) -> requests.Session:
-        """Get or create a session for connection pooling."""
+        """Get or create a session for connection pooling.
+
+        The session is shared by every ApiClient (and therefore every worker
+        thread), so creation is guarded by a lock and the connection pool is
+        sized to the configured parallelism instead of the requests default.
+        """
         if ApiClient._session is None:
-            ApiClient._session = requests.Session()
+            with ApiClient._session_lock:
+                if ApiClient._session is None:
+                    session = requests.Session()
+                    self._mount_pool(session, max(DEFAULT_POOL_SIZE, self.cfg.max_parallel))
+                    ApiClient._session = session
         return ApiClient._session
 
+    @property
+    def limiter(self) -> RateLimiter:
+        """Get or create the process-wide rate limiter shared by all clients and threads."""
+        if ApiClient._limiter is None:
+            with ApiClient._session_lock:
+                if ApiClient._limiter is None:
+                    ApiClient._limiter = RateLimiter(
+                        rate=self.cfg.rate_limit_rps,
+                        burst=self.cfg.rate_limit_burst,
+                        read_rate=self.cfg.rate_limit_read_rps,
+                        write_rate=self.cfg.rate_limit_write_rps,
+                    )
+        return ApiClient._limiter
+
+    def ensure_pool_size(self, size: int) -> None:
+        """Grow the shared connection pool so `size` workers never wait for a connection."""
+        session = self.session
+        with ApiClient._session_lock:
+            if size > ApiClient._pool_size:
+                self._mount_pool(session, size)
+
+    @staticmethod
+    def _mount_pool(session: requests.Session, size: int) -> None:
+        adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        ApiClient._pool_size = size
+        log.debug("ApiClient", "Mounted connection pool with pool_size=%s", size)
+
     def _mask_sensitive_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
         """Mask sensitive header values for safe logging."""
         masked = {}
@@ -69,10 +159,10 @@ class ApiClient:
                 masked[key] = value
         return masked
 
-    def _request(self, method: str, endpoint: str, **kwargs) -> Any:
+    def _prepare(self, method: str, endpoint: str, body: Any = None) -> str:
+        """Build the URL for endpoint and report the call; returns the URL."""
         endpoint = endpoint.strip("/")
         url = f"{self.base_url}/{endpoint}"
-        body = kwargs.get("json")
 
         # Show API call with optional CURL command
         if self.show_curl:
@@ -85,58 +175,53 @@ class ApiClient:
                 body=body
             )
 
-        log.debug("ApiClient", f"Calling {method} {url}")
+        log.debug("ApiClient", "Calling %s %s", method, url)
+        return url
 
-        try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                verify=self.verify,
-                allow_redirects=False,
-                timeout=self.timeout,
-                **kwargs
-            )
-        except requests.ConnectionError as e:
-            log.error("ApiClient", f"Connection refused when calling {url}: {e}")
-            raise e
-        except requests.Timeout as e:
-            log.error("ApiClient", f"Request timeout when calling {url}: {e}")
-            raise e
-        except requests.RequestException as e:
-            log.error("ApiClient", f"Unexpected request error: {e}")
-            raise e
+    def _request(self, method: str, endpoint: str, **kwargs) -> Any:
+        url = self._prepare(method, endpoint, kwargs.get("json"))
+        template = endpoint_template(endpoint)
+        with tracing.span(f"{method} {template}", **{"http.method": method, "http.route": template}) as span:
+            attempt = 0
+            while True:
+                attempt += 1
+                retryable = self._can_retry(method, attempt)
+                started = time.monotonic()
+                try:
+                    response = self._send(method, url, template, **kwargs)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    RequestStats().observe(method, template, None, time.monotonic() - started)
+                    if retryable:
+                        self._wait_before_retry(method, url, template, attempt, reason=type(e).__name__)
+                        continue
+                    if isinstance(e, requests.Timeout):
+                        log.error("ApiClient", f"Request timeout when calling {url}: {e}")
+                    else:
+                        log.error("ApiClient", f"Connection refused when calling {url}: {e}")
+                    raise e
+                except requests.RequestException as e:
+                    RequestStats().observe(method, template, None, time.monotonic() - started)
+                    log.error("ApiClient", f"Unexpected request error: {e}")
+                    raise e
 
-        if response.status_code in (301, 302, 307, 308) and "Location" in response.headers:
-            redirect_url = response.headers["Location"]
-            # Fix redirect URL if it's missing the port
-            if redirect_url.startswith("http://127.0.0.1/") or redirect_url.startswith("http://localhost/"):
-                from urllib.parse import urlparse, urlunparse
-                parsed_base = urlparse(self.base_url)
-                parsed_redirect = urlparse(redirect_url)
-                # Replace host:port with our configured host:port
-                fixed_redirect = urlunparse((
-                    parsed_base.scheme,
-                    parsed_base.netloc,  # includes port
-                    parsed_redirect.path,
-                    parsed_redirect.params,
-                    parsed_redirect.query,
-                    parsed_redirect.fragment
-                ))
-                log.debug("ApiClient", f"Fixed redirect URL: {redirect_url} -> {fixed_redirect}")
-                redirect_url = fixed_redirect
-            else:
-                log.debug("ApiClient", f"Following redirect to: {redirect_url}")
-            # Preserve original request body and other kwargs for the redirect
-            response = self.session.request(
-                method=method,
-                url=redirect_url,
-                headers=self.headers,
-                verify=self.verify,
-                timeout=self.timeout,
-                **kwargs  # Pass original kwargs (includes json body)
-            )
+                RequestStats().observe(
+                    method, template, response.status_code, time.monotonic() - started, len(response.content)
+                )
+                if response.status_code in RETRY_STATUS_CODES and retryable:
+                    self._wait_before_retry(
+                        method, url, template, attempt,
+                        reason=f"HTTP {response.status_code}",
+                        retry_after=response.headers.get("Retry-After")
+                    )
+                    continue
+                break
 
+            span.set("http.status_code", response.status_code)
+            span.set("http.attempts", attempt)
+            return self._handle_response(method, url, response)
+
+    def _handle_response(self, method: str, url: str, response: requests.Response) -> Any:
+        """Turn a final response into the value returned to callers."""
         # Raise HTTP errors (4xx, 5xx)
         if response.status_code == 404 and method == "GET":
             return None
@@ -147,11 +232,13 @@ class ApiClient:
             log.error("ApiClient", f"HTTP {response.status_code} on {method} {url} body={response.text}")
             raise
 
-        if not response.text or not response.text.strip():
+        # One decode from the raw bytes: no text copy, no strip() copy, no second parse
+        body = response.content
+        if not body or body.isspace():
             return {}
 
         try:
-            return response.json()
+            return decode_json(body)
         except ValueError:
             log.debug("ApiClient", "Non-JSON response received")
             return {
@@ -160,6 +247,89 @@ class ApiClient:
                 "raw": response.text
             }
 
+    def _send(self, method: str, url: str, template: str, **kwargs) -> requests.Response:
+        """Send one request, following a single 3xx redirect manually.
+
+        Permanent redirects are remembered (RedirectCache), so later calls to
+        the same endpoint template skip the extra round trip.
+        """
+        redirects = RedirectCache()
+        self.limiter.acquire(method)
+        response = self.session.request(
+            method=method,
+            url=redirects.resolve(method, template, url),
+            headers=self.headers,
+            verify=self.verify,
+            allow_redirects=False,
+            timeout=self.timeout,
+            **kwargs
+        )
+
+        if response.status_code in (301, 302, 307, 308) and "Location" in response.headers:
+            redirect_url = self._redirect_url(response.headers["Location"])
+            if response.status_code in PERMANENT_REDIRECTS:
+                redirects.learn(method, template, url, redirect_url)
+            # Preserve original request body and other kwargs for the redirect
+            self.limiter.acquire(method)
+            response = self.session.request(
+                method=method,
+                url=redirect_url,
+                headers=self.headers,
+                verify=self.verify,
+                timeout=self.timeout,
+                **kwargs  # Pass original kwargs (includes json body)
+            )
+
+        return response
+
+    def _redirect_url(self, redirect_url: str) -> str:
+        """Return the redirect target, fixing local redirects that lost the port."""
+        if redirect_url.startswith("http://127.0.0.1/") or redirect_url.startswith("http://localhost/"):
+            parsed_base = urlparse(self.base_url)
+            parsed_redirect = urlparse(redirect_url)
+            # Replace host:port with our configured host:port
+            fixed_redirect = urlunparse((
+                parsed_base.scheme,
+                parsed_base.netloc,  # includes port
+                parsed_redirect.path,
+                parsed_redirect.params,
+                parsed_redirect.query,
+                parsed_redirect.fragment
+            ))
+            log.debug("ApiClient", "Fixed redirect URL: %s -> %s", redirect_url, fixed_redirect)
+            return fixed_redirect
+        log.debug("ApiClient", "Following redirect to: %s", redirect_url)
+        return redirect_url
+
+    def _can_retry(self, method: str, attempt: int) -> bool:
+        if attempt > self.cfg.retry_max:
+            return False
+        return self.cfg.retry_all_methods or method in IDEMPOTENT_METHODS
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Capped exponential backoff with full jitter; Retry-After wins when present."""
+        cap = self.cfg.retry_backoff_max
+        if retry_after:
+            seconds = _parse_retry_after(retry_after)
+            if seconds is not None:
+                return min(seconds, cap)
+        return random.uniform(0, min(cap, self.cfg.retry_backoff_base * (2 ** (attempt - 1))))
+
+    def _retry_delay(self, method: str, url: str, template: str, attempt: int,
+                     reason: str, retry_after: Optional[str] = None) -> float:
+        """Record a retry and return how long to wait before sending it."""
+        delay = self._backoff_delay(attempt, retry_after)
+        RequestStats().record_retry(method, template)
+        log.info(
+            "ApiClient",
+            f"{reason} on {method} {url}, retry {attempt}/{self.cfg.retry_max} in {delay:.2f}s"
+        )
+        return delay
+
+    def _wait_before_retry(self, method: str, url: str, template: str, attempt: int,
+                           reason: str, retry_after: Optional[str] = None) -> None:
+        time.sleep(self._retry_delay(method, url, template, attempt, reason, retry_after))
+
     def get(self, endpoint, **kwargs):
         return self._request("GET", endpoint, **kwargs)
 
@@ -0,0 +1,32 @@
+"""Collapse concrete API paths into endpoint templates for per-endpoint stats."""
+
+from functools import lru_cache
+
+# Placeholder names for the segment following a collection segment
+PARAM_NAMES = {
+    "organization": "org",
+    "team": "team",
+    "robots": "robot",
+    "members": "member",
+    "prototypes": "prototype",
+    "invite": "email",
+    "repositories": "repository",
+}
+
+
+@lru_cache(maxsize=1024)
+def endpoint_template(endpoint: str) -> str:
+    """Return the template of an endpoint, e.g.
+    ``organization/acme/team/dev/members`` -> ``/organization/{org}/team/{team}/members``.
+
+    Quay paths alternate between a collection name and an identifier, so
+    every odd segment is a path parameter.
+    """
+    segments = [s for s in endpoint.split("?", 1)[0].strip("/").split("/") if s]
+    template = []
+    for index, segment in enumerate(segments):
+        if index % 2 == 1:
+            template.append("{" + PARAM_NAMES.get(segments[index - 1], "id") + "}")
+        else:
+            template.append(segment)
+    return "/" + "/".join(template)
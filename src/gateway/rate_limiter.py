@@ -0,0 +1,67 @@
+"""Client-side token-bucket rate limiting shared by every request in the process."""
+
+import threading
+import time
+from typing import Optional
+
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Callers reserve a token and get back how long they must wait before
+    sending. Reservations may drive the balance negative, which queues later
+    callers behind earlier ones instead of letting them race for refills.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst and burst > 0 else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens and return the delay (seconds) until they are available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """Global request budget with optional separate read and write budgets.
+
+    A rate of 0 disables the corresponding bucket.
+    """
+
+    def __init__(self, rate: float = 0, burst: float = 0, read_rate: float = 0, write_rate: float = 0):
+        self.total = TokenBucket(rate, burst) if rate > 0 else None
+        self.read = TokenBucket(read_rate, burst) if read_rate > 0 else None
+        self.write = TokenBucket(write_rate, burst) if write_rate > 0 else None
+
+    @property
+    def enabled(self) -> bool:
+        return any((self.total, self.read, self.write))
+
+    def reserve(self, method: str) -> float:
+        """Reserve a slot for one request and return how long to wait before sending it."""
+        delay = 0.0
+        if self.total:
+            delay = self.total.reserve()
+        bucket = self.read if method.upper() in READ_METHODS else self.write
+        if bucket:
+            delay = max(delay, bucket.reserve())
+        return delay
+
+    def acquire(self, method: str) -> float:
+        """Block the calling thread until the request may be sent; returns the time waited."""
+        delay = self.reserve(method)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
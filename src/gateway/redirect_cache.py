@@ -0,0 +1,99 @@
+"""Run-scoped memory of permanent redirects, used by ApiClient and AsyncApiClient."""
+
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse, urlunparse
+
+PERMANENT_REDIRECTS = {301, 308}
+MAX_EXACT_REDIRECTS = 4096
+
+# (scheme, netloc, "append" | "strip" | "keep" the trailing slash of the path)
+Rule = Tuple[str, str, str]
+
+
+def _rule(url: str, final_url: str) -> Optional[Rule]:
+    """Describe a redirect that only moves host/port/scheme or the trailing slash; None otherwise."""
+    src, dst = urlparse(url), urlparse(final_url)
+    if src.query != dst.query:
+        return None
+    if dst.path == src.path:
+        op = "keep"
+    elif dst.path == src.path + "/":
+        op = "append"
+    elif src.path.endswith("/") and dst.path == src.path[:-1]:
+        op = "strip"
+    else:
+        return None
+    return dst.scheme, dst.netloc, op
+
+
+def _apply(rule: Rule, url: str) -> str:
+    scheme, netloc, op = rule
+    parsed = urlparse(url)
+    path = parsed.path
+    if op == "append" and not path.endswith("/"):
+        path += "/"
+    elif op == "strip":
+        path = path.rstrip("/")
+    return urlunparse((scheme, netloc, path, parsed.params, parsed.query, parsed.fragment))
+
+
+class RedirectCache:
+    """Singleton, thread-safe map of permanent redirects.
+
+    A redirect that only adds or drops the trailing slash, or moves the
+    request to another host/port (the localhost port fix-up), is kept as a
+    rule per "METHOD /endpoint/{template}" and applies to every URL of that
+    template. Any other redirect is kept for its exact URL. `avoided` counts
+    requests sent straight to the remembered target.
+    """
+
+    _instance: Optional["RedirectCache"] = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls) -> "RedirectCache":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._lock = threading.Lock()
+                    instance._rules: Dict[str, Rule] = {}
+                    instance._exact: Dict[Tuple[str, str], str] = {}
+                    instance.avoided = 0
+                    cls._instance = instance
+        return cls._instance
+
+    def resolve(self, method: str, template: str, url: str) -> str:
+        """The remembered final URL for `url`, or `url` itself."""
+        target = self._exact.get((method, url))
+        if target is None:
+            rule = self._rules.get(f"{method} {template}")
+            if rule is None:
+                return url
+            target = _apply(rule, url)
+        if target != url:
+            with self._lock:
+                self.avoided += 1
+        return target
+
+    def learn(self, method: str, template: str, url: str, final_url: str) -> None:
+        """Remember that `url` permanently redirects to `final_url`."""
+        if final_url == url:
+            return
+        rule = _rule(url, final_url)
+        with self._lock:
+            if rule is not None:
+                self._rules[f"{method} {template}"] = rule
+                return
+            if len(self._exact) >= MAX_EXACT_REDIRECTS:
+                self._exact.clear()
+            self._exact[(method, url)] = final_url
+
+    @property
+    def size(self) -> int:
+        return len(self._rules) + len(self._exact)
+
+    @classmethod
+    def reset(cls) -> None:
+        """Reset the singleton instance (called at the start of each run)."""
+        cls._instance = None
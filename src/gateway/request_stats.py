@@ -0,0 +1,178 @@
+"""Run-scoped request statistics collected by ApiClient."""
+
+import json
+import math
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Listener signature: (method, template, status_code or None on transport error, latency seconds)
+RequestListener = Callable[[str, str, Optional[int], float], None]
+
+# Latency buckets: 4 per doubling from 0.5ms, the last one (~70s+) is open-ended.
+# A percentile is reported as its bucket's upper bound, i.e. at most ~19% high.
+MIN_LATENCY = 0.0005
+BUCKETS_PER_DOUBLING = 4
+BUCKET_COUNT = 70
+
+PERCENTILES = (50, 95, 99)
+
+
+def _bucket(seconds: float) -> int:
+    if seconds <= MIN_LATENCY:
+        return 0
+    return min(BUCKET_COUNT - 1, int(math.log2(seconds / MIN_LATENCY) * BUCKETS_PER_DOUBLING) + 1)
+
+
+def _upper_bound(bucket: int) -> float:
+    return MIN_LATENCY * 2 ** (bucket / BUCKETS_PER_DOUBLING)
+
+
+class LatencyHistogram:
+    """Fixed log-scale latency histogram; constant memory per endpoint."""
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self):
+        self.buckets = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.buckets[_bucket(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """(upper bound, samples at or below it) at every doubling; the last bound is +inf."""
+        points, seen = [], 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if bucket % BUCKETS_PER_DOUBLING == 0 and bucket < BUCKET_COUNT - 1:
+                points.append((_upper_bound(bucket), seen))
+        points.append((math.inf, seen))
+        return points
+
+    def percentile(self, p: float) -> float:
+        """Latency below which `p` percent of the samples fall (0.0 when empty)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(_upper_bound(bucket), self.max)
+        return self.max
+
+
+class EndpointStats:
+    """Counters of one "METHOD /endpoint/{template}" key."""
+
+    __slots__ = ("count", "errors", "bytes", "latency")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.latency = LatencyHistogram()
+
+    def summary(self) -> dict:
+        summary = {
+            "count": self.count,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "total_seconds": round(self.latency.total, 6),
+            "max_seconds": round(self.latency.max, 6),
+        }
+        for p in PERCENTILES:
+            summary[f"p{p}_seconds"] = round(self.latency.percentile(p), 6)
+        return summary
+
+
+def is_error(method: str, status: Optional[int]) -> bool:
+    """Transport failures and HTTP errors; a GET 404 is an answer (ApiClient returns None)."""
+    if status is None:
+        return True
+    return status >= 400 and not (status == 404 and method == "GET")
+
+
+class RequestStats:
+    """Singleton, thread-safe counters keyed by "METHOD /endpoint/{template}".
+
+    Every HTTP attempt (retries included) is counted per key with its
+    latency, response size and whether it failed.
+    """
+
+    _instance: Optional["RequestStats"] = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls) -> "RequestStats":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._lock = threading.Lock()
+                    instance.retries: Dict[str, int] = {}
+                    instance.endpoints: Dict[str, EndpointStats] = {}
+                    instance._listeners: List[RequestListener] = []
+                    cls._instance = instance
+        return cls._instance
+
+    @staticmethod
+    def key(method: str, template: str) -> str:
+        return f"{method} {template}"
+
+    def record_retry(self, method: str, template: str) -> None:
+        key = self.key(method, template)
+        with self._lock:
+            self.retries[key] = self.retries.get(key, 0) + 1
+
+    def subscribe(self, listener: RequestListener) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: RequestListener) -> None:
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def observe(self, method: str, template: str, status: Optional[int], latency: float, size: int = 0) -> None:
+        """Record one HTTP attempt and notify listeners."""
+        key = self.key(method, template)
+        with self._lock:
+            endpoint = self.endpoints.get(key)
+            if endpoint is None:
+                endpoint = self.endpoints[key] = EndpointStats()
+            endpoint.count += 1
+            endpoint.bytes += size
+            if is_error(method, status):
+                endpoint.errors += 1
+            endpoint.latency.record(latency)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(method, template, status, latency)
+
+    def summary(self) -> Dict[str, dict]:
+        """Per-endpoint count, errors, bytes and latency percentiles, slowest in total first."""
+        with self._lock:
+            endpoints = sorted(self.endpoints.items(), key=lambda item: -item[1].latency.total)
+            return {key: endpoint.summary() for key, endpoint in endpoints}
+
+    def write(self, path: Path) -> None:
+        """Export the summary and retry counts as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            retries = dict(self.retries)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"endpoints": self.summary(), "retries": retries}, f, indent=2)
+            f.write("\n")
+
+    @classmethod
+    def reset(cls) -> None:
+        """Reset the singleton instance (called at the start of each run)."""
+        cls._instance = None
@@ -1,25 +1,69 @@
+import argparse
+import os
+import signal
 import sys
+import time
 from datetime import datetime
 
 from config.loader import Config
+from engine.action_registry import ACTION_REGISTRY
 from engine.pipeline_engine import PipelineEngine
 from utils.display import Display
 from utils.logger import Logger as log
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the provisioning pipeline")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip items recorded as completed in the checkpoint journal (JOURNAL_PATH)"
+    )
+    parser.add_argument(
+        "--full-reconcile",
+        action="store_true",
+        help="apply every item, ignoring and rebuilding the applied-state store (STATE_STORE_PATH)"
+    )
+    return parser.parse_args(argv)
+
+
+def _flush_and_terminate(signum, frame):
+    """SIGTERM (e.g. the pod is deleted): write buffered output, then die as the signal would."""
+    log.flush()
+    sys.stdout.flush()
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
 def main():
+    signal.signal(signal.SIGTERM, _flush_and_terminate)
+    # CPU time used so far: interpreter start-up plus the imports above
+    startup = [("interpreter + imports", time.process_time())]
+    args = parse_args()
+    phase_start = time.perf_counter()
     config = Config()
+    startup.append(("config", time.perf_counter() - phase_start))
+    if args.resume:
+        config.resume = True
+    if args.full_reconcile:
+        config.full_reconcile = True
 
     # Show banner
     Display.banner(config.version, config.debug)
 
     start_ts = datetime.now()
-    log.debug("Main", f"Loaded configuration: {config.__dict__}")
+    log.debug("Main", "Loaded configuration: %s", config.__dict__)
 
+    phase_start = time.perf_counter()
     engine = PipelineEngine(config)
+    startup.append(("engine", time.perf_counter() - phase_start))
 
     try:
+        phase_start = time.perf_counter()
         pipeline = engine.load_pipeline(config.pipeline_file)
+        startup.append(("load + validate pipeline", time.perf_counter() - phase_start))
+        if config.debug:
+            Display.startup_timing(startup, ACTION_REGISTRY.load_times)
 
         # Show pipeline overview (always, with more details in debug mode)
         engine.show_overview(pipeline, debug=config.debug)
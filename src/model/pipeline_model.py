@@ -9,6 +9,9 @@ class PipelineStep(BaseModel):
     enabled: bool = True
     params: Optional[Dict[str, Any]] = None
     params_list: Optional[Any] = None
+    max_parallel: Optional[int] = None
+    optimistic: Optional[bool] = None
+    depends_on: Optional[List[str]] = None
 
 
 class PipelineDefinition(BaseModel):
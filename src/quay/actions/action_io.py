@@ -0,0 +1,76 @@
+"""Write actions whose flow is written once and run either blocking or on an event loop."""
+
+from abc import abstractmethod
+from typing import Coroutine
+
+from .base_action import BaseAction
+from .organization.get_organization import GetOrganizationAction
+from .team.get_team import GetTeamAction
+from model.action_response import ActionResponse
+from quay.prototype_index import PrototypeIndex
+
+
+class BlockingIO:
+    """I/O steps sent through a QuayGateway. The coroutines never suspend."""
+
+    def __init__(self, gateway):
+        self.gateway = gateway
+
+    async def call(self, method: str, *args, **kwargs):
+        return getattr(self.gateway, method)(*args, **kwargs)
+
+    async def organization_exists(self, organization: str) -> bool:
+        return GetOrganizationAction.exists(organization)
+
+    async def team_exists(self, organization: str, team_name: str) -> bool:
+        return GetTeamAction.exists(organization, team_name)
+
+    async def load_prototypes(self, organization: str) -> None:
+        PrototypeIndex().load(organization, lambda: self.gateway.list_prototypes(organization))
+
+
+class AwaitableIO:
+    """I/O steps awaited on an AsyncQuayGateway."""
+
+    def __init__(self, gateway):
+        self.gateway = gateway
+
+    async def call(self, method: str, *args, **kwargs):
+        return await getattr(self.gateway, method)(*args, **kwargs)
+
+    async def organization_exists(self, organization: str) -> bool:
+        return await GetOrganizationAction.exists_async(organization, self.gateway)
+
+    async def team_exists(self, organization: str, team_name: str) -> bool:
+        return await GetTeamAction.exists_async(organization, team_name, self.gateway)
+
+    async def load_prototypes(self, organization: str) -> None:
+        await PrototypeIndex().load_async(organization, lambda: self.gateway.list_prototypes(organization))
+
+
+def run_blocking(flow: Coroutine):
+    """Run a flow driven by BlockingIO to completion without an event loop."""
+    try:
+        flow.send(None)
+    except StopIteration as stop:
+        return stop.value
+    flow.close()
+    raise RuntimeError("Blocking action flow suspended")
+
+
+class IOAction(BaseAction):
+    """Action with a single `_run(data, io)` flow.
+
+    execute() runs it with BlockingIO on self.gateway; execute_async()
+    awaits it with AwaitableIO on self.async_gateway.
+    """
+
+    @abstractmethod
+    async def _run(self, data: dict, io) -> ActionResponse:
+        pass
+
+    def execute(self, data: dict) -> ActionResponse:
+        return run_blocking(self._run(data, BlockingIO(self.gateway)))
+
+    async def execute_async(self, data: dict) -> ActionResponse:
+        return await self._run(data, AwaitableIO(self.async_gateway))
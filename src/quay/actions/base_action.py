@@ -1,5 +1,6 @@
 """Base class for all pipeline actions."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -14,14 +15,28 @@ class BaseAction(ABC):
     - Gateway dependency injection
     - Required field validation
     - Standardized execute interface
+    - Optimistic mode flag for write actions
+    - Awaitable execute_async for the asyncio executor path
+    - Opt-in to the applied-state store for idempotent writes
     """
 
-    def __init__(self, gateway=None):
+    # Items of this job may be skipped on later runs once applied (state
+    # store). Only for writes whose success stays true until the item
+    # changes; reads, deletes and reconciles must run every time.
+    remember_applied = False
+
+    def __init__(self, gateway=None, optimistic: bool = False):
         """
         Args:
             gateway: External gateway client to be used by the action.
+            optimistic: Send the write first and only run the existence
+                pre-checks to diagnose a failed write. Actions without
+                pre-checks ignore it.
         """
         self.gateway = gateway
+        self.optimistic = optimistic
+        # AsyncQuayGateway of the running event loop, set by the executor
+        self.async_gateway = None
 
     @abstractmethod
     def execute(self, data: dict) -> ActionResponse:
@@ -35,6 +50,16 @@ class BaseAction(ABC):
         """
         pass
 
+    async def execute_async(self, data: dict) -> ActionResponse:
+        """Awaitable variant of execute, used when steps run on an event loop.
+
+        Actions with a native implementation override this to send their
+        requests through `self.async_gateway`. The default runs execute()
+        on the loop's default thread pool, so every action can be driven
+        from the asyncio path.
+        """
+        return await asyncio.to_thread(self.execute, data)
+
     def validate_required(self, data: dict, *fields: str) -> None:
         """Validate that all required fields are present and non-empty.
 
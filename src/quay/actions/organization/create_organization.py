@@ -1,32 +1,29 @@
-from ..base_action import BaseAction
-from .get_organization import GetOrganizationAction
+from ..action_io import IOAction
 from model.action_response import ActionResponse
+from quay.existence_cache import ExistenceCache
 from quay.model.organization_model import Organization
 from utils.logger import Logger as log
 
 
-class CreateOrganizationAction(BaseAction):
+class CreateOrganizationAction(IOAction):
 
-    def execute(self, data: dict) -> ActionResponse:
+    remember_applied = True
+
+    async def _run(self, data: dict, io) -> ActionResponse:
         try:
             log.info("CreateOrganizationAction", "Starting organization creation flow")
             org = Organization(**data)
-            log.debug("CreateOrganizationAction", f"Resolved model: {org.model_dump()}")
+            log.debug("CreateOrganizationAction", "Resolved model: %s", org.model_dump())
 
             # --- VALIDATION ---
             log.info("CreateOrganizationAction", f"Validating existence: {org.name}")
-            if GetOrganizationAction.exists(org.name):
+            if await io.organization_exists(org.name):
                 log.info("CreateOrganizationAction", f"Organization already exists: {org.name}")
                 return ActionResponse(success=True, data={"organization": org.name})
 
             # --- CREATE NEW ORG ---
-            result = self.gateway.create_organization(org.name, email=org.email)
-            log.info("CreateOrganizationAction", "Organization created successfully")
-
-            return ActionResponse(
-                success=True,
-                data={"organization": org.name, "result": result}
-            )
+            result = await io.call("create_organization", org.name, email=org.email)
+            return self._created(org, result)
 
         except Exception as e:
             log.error("CreateOrganizationAction", f"Exception occurred: {e}")
@@ -34,3 +31,13 @@ class CreateOrganizationAction(BaseAction):
                 success=False,
                 message=f"Failed to create organization: {e}"
             )
+
+    @staticmethod
+    def _created(org: Organization, result) -> ActionResponse:
+        ExistenceCache().set(ExistenceCache.organization_key(org.name), True)
+        log.info("CreateOrganizationAction", "Organization created successfully")
+
+        return ActionResponse(
+            success=True,
+            data={"organization": org.name, "result": result}
+        )
@@ -1,6 +1,8 @@
 from ..base_action import BaseAction
 from model.action_response import ActionResponse
+from quay.existence_cache import ExistenceCache
 from quay.model.organization_model import DeleteOrganization
+from quay.prototype_index import PrototypeIndex
 from utils.logger import Logger as log
 
 
@@ -10,9 +12,13 @@ class DeleteOrganizationAction(BaseAction):
         try:
             log.info("DeleteOrganizationAction", f"Executing with data: {data}")
             org = DeleteOrganization(**data)
-            log.debug("DeleteOrganizationAction", f"Filtered model data: {org.model_dump()}")
+            log.debug("DeleteOrganizationAction", "Filtered model data: %s", org.model_dump())
 
             result = self.gateway.delete_organization(org.name)
+            cache = ExistenceCache()
+            cache.invalidate_organization(org.name)
+            cache.set(ExistenceCache.organization_key(org.name), False)
+            PrototypeIndex().invalidate(org.name)
 
             return ActionResponse(
                 success=True,
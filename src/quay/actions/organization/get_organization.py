@@ -1,4 +1,5 @@
 from ..base_action import BaseAction
+from quay.existence_cache import ExistenceCache
 from quay.quay_gateway import QuayGateway
 from model.action_response import ActionResponse
 from quay.model.organization_model import GetOrganization
@@ -9,13 +10,39 @@ class GetOrganizationAction(BaseAction):
 
     @staticmethod
     def exists(name: str) -> bool:
-        """Check if an organization exists."""
+        """Check if an organization exists (cached for the current run)."""
+        return ExistenceCache().lookup(
+            ExistenceCache.organization_key(name),
+            lambda: GetOrganizationAction._fetch_exists(name)
+        )
+
+    @staticmethod
+    def _fetch_exists(name: str) -> bool:
         try:
-            gateway = QuayGateway()
+            gateway = QuayGateway.shared()
             result = gateway.get_organization(name)
             return result is not None
         except Exception as e:
-            log.debug("GetOrganizationAction", f"Error checking if organization exists: {e}")
+            log.debug("GetOrganizationAction", "Error checking if organization exists: %s", e)
+            if "404" in str(e):
+                return False
+            raise
+
+    @staticmethod
+    async def exists_async(name: str, gateway) -> bool:
+        """Awaitable exists() sharing the same cache, fetched through an AsyncQuayGateway."""
+        return await ExistenceCache().lookup_async(
+            ExistenceCache.organization_key(name),
+            lambda: GetOrganizationAction._fetch_exists_async(name, gateway)
+        )
+
+    @staticmethod
+    async def _fetch_exists_async(name: str, gateway) -> bool:
+        try:
+            result = await gateway.get_organization(name)
+            return result is not None
+        except Exception as e:
+            log.debug("GetOrganizationAction", "Error checking if organization exists: %s", e)
             if "404" in str(e):
                 return False
             raise
@@ -24,7 +51,7 @@ class GetOrganizationAction(BaseAction):
         try:
             log.info("GetOrganizationAction", f"Executing organization lookup payload={data}")
             org = GetOrganization(**data)
-            log.debug("GetOrganizationAction", f"Validated input model={org.model_dump()}")
+            log.debug("GetOrganizationAction", "Validated input model=%s", org.model_dump())
 
             result = self.gateway.get_organization(org.name)
             log.info("GetOrganizationAction", f"Organization fetch succeeded name={org.name}")
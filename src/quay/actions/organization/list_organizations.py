@@ -9,7 +9,7 @@ class ListOrganizationsAction(BaseAction):
         try:
             log.info("ListOrganizationsAction", f"Executing with data: {data}")
             result = self.gateway.list_organizations()
-            log.debug("ListOrganizationsAction", f"API result: {result}")
+            log.debug("ListOrganizationsAction", "API result: %s", result)
 
             return ActionResponse(
                 success=True,
@@ -1,5 +1,6 @@
-from ..base_action import BaseAction
-from ..organization.get_organization import GetOrganizationAction
+from typing import Optional
+
+from ..action_io import IOAction
 from exceptions import ValidationError
 from quay.exceptions import RobotAlreadyExistsError
 from model.action_response import ActionResponse
@@ -7,9 +8,11 @@ from quay.model.robot_account_model import CreateRobotAccount
 from utils.logger import Logger as log
 
 
-class CreateRobotAccountAction(BaseAction):
+class CreateRobotAccountAction(IOAction):
+
+    remember_applied = True
 
-    def execute(self, data: dict) -> ActionResponse:
+    async def _run(self, data: dict, io) -> ActionResponse:
         try:
             self.validate_required(data, "organization")
             org = data["organization"]
@@ -17,35 +20,30 @@ class CreateRobotAccountAction(BaseAction):
             dto = CreateRobotAccount(**data)
             log.info("CreateRobotAccountAction", f"IN -> org={org}, robot={dto.robot_shortname}")
 
-            # --- VALIDATE ORG ---
-            if not GetOrganizationAction.exists(org):
-                return ActionResponse(
-                    success=False,
-                    message="Organization does not exist",
-                    data={"organization": org}
-                )
+            if not self.optimistic:
+                failure = await self._precheck(org, io)
+                if failure:
+                    return failure
 
             # --- CREATE ---
             try:
-                result = self.gateway.create_robot_account(
+                result = await io.call(
+                    "create_robot_account",
                     organization=org,
                     robot_shortname=dto.robot_shortname,
                     description=dto.description
                 )
-                log.info("CreateRobotAccountAction", f"CREATED -> {org}/{dto.robot_shortname}")
-
-                return ActionResponse(
-                    success=True,
-                    data={"organization": org, "robot": dto.robot_shortname, "result": result}
-                )
+                return self._created(org, dto, result)
 
             except RobotAlreadyExistsError:
-                log.info("CreateRobotAccountAction", f"Robot already exists: {dto.robot_shortname}")
-                return ActionResponse(
-                    success=True,
-                    message="Robot already exists",
-                    data={"organization": org, "robot": dto.robot_shortname}
-                )
+                return self._already_exists(org, dto)
+
+            except Exception:
+                if self.optimistic:
+                    failure = await self._precheck(org, io)
+                    if failure:
+                        return failure
+                raise
 
         except ValidationError as e:
             log.error("CreateRobotAccountAction", f"Validation error: {e}")
@@ -57,3 +55,35 @@ class CreateRobotAccountAction(BaseAction):
                 success=False,
                 message=f"Failed to create robot account: {e}"
             )
+
+    @staticmethod
+    def _created(org: str, dto: CreateRobotAccount, result) -> ActionResponse:
+        log.info("CreateRobotAccountAction", f"CREATED -> {org}/{dto.robot_shortname}")
+        return ActionResponse(
+            success=True,
+            data={"organization": org, "robot": dto.robot_shortname, "result": result}
+        )
+
+    @staticmethod
+    def _already_exists(org: str, dto: CreateRobotAccount) -> ActionResponse:
+        log.info("CreateRobotAccountAction", f"Robot already exists: {dto.robot_shortname}")
+        return ActionResponse(
+            success=True,
+            message="Robot already exists",
+            data={"organization": org, "robot": dto.robot_shortname}
+        )
+
+    async def _precheck(self, org: str, io) -> Optional[ActionResponse]:
+        # --- VALIDATE ORG ---
+        if not await io.organization_exists(org):
+            return self._missing_org(org)
+
+        return None
+
+    @staticmethod
+    def _missing_org(org: str) -> ActionResponse:
+        return ActionResponse(
+            success=False,
+            message="Organization does not exist",
+            data={"organization": org}
+        )
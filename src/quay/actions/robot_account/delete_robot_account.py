@@ -14,7 +14,7 @@ class DeleteRobotAccountAction(BaseAction):
 
             log.info("DeleteRobotAccountAction", f"Executing with data: {data}")
             dto = DeleteRobotAccount(**data)
-            log.debug("DeleteRobotAccountAction", f"Filtered model data: {dto.model_dump()}")
+            log.debug("DeleteRobotAccountAction", "Filtered model data: %s", dto.model_dump())
 
             result = self.gateway.delete_robot_account(
                 organization=org,
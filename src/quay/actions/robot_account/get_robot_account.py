@@ -13,7 +13,7 @@ class GetRobotAccountAction(BaseAction):
     def exists(organization: str, robot: str) -> bool:
         """Check if a robot account exists."""
         try:
-            gateway = QuayGateway()
+            gateway = QuayGateway.shared()
             gateway.get_robot_account(
                 organization=organization,
                 robot_shortname=robot
@@ -22,7 +22,7 @@ class GetRobotAccountAction(BaseAction):
         except RobotNotFoundError:
             return False
         except Exception as e:
-            log.debug("GetRobotAccountAction", f"Error checking if robot exists: {e}")
+            log.debug("GetRobotAccountAction", "Error checking if robot exists: %s", e)
             if "404" in str(e) or "400" in str(e):
                 return False
             raise
@@ -34,7 +34,7 @@ class GetRobotAccountAction(BaseAction):
 
             log.info("GetRobotAccountAction", f"Executing with data: {data}")
             dto = GetRobotAccount(**data)
-            log.debug("GetRobotAccountAction", f"Filtered model data: {dto.model_dump()}")
+            log.debug("GetRobotAccountAction", "Filtered model data: %s", dto.model_dump())
 
             result = self.gateway.get_robot_account(
                 organization=org,
@@ -14,7 +14,7 @@ class ListRobotAccountsAction(BaseAction):
 
             log.info("ListRobotAccountsAction", f"Executing with data: {data}")
             dto = ListRobotAccounts(**data)
-            log.debug("ListRobotAccountsAction", f"Filtered model data: {dto.model_dump()}")
+            log.debug("ListRobotAccountsAction", "Filtered model data: %s", dto.model_dump())
 
             result = self.gateway.list_robot_accounts(org)
 
@@ -1,15 +1,40 @@
-from ..base_action import BaseAction
-from ..organization.get_organization import GetOrganizationAction
-from .get_team import GetTeamAction
+from typing import Optional
+
+from ..action_io import IOAction
 from exceptions import ValidationError
 from model.action_response import ActionResponse
 from quay.model.team_model import AddTeamMember
 from utils.logger import Logger as log
 
 
-class AddTeamMemberAction(BaseAction):
+def already_member(e: Exception, org: str, team_name: str, member_name: str) -> Optional[ActionResponse]:
+    """Success response if the add failed because the member is already in the team."""
+    error_msg = str(e)
+    if hasattr(e, "response") and e.response is not None:
+        try:
+            error_msg = e.response.text
+        except Exception:
+            pass
+
+    if "already a member" in error_msg.lower():
+        log.info("AddTeamMemberAction", f"Member already exists: {member_name} in {team_name}")
+        return ActionResponse(
+            success=True,
+            message="Member already exists in team",
+            data={
+                "organization": org,
+                "team": team_name,
+                "member": member_name
+            }
+        )
+    return None
+
+
+class AddTeamMemberAction(IOAction):
 
-    def execute(self, data: dict) -> ActionResponse:
+    remember_applied = True
+
+    async def _run(self, data: dict, io) -> ActionResponse:
         try:
             self.validate_required(data, "organization")
             org = data["organization"]
@@ -17,55 +42,24 @@ class AddTeamMemberAction(BaseAction):
             dto = AddTeamMember(**data)
             log.info("AddTeamMemberAction", f"IN -> org={org}, team={dto.team_name}, member={dto.member_name}")
 
-            # --- VALIDATE ORG ---
-            if not GetOrganizationAction.exists(org):
-                return ActionResponse(
-                    success=False,
-                    message="Organization does not exist",
-                    data={"organization": org}
-                )
-
-            # --- VALIDATE TEAM ---
-            if not GetTeamAction.exists(org, dto.team_name):
-                return ActionResponse(
-                    success=False,
-                    message="Team does not exist",
-                    data={"organization": org, "team": dto.team_name}
-                )
+            if not self.optimistic:
+                failure = await self._precheck(org, dto, io)
+                if failure:
+                    return failure
 
             # --- ADD MEMBER ---
             try:
-                result = self.gateway.add_team_member(org, dto.team_name, dto.member_name)
-                log.info("AddTeamMemberAction", f"ADDED -> {dto.member_name} to {org}/{dto.team_name}")
-
-                return ActionResponse(
-                    success=True,
-                    data={
-                        "organization": org,
-                        "team": dto.team_name,
-                        "member": dto.member_name,
-                        "result": result
-                    }
-                )
+                result = await io.call("add_team_member", org, dto.team_name, dto.member_name)
+                return self._added(org, dto, result)
             except Exception as e:
-                error_msg = str(e)
-                if hasattr(e, "response") and e.response is not None:
-                    try:
-                        error_msg = e.response.text
-                    except Exception:
-                        pass
-
-                if "already a member" in error_msg.lower():
-                    log.info("AddTeamMemberAction", f"Member already exists: {dto.member_name} in {dto.team_name}")
-                    return ActionResponse(
-                        success=True,
-                        message="Member already exists in team",
-                        data={
-                            "organization": org,
-                            "team": dto.team_name,
-                            "member": dto.member_name
-                        }
-                    )
+                existing = already_member(e, org, dto.team_name, dto.member_name)
+                if existing:
+                    return existing
+
+                if self.optimistic:
+                    failure = await self._precheck(org, dto, io)
+                    if failure:
+                        return failure
                 raise
 
         except ValidationError as e:
@@ -78,3 +72,35 @@ class AddTeamMemberAction(BaseAction):
                 success=False,
                 message=f"Failed to add team member: {e}"
             )
+
+    @staticmethod
+    def _added(org: str, dto: AddTeamMember, result) -> ActionResponse:
+        log.info("AddTeamMemberAction", f"ADDED -> {dto.member_name} to {org}/{dto.team_name}")
+        return ActionResponse(
+            success=True,
+            data={
+                "organization": org,
+                "team": dto.team_name,
+                "member": dto.member_name,
+                "result": result
+            }
+        )
+
+    async def _precheck(self, org: str, dto: AddTeamMember, io) -> Optional[ActionResponse]:
+        # --- VALIDATE ORG ---
+        if not await io.organization_exists(org):
+            return ActionResponse(
+                success=False,
+                message="Organization does not exist",
+                data={"organization": org}
+            )
+
+        # --- VALIDATE TEAM ---
+        if not await io.team_exists(org, dto.team_name):
+            return ActionResponse(
+                success=False,
+                message="Team does not exist",
+                data={"organization": org, "team": dto.team_name}
+            )
+
+        return None
@@ -1,15 +1,19 @@
-from ..base_action import BaseAction
-from ..organization.get_organization import GetOrganizationAction
+from typing import Optional
+
+from ..action_io import IOAction
 from exceptions import ValidationError
 from quay.exceptions import TeamAlreadyExistsError
+from quay.existence_cache import ExistenceCache
 from model.action_response import ActionResponse
 from quay.model.team_model import CreateTeam
 from utils.logger import Logger as log
 
 
-class CreateTeamAction(BaseAction):
+class CreateTeamAction(IOAction):
+
+    remember_applied = True
 
-    def execute(self, data: dict) -> ActionResponse:
+    async def _run(self, data: dict, io) -> ActionResponse:
         try:
             self.validate_required(data, "organization")
             org = data["organization"]
@@ -17,36 +21,31 @@ class CreateTeamAction(BaseAction):
             dto = CreateTeam(**data)
             log.info("CreateTeamAction", f"IN -> org={org}, team={dto.team_name}, role={dto.role}")
 
-            # --- VALIDATE ORG ---
-            if not GetOrganizationAction.exists(org):
-                return ActionResponse(
-                    success=False,
-                    message="Organization does not exist",
-                    data={"organization": org}
-                )
+            if not self.optimistic:
+                failure = await self._precheck(org, io)
+                if failure:
+                    return failure
 
             # --- CREATE ---
             try:
-                result = self.gateway.create_team(
+                result = await io.call(
+                    "create_team",
                     organization=org,
                     team_name=dto.team_name,
                     role=dto.role,
                     description=dto.description
                 )
-                log.info("CreateTeamAction", f"CREATED -> {org}/{dto.team_name}")
-
-                return ActionResponse(
-                    success=True,
-                    data={"organization": org, "team": dto.team_name, "role": dto.role, "result": result}
-                )
+                return self._created(org, dto, result)
 
             except TeamAlreadyExistsError:
-                log.info("CreateTeamAction", f"Team already exists: {dto.team_name}")
-                return ActionResponse(
-                    success=True,
-                    message="Team already exists",
-                    data={"organization": org, "team": dto.team_name}
-                )
+                return self._already_exists(org, dto)
+
+            except Exception:
+                if self.optimistic:
+                    failure = await self._precheck(org, io)
+                    if failure:
+                        return failure
+                raise
 
         except ValidationError as e:
             log.error("CreateTeamAction", f"Validation error: {e}")
@@ -58,3 +57,38 @@ class CreateTeamAction(BaseAction):
                 success=False,
                 message=f"Failed to create team: {e}"
             )
+
+    @staticmethod
+    def _created(org: str, dto: CreateTeam, result) -> ActionResponse:
+        ExistenceCache().set(ExistenceCache.team_key(org, dto.team_name), True)
+        log.info("CreateTeamAction", f"CREATED -> {org}/{dto.team_name}")
+
+        return ActionResponse(
+            success=True,
+            data={"organization": org, "team": dto.team_name, "role": dto.role, "result": result}
+        )
+
+    @staticmethod
+    def _already_exists(org: str, dto: CreateTeam) -> ActionResponse:
+        ExistenceCache().set(ExistenceCache.team_key(org, dto.team_name), True)
+        log.info("CreateTeamAction", f"Team already exists: {dto.team_name}")
+        return ActionResponse(
+            success=True,
+            message="Team already exists",
+            data={"organization": org, "team": dto.team_name}
+        )
+
+    async def _precheck(self, org: str, io) -> Optional[ActionResponse]:
+        # --- VALIDATE ORG ---
+        if not await io.organization_exists(org):
+            return self._missing_org(org)
+
+        return None
+
+    @staticmethod
+    def _missing_org(org: str) -> ActionResponse:
+        return ActionResponse(
+            success=False,
+            message="Organization does not exist",
+            data={"organization": org}
+        )
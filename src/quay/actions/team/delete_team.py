@@ -3,6 +3,7 @@ from ..organization.get_organization import GetOrganizationAction
 from .get_team import GetTeamAction
 from exceptions import ValidationError
 from model.action_response import ActionResponse
+from quay.existence_cache import ExistenceCache
 from quay.model.team_model import DeleteTeam
 from utils.logger import Logger as log
 
@@ -36,6 +37,7 @@ class DeleteTeamAction(BaseAction):
 
             # --- DELETE ---
             result = self.gateway.delete_team(org, dto.team_name)
+            ExistenceCache().set(ExistenceCache.team_key(org, dto.team_name), False)
             log.info("DeleteTeamAction", f"DELETED -> {org}/{dto.team_name}")
 
             return ActionResponse(
@@ -2,6 +2,7 @@ from ..base_action import BaseAction
 from ..organization.get_organization import GetOrganizationAction
 from exceptions import ValidationError
 from quay.exceptions import TeamNotFoundError
+from quay.existence_cache import ExistenceCache
 from quay.quay_gateway import QuayGateway
 from model.action_response import ActionResponse
 from quay.model.team_model import GetTeam
@@ -12,16 +13,43 @@ class GetTeamAction(BaseAction):
 
     @staticmethod
     def exists(organization: str, team_name: str) -> bool:
-        """Check if a team exists in the organization."""
+        """Check if a team exists in the organization (cached for the current run)."""
         try:
-            gw = QuayGateway()
+            return ExistenceCache().lookup(
+                ExistenceCache.team_key(organization, team_name),
+                lambda: GetTeamAction._fetch_exists(organization, team_name)
+            )
+        except Exception:
+            return False
+
+    @staticmethod
+    def _fetch_exists(organization: str, team_name: str) -> bool:
+        try:
+            gw = QuayGateway.shared()
             gw.get_team(organization, team_name)
             return True
         except TeamNotFoundError:
             return False
+
+    @staticmethod
+    async def exists_async(organization: str, team_name: str, gateway) -> bool:
+        """Awaitable exists() sharing the same cache, fetched through an AsyncQuayGateway."""
+        try:
+            return await ExistenceCache().lookup_async(
+                ExistenceCache.team_key(organization, team_name),
+                lambda: GetTeamAction._fetch_exists_async(organization, team_name, gateway)
+            )
         except Exception:
             return False
 
+    @staticmethod
+    async def _fetch_exists_async(organization: str, team_name: str, gateway) -> bool:
+        try:
+            await gateway.get_team(organization, team_name)
+            return True
+        except TeamNotFoundError:
+            return False
+
     def execute(self, data: dict) -> ActionResponse:
         try:
             self.validate_required(data, "organization")
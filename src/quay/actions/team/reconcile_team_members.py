@@ -0,0 +1,133 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Set
+
+from ..base_action import BaseAction
+from ..organization.get_organization import GetOrganizationAction
+from .add_team_member import already_member
+from .remove_team_member import not_a_member
+from exceptions import ValidationError
+from model.action_response import ActionResponse
+from quay.exceptions import TeamNotFoundError
+from quay.existence_cache import ExistenceCache
+from quay.model.team_model import ReconcileTeamMembers
+from quay.state_snapshot import unwrap_list
+from utils.logger import Logger as log
+
+
+class ReconcileTeamMembersAction(BaseAction):
+    """Make a team's members match a desired list.
+
+    The current members are fetched once (GET .../members), and only the
+    difference is written: a PUT per missing member and, unless
+    `remove_unlisted` is false, a DELETE per member not in the list.
+    The writes run on up to `max_parallel` threads. Pending invites are
+    not counted as members.
+    """
+
+    def execute(self, data: dict) -> ActionResponse:
+        try:
+            self.validate_required(data, "organization")
+            org = data["organization"]
+
+            dto = ReconcileTeamMembers(**data)
+            log.info(
+                "ReconcileTeamMembersAction",
+                f"IN -> org={org}, team={dto.team_name}, members={len(dto.members)}, "
+                f"remove_unlisted={dto.remove_unlisted}"
+            )
+
+            # --- CURRENT MEMBERS (also proves org and team exist) ---
+            try:
+                current = self._current_members(org, dto.team_name)
+            except TeamNotFoundError:
+                if not GetOrganizationAction.exists(org):
+                    return ActionResponse(
+                        success=False,
+                        message="Organization does not exist",
+                        data={"organization": org}
+                    )
+                return ActionResponse(
+                    success=False,
+                    message="Team does not exist",
+                    data={"organization": org, "team": dto.team_name}
+                )
+            ExistenceCache().set(ExistenceCache.team_key(org, dto.team_name), True)
+
+            desired = set(dto.members)
+            to_add = sorted(desired - current)
+            to_remove = sorted(current - desired) if dto.remove_unlisted else []
+            summary = {
+                "organization": org,
+                "team": dto.team_name,
+                "added": to_add,
+                "removed": to_remove,
+                "unchanged": len(desired & current)
+            }
+
+            if not to_add and not to_remove:
+                log.info("ReconcileTeamMembersAction", f"Members already in sync: {org}/{dto.team_name}")
+                return ActionResponse(success=True, message="Team members already in sync", data=summary)
+
+            # --- APPLY DIFFERENCE ---
+            changes = [(self._add, member) for member in to_add] + [(self._remove, member) for member in to_remove]
+            workers = max(1, min(dto.max_parallel, len(changes)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                errors = list(pool.map(lambda change: change[0](org, dto.team_name, change[1]), changes))
+
+            failed = {member: error for (_, member), error in zip(changes, errors) if error}
+            if failed:
+                summary["added"] = [m for m in to_add if m not in failed]
+                summary["removed"] = [m for m in to_remove if m not in failed]
+                summary["failed"] = failed
+                log.error("ReconcileTeamMembersAction", f"{len(failed)} member change(s) failed in {org}/{dto.team_name}")
+                return ActionResponse(
+                    success=False,
+                    message=f"Failed to reconcile {len(failed)} of {len(changes)} member(s)",
+                    data=summary
+                )
+
+            log.info(
+                "ReconcileTeamMembersAction",
+                f"RECONCILED -> {org}/{dto.team_name} +{len(to_add)} -{len(to_remove)} ={summary['unchanged']}"
+            )
+            return ActionResponse(success=True, data=summary)
+
+        except ValidationError as e:
+            log.error("ReconcileTeamMembersAction", f"Validation error: {e}")
+            return ActionResponse(success=False, message=str(e))
+
+        except Exception as e:
+            log.error("ReconcileTeamMembersAction", f"Failed to reconcile team members: {e}")
+            return ActionResponse(
+                success=False,
+                message=f"Failed to reconcile team members: {e}"
+            )
+
+    def _current_members(self, org: str, team_name: str) -> Set[str]:
+        members = unwrap_list(self.gateway.get_team(org, team_name), "members")
+        return {
+            m.get("name") for m in members
+            if isinstance(m, dict) and m.get("name") and not m.get("invited")
+        }
+
+    def _add(self, org: str, team_name: str, member: str) -> Optional[str]:
+        """Add one member; returns an error message, or None on success."""
+        try:
+            self.gateway.add_team_member(org, team_name, member)
+            return None
+        except Exception as e:
+            if already_member(e, org, team_name, member):
+                return None
+            log.error("ReconcileTeamMembersAction", f"Failed to add {member} to {org}/{team_name}: {e}")
+            return str(e)
+
+    def _remove(self, org: str, team_name: str, member: str) -> Optional[str]:
+        """Remove one member; returns an error message, or None on success."""
+        try:
+            self.gateway.remove_team_member(org, team_name, member)
+            return None
+        except Exception as e:
+            if not_a_member(e, org, team_name, member):
+                return None
+            log.error("ReconcileTeamMembersAction", f"Failed to remove {member} from {org}/{team_name}: {e}")
+            return str(e)
@@ -3,6 +3,7 @@ from ..organization.get_organization import GetOrganizationAction
 from exceptions import ValidationError
 from model.action_response import ActionResponse
 from quay.model.team_model import RemoveDefaultRepositoryPermission
+from quay.prototype_index import PrototypeIndex, prototype_id
 from utils.logger import Logger as log
 
 
@@ -27,22 +28,12 @@ class RemoveDefaultRepositoryPermissionAction(BaseAction):
                     data={"organization": org}
                 )
 
-            prototypes = self.gateway.list_prototypes(org)
-            items = prototypes or []
-            if isinstance(prototypes, dict) and "prototypes" in prototypes:
-                items = prototypes["prototypes"] or []
-
-            matches = []
-            for entry in items:
-                delegate = entry.get("delegate", {})
-                if delegate.get("name") != dto.delegate.name or delegate.get("kind") != dto.delegate.kind:
-                    continue
-                if dto.role and entry.get("role") != dto.role:
-                    continue
-                proto_id = entry.get("id") or entry.get("prototypes_id")
-                if proto_id is None:
-                    continue
-                matches.append(proto_id)
+            index = PrototypeIndex()
+            index.load(org, lambda: self.gateway.list_prototypes(org))
+            matches = [
+                entry for entry in index.find(org, dto.delegate.kind, dto.delegate.name, dto.role)
+                if prototype_id(entry) is not None
+            ]
 
             if not matches:
                 log.info("RemoveDefaultRepositoryPermissionAction", "No matching default permission prototypes found")
@@ -53,9 +44,10 @@ class RemoveDefaultRepositoryPermissionAction(BaseAction):
             )
 
             results = []
-            for prototype_id in matches:
-                delete_result = self.gateway.delete_prototype(org, prototype_id)
-                results.append({"prototype_id": prototype_id, "result": delete_result})
+            for entry in matches:
+                delete_result = self.gateway.delete_prototype(org, prototype_id(entry))
+                index.remove(org, entry)
+                results.append({"prototype_id": prototype_id(entry), "result": delete_result})
 
             log.info(
                 "RemoveDefaultRepositoryPermissionAction",
@@ -1,15 +1,42 @@
-from ..base_action import BaseAction
-from ..organization.get_organization import GetOrganizationAction
-from .get_team import GetTeamAction
+from typing import Optional
+
+from ..action_io import IOAction
 from exceptions import ValidationError
 from model.action_response import ActionResponse
 from quay.model.team_model import RemoveTeamMember
 from utils.logger import Logger as log
 
 
-class RemoveTeamMemberAction(BaseAction):
+def not_a_member(e: Exception, org: str, team_name: str, member_name: str) -> Optional[ActionResponse]:
+    """Success response if the removal failed because the member is not in the team."""
+    response = getattr(e, "response", None)
+    status_code = getattr(response, "status_code", None)
+    error_msg = str(e)
+    if response is not None:
+        try:
+            body_text = response.text
+            if body_text:
+                error_msg = body_text
+        except Exception:
+            pass
+
+    if status_code == 404 or "not a member" in error_msg.lower():
+        log.info("RemoveTeamMemberAction", f"Member not in team: {member_name}")
+        return ActionResponse(
+            success=True,
+            message="Member not present in team",
+            data={
+                "organization": org,
+                "team": team_name,
+                "member": member_name
+            }
+        )
+    return None
+
 
-    def execute(self, data: dict) -> ActionResponse:
+class RemoveTeamMemberAction(IOAction):
+
+    async def _run(self, data: dict, io) -> ActionResponse:
         try:
             self.validate_required(data, "organization")
             org = data["organization"]
@@ -17,58 +44,24 @@ class RemoveTeamMemberAction(BaseAction):
             dto = RemoveTeamMember(**data)
             log.info("RemoveTeamMemberAction", f"IN -> org={org}, team={dto.team_name}, member={dto.member_name}")
 
-            # --- VALIDATE ORG ---
-            if not GetOrganizationAction.exists(org):
-                return ActionResponse(
-                    success=False,
-                    message="Organization does not exist",
-                    data={"organization": org}
-                )
-
-            # --- VALIDATE TEAM ---
-            if not GetTeamAction.exists(org, dto.team_name):
-                return ActionResponse(
-                    success=False,
-                    message="Team does not exist",
-                    data={"organization": org, "team": dto.team_name}
-                )
+            if not self.optimistic:
+                failure = await self._precheck(org, dto, io)
+                if failure:
+                    return failure
 
             # --- REMOVE MEMBER ---
             try:
-                result = self.gateway.remove_team_member(org, dto.team_name, dto.member_name)
-                log.info("RemoveTeamMemberAction", f"REMOVED -> {dto.member_name} from {org}/{dto.team_name}")
-                return ActionResponse(
-                    success=True,
-                    data={
-                        "organization": org,
-                        "team": dto.team_name,
-                        "member": dto.member_name,
-                        "result": result
-                    }
-                )
+                result = await io.call("remove_team_member", org, dto.team_name, dto.member_name)
+                return self._removed(org, dto, result)
             except Exception as e:
-                response = getattr(e, "response", None)
-                status_code = getattr(response, "status_code", None)
-                error_msg = str(e)
-                if response is not None:
-                    try:
-                        body_text = response.text
-                        if body_text:
-                            error_msg = body_text
-                    except Exception:
-                        pass
-
-                if status_code == 404 or "not a member" in error_msg.lower():
-                    log.info("RemoveTeamMemberAction", f"Member not in team: {dto.member_name}")
-                    return ActionResponse(
-                        success=True,
-                        message="Member not present in team",
-                        data={
-                            "organization": org,
-                            "team": dto.team_name,
-                            "member": dto.member_name
-                        }
-                    )
+                if self.optimistic:
+                    failure = await self._precheck(org, dto, io)
+                    if failure:
+                        return failure
+
+                absent = not_a_member(e, org, dto.team_name, dto.member_name)
+                if absent:
+                    return absent
                 raise
 
         except ValidationError as e:
@@ -81,3 +74,35 @@ class RemoveTeamMemberAction(BaseAction):
                 success=False,
                 message=f"Failed to remove team member: {e}"
             )
+
+    @staticmethod
+    def _removed(org: str, dto: RemoveTeamMember, result) -> ActionResponse:
+        log.info("RemoveTeamMemberAction", f"REMOVED -> {dto.member_name} from {org}/{dto.team_name}")
+        return ActionResponse(
+            success=True,
+            data={
+                "organization": org,
+                "team": dto.team_name,
+                "member": dto.member_name,
+                "result": result
+            }
+        )
+
+    async def _precheck(self, org: str, dto: RemoveTeamMember, io) -> Optional[ActionResponse]:
+        # --- VALIDATE ORG ---
+        if not await io.organization_exists(org):
+            return ActionResponse(
+                success=False,
+                message="Organization does not exist",
+                data={"organization": org}
+            )
+
+        # --- VALIDATE TEAM ---
+        if not await io.team_exists(org, dto.team_name):
+            return ActionResponse(
+                success=False,
+                message="Team does not exist",
+                data={"organization": org, "team": dto.team_name}
+            )
+
+        return None
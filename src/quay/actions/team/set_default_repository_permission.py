@@ -1,14 +1,26 @@
-from ..base_action import BaseAction
-from ..organization.get_organization import GetOrganizationAction
+from typing import Optional
+
+from ..action_io import IOAction
 from exceptions import ValidationError
 from model.action_response import ActionResponse
 from quay.model.team_model import DefaultRepositoryPermission
+from quay.prototype_index import PrototypeIndex, prototype_id
 from utils.logger import Logger as log
 
 
-class SetDefaultRepositoryPermissionAction(BaseAction):
+class SetDefaultRepositoryPermissionAction(IOAction):
+
+    remember_applied = True
+
+    @staticmethod
+    def _created_entry(result, delegate: dict, role: str) -> dict:
+        """Prototype entry for the index, from the POST response completed with the request."""
+        entry = dict(result) if isinstance(result, dict) else {}
+        entry.setdefault("delegate", delegate)
+        entry.setdefault("role", role)
+        return entry
 
-    def execute(self, data: dict) -> ActionResponse:
+    async def _run(self, data: dict, io) -> ActionResponse:
         try:
             self.validate_required(data, "organization")
             org = data["organization"]
@@ -20,64 +32,24 @@ class SetDefaultRepositoryPermissionAction(BaseAction):
                 f"IN -> org={org}, delegate={delegate_payload}, role={dto.role}"
             )
 
-            if not GetOrganizationAction.exists(org):
-                return ActionResponse(
-                    success=False,
-                    message="Organization does not exist",
-                    data={"organization": org}
-                )
+            if not await io.organization_exists(org):
+                return self._missing_org(org)
 
-            prototypes = self.gateway.list_prototypes(org)
-            items = prototypes or []
-            if isinstance(prototypes, dict):
-                items = prototypes.get("prototypes") or []
-
-            duplicates = []
-            for entry in items:
-                delegate = entry.get("delegate", {})
-                if delegate.get("name") != delegate_payload.get("name"):
-                    continue
-                if delegate.get("kind") != delegate_payload.get("kind"):
-                    continue
-                if entry.get("role") != dto.role:
-                    continue
-                proto_id = entry.get("id") or entry.get("prototypes_id")
-                duplicates.append(proto_id or entry)
-
-            if duplicates:
-                log.info("SetDefaultRepositoryPermissionAction", "Default permission prototype already exists")
-                return ActionResponse(
-                    success=True,
-                    message="Default permission prototype already exists",
-                    data={
-                        "organization": org,
-                        "delegate": delegate_payload,
-                        "role": dto.role,
-                        "prototypes": duplicates
-                    }
-                )
+            await io.load_prototypes(org)
+            index = PrototypeIndex()
+            existing = self._existing(index, org, dto, delegate_payload)
+            if existing:
+                return existing
 
             try:
-                result = self.gateway.set_default_repository_permission(
+                result = await io.call(
+                    "set_default_repository_permission",
                     organization=org,
                     delegate=delegate_payload,
                     role=dto.role,
                     activating_user=dto.activating_user
                 )
-                log.info(
-                    "SetDefaultRepositoryPermissionAction",
-                    f"DEFAULT PERM SET -> {org}/{dto.delegate.kind}/{dto.delegate.name} ({dto.role})"
-                )
-                return ActionResponse(
-                    success=True,
-                    data={
-                        "organization": org,
-                        "delegate": delegate_payload,
-                        "role": dto.role,
-                        "activating_user": dto.activating_user,
-                        "result": result
-                    }
-                )
+                return self._set(index, org, dto, delegate_payload, result)
             except Exception as e:
                 log.error("SetDefaultRepositoryPermissionAction", f"Failed to set default permission: {e}")
                 raise
@@ -92,3 +64,63 @@ class SetDefaultRepositoryPermissionAction(BaseAction):
                 success=False,
                 message=f"Failed to manage default repository permission: {e}"
             )
+
+    @staticmethod
+    def _missing_org(org: str) -> ActionResponse:
+        return ActionResponse(
+            success=False,
+            message="Organization does not exist",
+            data={"organization": org}
+        )
+
+    @staticmethod
+    def _existing(
+        index: PrototypeIndex,
+        org: str,
+        dto: DefaultRepositoryPermission,
+        delegate_payload: dict
+    ) -> Optional[ActionResponse]:
+        """Success response if the loaded index already holds this prototype."""
+        duplicates = [
+            prototype_id(entry) or entry
+            for entry in index.find(org, dto.delegate.kind, dto.delegate.name, dto.role)
+        ]
+        if not duplicates:
+            return None
+
+        log.info("SetDefaultRepositoryPermissionAction", "Default permission prototype already exists")
+        return ActionResponse(
+            success=True,
+            message="Default permission prototype already exists",
+            data={
+                "organization": org,
+                "delegate": delegate_payload,
+                "role": dto.role,
+                "prototypes": duplicates
+            }
+        )
+
+    @classmethod
+    def _set(
+        cls,
+        index: PrototypeIndex,
+        org: str,
+        dto: DefaultRepositoryPermission,
+        delegate_payload: dict,
+        result
+    ) -> ActionResponse:
+        index.add(org, cls._created_entry(result, delegate_payload, dto.role))
+        log.info(
+            "SetDefaultRepositoryPermissionAction",
+            f"DEFAULT PERM SET -> {org}/{dto.delegate.kind}/{dto.delegate.name} ({dto.role})"
+        )
+        return ActionResponse(
+            success=True,
+            data={
+                "organization": org,
+                "delegate": delegate_payload,
+                "role": dto.role,
+                "activating_user": dto.activating_user,
+                "result": result
+            }
+        )
@@ -9,6 +9,8 @@ from utils.logger import Logger as log
 
 class SetTeamRepositoryPermissionAction(BaseAction):
 
+    remember_applied = True
+
     def execute(self, data: dict) -> ActionResponse:
         try:
             self.validate_required(data, "organization")
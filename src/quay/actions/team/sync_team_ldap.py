@@ -1,15 +1,15 @@
-from ..base_action import BaseAction
-from ..organization.get_organization import GetOrganizationAction
-from .get_team import GetTeamAction
+from typing import Optional
+
+from ..action_io import IOAction
 from exceptions import ValidationError
 from model.action_response import ActionResponse
 from quay.model.team_model import SyncTeamLdap
 from utils.logger import Logger as log
 
 
-class SyncTeamLdapAction(BaseAction):
+class SyncTeamLdapAction(IOAction):
 
-    def execute(self, data: dict) -> ActionResponse:
+    async def _run(self, data: dict, io) -> ActionResponse:
         try:
             self.validate_required(data, "organization")
             org = data["organization"]
@@ -17,74 +17,24 @@ class SyncTeamLdapAction(BaseAction):
             dto = SyncTeamLdap(**data)
             log.info("SyncTeamLdapAction", f"IN -> org={org}, team={dto.team_name}, group_dn={dto.group_dn}")
 
-            # --- VALIDATE ORG ---
-            if not GetOrganizationAction.exists(org):
-                return ActionResponse(
-                    success=False,
-                    message="Organization does not exist",
-                    data={"organization": org}
-                )
-
-            # --- VALIDATE TEAM ---
-            if not GetTeamAction.exists(org, dto.team_name):
-                return ActionResponse(
-                    success=False,
-                    message="Team does not exist",
-                    data={"organization": org, "team": dto.team_name}
-                )
-
-            # --- CHECK IF ALREADY SYNCED ---
-            try:
-                sync_status = self.gateway.get_team_sync_status(org, dto.team_name)
-                if sync_status and sync_status.get("group_dn") == dto.group_dn:
-                    log.info("SyncTeamLdapAction", f"Team already synced with same group_dn: {dto.group_dn}")
-                    return ActionResponse(
-                        success=True,
-                        message="Team already synced with LDAP group",
-                        data={
-                            "organization": org,
-                            "team": dto.team_name,
-                            "group_dn": dto.group_dn
-                        }
-                    )
-            except Exception:
-                # Not synced yet, continue
-                pass
+            if not self.optimistic:
+                precheck = await self._precheck(org, dto, io)
+                if precheck:
+                    return precheck
 
             # --- SYNC WITH LDAP ---
             try:
-                result = self.gateway.sync_team_ldap(org, dto.team_name, dto.group_dn)
-                log.info("SyncTeamLdapAction", f"SYNCED -> {org}/{dto.team_name} with {dto.group_dn}")
-
-                return ActionResponse(
-                    success=True,
-                    data={
-                        "organization": org,
-                        "team": dto.team_name,
-                        "group_dn": dto.group_dn,
-                        "result": result
-                    }
-                )
+                result = await io.call("sync_team_ldap", org, dto.team_name, dto.group_dn)
+                return self._synced(org, dto, result)
             except Exception as e:
-                error_msg = str(e)
-                if hasattr(e, "response") and e.response is not None:
-                    try:
-                        error_msg = e.response.text
-                    except Exception:
-                        pass
-
-                # Handle already synced case
-                if "already synced" in error_msg.lower() or "already enabled" in error_msg.lower():
-                    log.info("SyncTeamLdapAction", f"Team already synced: {dto.team_name}")
-                    return ActionResponse(
-                        success=True,
-                        message="Team already synced with LDAP",
-                        data={
-                            "organization": org,
-                            "team": dto.team_name,
-                            "group_dn": dto.group_dn
-                        }
-                    )
+                already = self._already_synced(e, org, dto)
+                if already:
+                    return already
+
+                if self.optimistic:
+                    precheck = await self._precheck(org, dto, io)
+                    if precheck:
+                        return precheck
                 raise
 
         except ValidationError as e:
@@ -97,3 +47,86 @@ class SyncTeamLdapAction(BaseAction):
                 success=False,
                 message=f"Failed to sync team with LDAP: {e}"
             )
+
+    @staticmethod
+    def _synced(org: str, dto: SyncTeamLdap, result) -> ActionResponse:
+        log.info("SyncTeamLdapAction", f"SYNCED -> {org}/{dto.team_name} with {dto.group_dn}")
+
+        return ActionResponse(
+            success=True,
+            data={
+                "organization": org,
+                "team": dto.team_name,
+                "group_dn": dto.group_dn,
+                "result": result
+            }
+        )
+
+    @staticmethod
+    def _already_synced(e: Exception, org: str, dto: SyncTeamLdap) -> Optional[ActionResponse]:
+        error_msg = str(e)
+        if hasattr(e, "response") and e.response is not None:
+            try:
+                error_msg = e.response.text
+            except Exception:
+                pass
+
+        # Handle already synced case
+        if "already synced" in error_msg.lower() or "already enabled" in error_msg.lower():
+            log.info("SyncTeamLdapAction", f"Team already synced: {dto.team_name}")
+            return ActionResponse(
+                success=True,
+                message="Team already synced with LDAP",
+                data={
+                    "organization": org,
+                    "team": dto.team_name,
+                    "group_dn": dto.group_dn
+                }
+            )
+        return None
+
+    async def _precheck(self, org: str, dto: SyncTeamLdap, io) -> Optional[ActionResponse]:
+        """Return a final response if the sync must not (or need not) be sent."""
+        # --- VALIDATE ORG ---
+        if not await io.organization_exists(org):
+            return self._missing(org)
+
+        # --- VALIDATE TEAM ---
+        if not await io.team_exists(org, dto.team_name):
+            return self._missing(org, dto.team_name)
+
+        # --- CHECK IF ALREADY SYNCED ---
+        try:
+            return self._same_group(org, dto, await io.call("get_team_sync_status", org, dto.team_name))
+        except Exception:
+            # Not synced yet, continue
+            return None
+
+    @staticmethod
+    def _missing(org: str, team_name: Optional[str] = None) -> ActionResponse:
+        if team_name is None:
+            return ActionResponse(
+                success=False,
+                message="Organization does not exist",
+                data={"organization": org}
+            )
+        return ActionResponse(
+            success=False,
+            message="Team does not exist",
+            data={"organization": org, "team": team_name}
+        )
+
+    @staticmethod
+    def _same_group(org: str, dto: SyncTeamLdap, sync_status) -> Optional[ActionResponse]:
+        if sync_status and sync_status.get("group_dn") == dto.group_dn:
+            log.info("SyncTeamLdapAction", f"Team already synced with same group_dn: {dto.group_dn}")
+            return ActionResponse(
+                success=True,
+                message="Team already synced with LDAP group",
+                data={
+                    "organization": org,
+                    "team": dto.team_name,
+                    "group_dn": dto.group_dn
+                }
+            )
+        return None
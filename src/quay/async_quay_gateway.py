@@ -0,0 +1,132 @@
+from quay.exceptions import TeamNotFoundError
+from quay.quay_gateway import _robot_create_failure, _safe_path, _team_create_failure
+from gateway.async_client import AsyncApiClient
+from utils.logger import Logger as log
+
+
+class AsyncQuayGateway:
+    """Awaitable QuayGateway: same endpoints, payloads and error translation,
+    sent through an AsyncApiClient bound to the running event loop.
+
+    Only the calls made by actions with a native execute_async are
+    mirrored here; other actions run their synchronous execute() on the
+    loop's thread pool and use QuayGateway.
+    """
+
+    def __init__(self, client=None):
+        self.client = client or AsyncApiClient()
+
+    async def close(self):
+        await self.client.close()
+
+    async def create_organization(self, name: str, email: str = None):
+        payload = {"name": name}
+        if email:
+            payload["email"] = email
+        log.debug("AsyncQuayGateway", "create_organization name=%s email=%s", name, email)
+        return await self.client.post("/organization/", json=payload)
+
+    async def get_organization(self, name: str):
+        log.debug("AsyncQuayGateway", "get_organization name=%s", name)
+        return await self.client.get(f"/organization/{_safe_path(name)}")
+
+    async def create_robot_account(self, organization: str, robot_shortname: str, description: str | None = None):
+        payload = {"description": description}
+        log.debug("AsyncQuayGateway", "create_robot_account org=%s robot=%s", organization, robot_shortname)
+        safe_org = _safe_path(organization)
+        safe_robot = _safe_path(robot_shortname)
+        try:
+            return await self.client.put(
+                f"/organization/{safe_org}/robots/{safe_robot}",
+                json=payload
+            )
+        except Exception as e:
+            return _robot_create_failure(e, organization, robot_shortname)
+
+    # --- TEAM OPERATIONS ---
+
+    async def create_team(self, organization: str, team_name: str, role: str = "member", description: str | None = None):
+        payload = {"role": role}
+        if description:
+            payload["description"] = description
+        log.debug("AsyncQuayGateway", "create_team org=%s team=%s role=%s", organization, team_name, role)
+        safe_org = _safe_path(organization)
+        safe_team = _safe_path(team_name)
+        try:
+            return await self.client.put(
+                f"/organization/{safe_org}/team/{safe_team}",
+                json=payload
+            )
+        except Exception as e:
+            _team_create_failure(e, organization, team_name)
+
+    async def get_team(self, organization: str, team_name: str):
+        log.debug("AsyncQuayGateway", "get_team org=%s team=%s", organization, team_name)
+        safe_org = _safe_path(organization)
+        safe_team = _safe_path(team_name)
+        result = await self.client.get(f"/organization/{safe_org}/team/{safe_team}/members")
+        if result is None:
+            raise TeamNotFoundError(
+                f"Team {team_name} not found in {organization}",
+                status_code=404
+            )
+        return result
+
+    async def add_team_member(self, organization: str, team_name: str, member_name: str):
+        log.debug("AsyncQuayGateway", "add_team_member org=%s team=%s member=%s", organization, team_name, member_name)
+        safe_org = _safe_path(organization)
+        safe_team = _safe_path(team_name)
+        safe_member = _safe_path(member_name)
+        return await self.client.put(f"/organization/{safe_org}/team/{safe_team}/members/{safe_member}")
+
+    async def remove_team_member(self, organization: str, team_name: str, member_name: str):
+        log.debug(
+            "AsyncQuayGateway",
+            "remove_team_member org=%s team=%s member=%s",
+            organization, team_name, member_name
+        )
+        safe_org = _safe_path(organization)
+        safe_team = _safe_path(team_name)
+        safe_member = _safe_path(member_name)
+        return await self.client.delete(f"/organization/{safe_org}/team/{safe_team}/members/{safe_member}")
+
+    async def list_prototypes(self, organization: str):
+        log.debug("AsyncQuayGateway", "list_prototypes org=%s", organization)
+        safe_org = _safe_path(organization)
+        return await self.client.get(f"/organization/{safe_org}/prototypes")
+
+    async def set_default_repository_permission(
+        self,
+        organization: str,
+        delegate: dict,
+        role: str,
+        activating_user: str | None = None
+    ):
+        log.debug(
+            "AsyncQuayGateway",
+            "set_default_repository_permission org=%s delegate=%s role=%s user=%s",
+            organization, delegate, role, activating_user
+        )
+        safe_org = _safe_path(organization)
+        payload = {"delegate": delegate, "role": role}
+        if activating_user:
+            payload["activating_user"] = {"name": activating_user}
+        return await self.client.post(
+            f"/organization/{safe_org}/prototypes",
+            json=payload
+        )
+
+    async def sync_team_ldap(self, organization: str, team_name: str, group_dn: str):
+        """Enable LDAP sync for a team with the specified LDAP group DN."""
+        payload = {"group_dn": group_dn}
+        log.debug("AsyncQuayGateway", "sync_team_ldap org=%s team=%s group_dn=%s", organization, team_name, group_dn)
+        safe_org = _safe_path(organization)
+        safe_team = _safe_path(team_name)
+        return await self.client.post(f"/organization/{safe_org}/team/{safe_team}/syncing", json=payload)
+
+    async def get_team_sync_status(self, organization: str, team_name: str):
+        """Get LDAP sync status for a team."""
+        log.debug("AsyncQuayGateway", "get_team_sync_status org=%s team=%s", organization, team_name)
+        safe_org = _safe_path(organization)
+        safe_team = _safe_path(team_name)
+        return await self.client.get(f"/organization/{safe_org}/team/{safe_team}/syncing")
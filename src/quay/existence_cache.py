@@ -0,0 +1,114 @@
+"""Run-scoped cache for organization and team existence checks."""
+
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from utils.logger import Logger as log
+
+
+class ExistenceCache:
+    """Singleton cache shared by all actions for the duration of a run.
+
+    Entries are only stored for definite answers (exists / does not exist);
+    a lookup that raises is not cached so the next caller retries it.
+    Concurrent lookups for the same key wait on a per-key lock, so each
+    organization and team is fetched at most once even with parallel workers
+    or concurrent coroutines (lookup_async).
+    """
+
+    _instance: Optional["ExistenceCache"] = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls) -> "ExistenceCache":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._entries: Dict[Hashable, bool] = {}
+                    instance._key_locks: Dict[Hashable, threading.Lock] = {}
+                    instance._async_key_locks: Dict[Hashable, Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
+                    instance._lock = threading.Lock()
+                    instance.hits = 0
+                    instance.misses = 0
+                    cls._instance = instance
+        return cls._instance
+
+    @staticmethod
+    def organization_key(organization: str) -> Tuple[str, str]:
+        return ("organization", organization)
+
+    @staticmethod
+    def team_key(organization: str, team_name: str) -> Tuple[str, str, str]:
+        return ("team", organization, team_name)
+
+    def lookup(self, key: Hashable, fetch: Callable[[], bool]) -> bool:
+        """Return the cached value for key, calling fetch() on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return self._entries[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    self.hits += 1
+                    return self._entries[key]
+                self.misses += 1
+
+            value = fetch()
+            with self._lock:
+                self._entries[key] = value
+            log.debug("ExistenceCache", "Cached %s -> %s", key, value)
+            return value
+
+    async def lookup_async(self, key: Hashable, fetch: Callable[[], Awaitable[bool]]) -> bool:
+        """Awaitable lookup: return the cached value for key, awaiting fetch() on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return self._entries[key]
+            key_lock = self._async_key_lock(key)
+
+        async with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    self.hits += 1
+                    return self._entries[key]
+                self.misses += 1
+
+            value = await fetch()
+            with self._lock:
+                self._entries[key] = value
+            log.debug("ExistenceCache", "Cached %s -> %s", key, value)
+            return value
+
+    def _async_key_lock(self, key: Hashable) -> asyncio.Lock:
+        # asyncio locks belong to one loop; each async step runs its own loop
+        loop = asyncio.get_running_loop()
+        entry = self._async_key_locks.get(key)
+        if entry is None or entry[0] is not loop:
+            entry = (loop, asyncio.Lock())
+            self._async_key_locks[key] = entry
+        return entry[1]
+
+    def set(self, key: Hashable, value: bool) -> None:
+        """Record a known state, e.g. after a successful create or delete."""
+        with self._lock:
+            self._entries[key] = value
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_organization(self, organization: str) -> None:
+        """Drop an organization and every team cached under it."""
+        with self._lock:
+            for key in [k for k in self._entries if len(k) > 1 and k[1] == organization]:
+                del self._entries[key]
+
+    @classmethod
+    def reset(cls) -> None:
+        """Reset the singleton instance (called at the start of each run)."""
+        cls._instance = None
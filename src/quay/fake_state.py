@@ -0,0 +1,270 @@
+"""In-memory Quay API state shared by InMemoryQuayGateway and the fake API server.
+
+Covers every endpoint QuayGateway calls, with Quay's status codes and
+error messages (the ones actions and the gateway's error translation
+look for). Standard library only, so environment/benchmark/fake_quay.py
+can serve it over HTTP without the provisioner's dependencies.
+"""
+
+import itertools
+import random
+import re
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+BASE_PATH = "/api/v1"
+ROLES = ("member", "creator", "admin")
+PERMISSIONS = ("read", "write", "admin")
+
+
+class FakeApiError(Exception):
+    """An error answer, shaped like Quay's JSON error body."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+    def body(self) -> dict:
+        return {"status": self.status, "error_message": self.message, "detail": self.message}
+
+
+class QuayState:
+    """Organizations with robots, teams (members, invites, repository
+    permissions, LDAP sync) and default permission prototypes."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.organizations: Dict[str, dict] = {}
+        self._ids = itertools.count(1)
+
+    def org(self, name: str) -> dict:
+        org = self.organizations.get(name)
+        if org is None:
+            raise FakeApiError(404, "Not Found")
+        return org
+
+    def team(self, org_name: str, team_name: str) -> dict:
+        team = self.org(org_name)["teams"].get(team_name)
+        if team is None:
+            raise FakeApiError(404, "Not Found")
+        return team
+
+    # --- organizations ---
+
+    def create_organization(self, body: dict) -> Tuple[int, object]:
+        name = body.get("name")
+        if not name:
+            raise FakeApiError(400, "Missing organization name")
+        if name in self.organizations:
+            raise FakeApiError(400, "A user or organization with this name already exists")
+        self.organizations[name] = {
+            "name": name, "email": body.get("email"), "robots": {}, "teams": {}, "prototypes": {}
+        }
+        return 201, "Created"
+
+    def get_organization(self, org: str) -> Tuple[int, object]:
+        entry = self.org(org)
+        teams = {name: {"name": name, "role": team["role"]} for name, team in entry["teams"].items()}
+        return 200, {"name": org, "email": entry["email"], "is_admin": True, "teams": teams}
+
+    def list_organizations(self) -> Tuple[int, object]:
+        return 200, {"organizations": [{"name": name} for name in sorted(self.organizations)]}
+
+    def delete_organization(self, org: str) -> Tuple[int, object]:
+        self.org(org)
+        del self.organizations[org]
+        return 204, None
+
+    # --- robots ---
+
+    def _robot(self, org: str, short: str, robot: dict) -> dict:
+        return {"name": f"{org}+{short}", "description": robot["description"], "token": robot["token"]}
+
+    def create_robot(self, org: str, short: str, body: dict) -> Tuple[int, object]:
+        robots = self.org(org)["robots"]
+        if short in robots:
+            raise FakeApiError(400, f"Existing robot with name: {org}+{short}")
+        robots[short] = {"description": body.get("description") or "", "token": f"{random.getrandbits(128):032x}"}
+        return 201, self._robot(org, short, robots[short])
+
+    def get_robot(self, org: str, short: str) -> Tuple[int, object]:
+        robot = self.org(org)["robots"].get(short)
+        if robot is None:
+            raise FakeApiError(404, f"Could not find robot with specified username: {org}+{short}")
+        return 200, self._robot(org, short, robot)
+
+    def list_robots(self, org: str) -> Tuple[int, object]:
+        robots = self.org(org)["robots"]
+        return 200, {"robots": [self._robot(org, short, robot) for short, robot in sorted(robots.items())]}
+
+    def delete_robot(self, org: str, short: str) -> Tuple[int, object]:
+        robots = self.org(org)["robots"]
+        if robots.pop(short, None) is None:
+            raise FakeApiError(404, f"Could not find robot with specified username: {org}+{short}")
+        return 204, None
+
+    # --- teams ---
+
+    def put_team(self, org: str, team_name: str, body: dict) -> Tuple[int, object]:
+        teams = self.org(org)["teams"]
+        role = body.get("role", "member")
+        if role not in ROLES:
+            raise FakeApiError(400, f"Invalid role: {role}")
+        team = teams.get(team_name)
+        if team is None:
+            team = teams[team_name] = {"members": {}, "invites": set(), "repositories": {}, "sync": None}
+        team["role"] = role
+        team["description"] = body.get("description") or ""
+        return 200, {"name": team_name, "role": role, "description": team["description"], "can_view": True}
+
+    def delete_team(self, org: str, team_name: str) -> Tuple[int, object]:
+        self.team(org, team_name)
+        del self.org(org)["teams"][team_name]
+        return 204, None
+
+    def team_members(self, org: str, team_name: str) -> Tuple[int, object]:
+        team = self.team(org, team_name)
+        members = [{"name": name, "kind": kind, "invited": False} for name, kind in sorted(team["members"].items())]
+        members += [{"email": email, "kind": "invite", "invited": True} for email in sorted(team["invites"])]
+        return 200, {"name": team_name, "members": members, "can_edit": True}
+
+    def add_member(self, org: str, team_name: str, member: str) -> Tuple[int, object]:
+        team = self.team(org, team_name)
+        if team["sync"]:
+            raise FakeApiError(400, "Cannot add or remove team members of a team synced with a group")
+        kind = "user"
+        if "+" in member:
+            owner, _, short = member.partition("+")
+            if owner != org or short not in self.org(org)["robots"]:
+                raise FakeApiError(400, f"Invalid robot account or name: {member}")
+            kind = "robot"
+        team["members"][member] = kind
+        return 200, {"name": member, "kind": kind, "is_robot": kind == "robot", "invited": False}
+
+    def remove_member(self, org: str, team_name: str, member: str) -> Tuple[int, object]:
+        if self.team(org, team_name)["members"].pop(member, None) is None:
+            raise FakeApiError(400, f"User {member} is not a member of the team")
+        return 204, None
+
+    def invite(self, org: str, team_name: str, email: str) -> Tuple[int, object]:
+        self.team(org, team_name)["invites"].add(email)
+        return 200, {"email": email, "kind": "invite", "invited": True}
+
+    def delete_invite(self, org: str, team_name: str, email: str) -> Tuple[int, object]:
+        invites = self.team(org, team_name)["invites"]
+        if email not in invites:
+            raise FakeApiError(404, "Not Found")
+        invites.discard(email)
+        return 204, None
+
+    def set_repository(self, org: str, team_name: str, repo: str, body: dict) -> Tuple[int, object]:
+        permission = body.get("permission")
+        if permission not in PERMISSIONS:
+            raise FakeApiError(400, f"Invalid permission: {permission}")
+        self.team(org, team_name)["repositories"][repo] = permission
+        return 200, {"role": permission, "name": team_name}
+
+    def delete_repository(self, org: str, team_name: str, repo: str) -> Tuple[int, object]:
+        if self.team(org, team_name)["repositories"].pop(repo, None) is None:
+            raise FakeApiError(404, "Permission not found")
+        return 204, None
+
+    # --- LDAP sync ---
+
+    def sync(self, org: str, team_name: str, body: dict) -> Tuple[int, object]:
+        team = self.team(org, team_name)
+        group_dn = body.get("group_dn")
+        if not group_dn:
+            raise FakeApiError(400, "Missing group_dn")
+        if team["sync"]:
+            raise FakeApiError(400, "Team is already synced")
+        team["sync"] = group_dn
+        return 200, {"group_dn": group_dn}
+
+    def sync_status(self, org: str, team_name: str) -> Tuple[int, object]:
+        team = self.team(org, team_name)
+        if not team["sync"]:
+            raise FakeApiError(404, "Team is not synced")
+        return 200, {"service": "ldap", "config": {"group_dn": team["sync"]}, "group_dn": team["sync"]}
+
+    def unsync(self, org: str, team_name: str) -> Tuple[int, object]:
+        team = self.team(org, team_name)
+        if not team["sync"]:
+            raise FakeApiError(400, "Team is not synced")
+        team["sync"] = None
+        return 204, None
+
+    # --- default permission prototypes ---
+
+    def list_prototypes(self, org: str) -> Tuple[int, object]:
+        return 200, {"prototypes": list(self.org(org)["prototypes"].values())}
+
+    def create_prototype(self, org: str, body: dict) -> Tuple[int, object]:
+        entry = self.org(org)
+        delegate = body.get("delegate") or {}
+        role = body.get("role")
+        if role not in PERMISSIONS or delegate.get("kind") not in ("team", "user") or not delegate.get("name"):
+            raise FakeApiError(400, "Invalid delegate or role")
+        if delegate["kind"] == "team" and delegate["name"] not in entry["teams"]:
+            raise FakeApiError(400, f"Unknown team: {delegate['name']}")
+        prototype_id = f"{next(self._ids):08d}-fake-prototype"
+        prototype = {
+            "id": prototype_id,
+            "role": role,
+            "delegate": {"kind": delegate["kind"], "name": delegate["name"]},
+            "activating_user": body.get("activating_user"),
+        }
+        entry["prototypes"][prototype_id] = prototype
+        return 200, prototype
+
+    def delete_prototype(self, org: str, prototype_id: str) -> Tuple[int, object]:
+        if self.org(org)["prototypes"].pop(prototype_id, None) is None:
+            raise FakeApiError(404, "Not Found")
+        return 204, None
+
+
+_SEGMENT = "([^/]+)"
+
+# (method, path template below BASE_PATH, regex, handler(state, body, *path segments))
+ROUTES: List[Tuple[str, str, "re.Pattern", Callable]] = [
+    (method, pattern, re.compile(f"^{pattern.replace('{}', _SEGMENT)}$"), handler)
+    for method, pattern, handler in [
+        ("POST", "/organization", lambda s, b: s.create_organization(b)),
+        ("GET", "/organization", lambda s, b: s.list_organizations()),
+        ("GET", "/organization/{}", lambda s, b, o: s.get_organization(o)),
+        ("DELETE", "/organization/{}", lambda s, b, o: s.delete_organization(o)),
+        ("GET", "/organization/{}/robots", lambda s, b, o: s.list_robots(o)),
+        ("PUT", "/organization/{}/robots/{}", lambda s, b, o, r: s.create_robot(o, r, b)),
+        ("GET", "/organization/{}/robots/{}", lambda s, b, o, r: s.get_robot(o, r)),
+        ("DELETE", "/organization/{}/robots/{}", lambda s, b, o, r: s.delete_robot(o, r)),
+        ("PUT", "/organization/{}/team/{}", lambda s, b, o, t: s.put_team(o, t, b)),
+        ("DELETE", "/organization/{}/team/{}", lambda s, b, o, t: s.delete_team(o, t)),
+        ("GET", "/organization/{}/team/{}/members", lambda s, b, o, t: s.team_members(o, t)),
+        ("PUT", "/organization/{}/team/{}/members/{}", lambda s, b, o, t, m: s.add_member(o, t, m)),
+        ("DELETE", "/organization/{}/team/{}/members/{}", lambda s, b, o, t, m: s.remove_member(o, t, m)),
+        ("PUT", "/organization/{}/team/{}/invite/{}", lambda s, b, o, t, e: s.invite(o, t, e)),
+        ("DELETE", "/organization/{}/team/{}/invite/{}", lambda s, b, o, t, e: s.delete_invite(o, t, e)),
+        ("PUT", "/organization/{}/team/{}/repositories/{}", lambda s, b, o, t, r: s.set_repository(o, t, r, b)),
+        ("DELETE", "/organization/{}/team/{}/repositories/{}", lambda s, b, o, t, r: s.delete_repository(o, t, r)),
+        ("POST", "/organization/{}/team/{}/syncing", lambda s, b, o, t: s.sync(o, t, b)),
+        ("GET", "/organization/{}/team/{}/syncing", lambda s, b, o, t: s.sync_status(o, t)),
+        ("DELETE", "/organization/{}/team/{}/syncing", lambda s, b, o, t: s.unsync(o, t)),
+        ("GET", "/organization/{}/prototypes", lambda s, b, o: s.list_prototypes(o)),
+        ("POST", "/organization/{}/prototypes", lambda s, b, o: s.create_prototype(o, b)),
+        ("DELETE", "/organization/{}/prototypes/{}", lambda s, b, o, p: s.delete_prototype(o, p)),
+    ]
+]
+
+
+def route(method: str, path: str) -> Tuple[str, Optional[Callable], tuple]:
+    """(counter key, handler or None, decoded path segments) for a path below BASE_PATH."""
+    path = path.rstrip("/")
+    for route_method, template, pattern, handler in ROUTES:
+        if route_method != method:
+            continue
+        match = pattern.match(path)
+        if match:
+            return f"{method} {template}", handler, tuple(unquote(g) for g in match.groups())
+    return f"{method} (unmatched)", None, ()
@@ -0,0 +1,119 @@
+"""QuayGateway over in-memory state, for measuring the engine without a network.
+
+    gateway = InMemoryQuayGateway()
+    PipelineExecutor(gateway).run_pipeline(pipeline, inputs_file)
+
+The gateway is the real QuayGateway with its client swapped for one that
+answers from quay.fake_state instead of sending requests. Endpoints, payloads
+and error translation are therefore the production code paths: a missing team
+raises TeamNotFoundError, an existing robot RobotAlreadyExistsError, other
+failures requests.HTTPError carrying a response (status code and Quay's JSON
+error body), and a GET 404 returns None, exactly like ApiClient.
+"""
+
+import json
+import threading
+from http import HTTPStatus
+from typing import Any, Dict, Optional
+
+import requests
+
+from quay.fake_state import BASE_PATH, FakeApiError, QuayState, route
+from quay.quay_gateway import QuayGateway
+
+
+def _http_error(method: str, url: str, error: FakeApiError) -> requests.HTTPError:
+    """The exception ApiClient raises for the same answer from a real server."""
+    response = requests.Response()
+    response.status_code = error.status
+    response.reason = HTTPStatus(error.status).phrase
+    response.url = url
+    response.headers["Content-Type"] = "application/json"
+    response._content = json.dumps(error.body()).encode("utf-8")
+    kind = "Client" if error.status < 500 else "Server"
+    return requests.HTTPError(f"{error.status} {kind} Error: {response.reason} for url: {url}", response=response)
+
+
+class InMemoryApiClient:
+    """ApiClient stand-in answering from a QuayState; `calls` counts requests per endpoint."""
+
+    def __init__(self, state: Optional[QuayState] = None):
+        self.state = state or QuayState()
+        self.base_url = f"memory://quay{BASE_PATH}"
+        self.calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def ensure_pool_size(self, size: int) -> None:
+        pass
+
+    def _request(self, method: str, endpoint: str, json: Any = None, **kwargs) -> Any:
+        path = "/" + endpoint.strip("/")
+        key, handler, args = route(method, path)
+        with self._lock:
+            self.calls[key] = self.calls.get(key, 0) + 1
+        try:
+            if handler is None:
+                raise FakeApiError(404, "Not Found")
+            with self.state.lock:
+                _, result = handler(self.state, json if isinstance(json, dict) else {}, *args)
+        except FakeApiError as e:
+            if e.status == 404 and method == "GET":
+                return None
+            raise _http_error(method, f"{self.base_url}{path}", e) from None
+        return {} if result is None else result
+
+    def get(self, endpoint, **kwargs):
+        return self._request("GET", endpoint, **kwargs)
+
+    def post(self, endpoint, **kwargs):
+        return self._request("POST", endpoint, **kwargs)
+
+    def put(self, endpoint, **kwargs):
+        return self._request("PUT", endpoint, **kwargs)
+
+    def delete(self, endpoint, **kwargs):
+        return self._request("DELETE", endpoint, **kwargs)
+
+
+class AsyncInMemoryApiClient(InMemoryApiClient):
+    """Awaitable InMemoryApiClient for AsyncQuayGateway (the ASYNC_IO path)."""
+
+    async def __aenter__(self) -> "AsyncInMemoryApiClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def get(self, endpoint, **kwargs):
+        return self._request("GET", endpoint, **kwargs)
+
+    async def post(self, endpoint, **kwargs):
+        return self._request("POST", endpoint, **kwargs)
+
+    async def put(self, endpoint, **kwargs):
+        return self._request("PUT", endpoint, **kwargs)
+
+    async def delete(self, endpoint, **kwargs):
+        return self._request("DELETE", endpoint, **kwargs)
+
+
+class InMemoryQuayGateway(QuayGateway):
+    """QuayGateway whose requests are answered from `state` (a fresh QuayState by default)."""
+
+    def __init__(self, state: Optional[QuayState] = None):
+        super().__init__(InMemoryApiClient(state))
+        self.state = self.client.state
+
+    @property
+    def calls(self) -> Dict[str, int]:
+        return self.client.calls
+
+    def async_client(self, limit: Optional[int] = None) -> AsyncInMemoryApiClient:
+        """Client for the executor's event loop, sharing this gateway's state and call counts."""
+        client = AsyncInMemoryApiClient(self.state)
+        client.calls = self.client.calls
+        client._lock = self.client._lock
+        return client
@@ -1,4 +1,4 @@
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel
 
@@ -37,6 +37,15 @@ class RemoveTeamMember(BaseModel):
     model_config = {"extra": "ignore"}
 
 
+class ReconcileTeamMembers(BaseModel):
+    team_name: str
+    members: List[str]
+    remove_unlisted: bool = True
+    max_parallel: int = 1
+
+    model_config = {"extra": "ignore"}
+
+
 class TeamResponse(BaseModel):
     name: str
     role: Optional[str] = None
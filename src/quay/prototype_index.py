@@ -0,0 +1,131 @@
+"""Run-scoped index of default permission prototypes per organization."""
+
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from quay.state_snapshot import unwrap_list
+from utils.logger import Logger as log
+
+Delegate = Tuple[Optional[str], Optional[str]]
+
+
+def delegate_of(entry: dict) -> Delegate:
+    """(kind, name) of a prototype entry's delegate."""
+    delegate = entry.get("delegate") or {}
+    return delegate.get("kind"), delegate.get("name")
+
+
+def prototype_id(entry: dict) -> Optional[str]:
+    return entry.get("id") or entry.get("prototypes_id")
+
+
+class PrototypeIndex:
+    """Singleton map of organization -> (kind, name) -> role -> [prototype entries].
+
+    An organization's prototypes are listed once per run, on first use
+    (or primed from the plan-mode snapshot), and the index is kept current
+    with add() / remove() after each POST or DELETE. Setting or removing N
+    default permissions in one organization therefore costs one list call
+    plus N writes. Concurrent loads of the same organization wait on a
+    per-organization lock (an asyncio lock for load_async); a failed load
+    is not cached.
+    """
+
+    _instance: Optional["PrototypeIndex"] = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls) -> "PrototypeIndex":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._orgs: Dict[str, Dict[Delegate, Dict[str, List[dict]]]] = {}
+                    instance._org_locks: Dict[str, threading.Lock] = {}
+                    instance._async_org_locks: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
+                    instance._lock = threading.Lock()
+                    cls._instance = instance
+        return cls._instance
+
+    def load(self, organization: str, fetch: Callable[[], object]) -> None:
+        """Index the organization's prototypes, calling fetch() (list_prototypes) if not loaded yet."""
+        with self._lock:
+            if organization in self._orgs:
+                return
+            org_lock = self._org_locks.setdefault(organization, threading.Lock())
+
+        with org_lock:
+            with self._lock:
+                if organization in self._orgs:
+                    return
+            self.prime(organization, unwrap_list(fetch(), "prototypes"))
+
+    async def load_async(self, organization: str, fetch: Callable[[], Awaitable[object]]) -> None:
+        """Awaitable load: index the organization's prototypes, awaiting fetch() if not loaded yet."""
+        with self._lock:
+            if organization in self._orgs:
+                return
+            org_lock = self._async_org_lock(organization)
+
+        async with org_lock:
+            with self._lock:
+                if organization in self._orgs:
+                    return
+            self.prime(organization, unwrap_list(await fetch(), "prototypes"))
+
+    def _async_org_lock(self, organization: str) -> asyncio.Lock:
+        # asyncio locks belong to one loop; each async step runs its own loop
+        loop = asyncio.get_running_loop()
+        entry = self._async_org_locks.get(organization)
+        if entry is None or entry[0] is not loop:
+            entry = (loop, asyncio.Lock())
+            self._async_org_locks[organization] = entry
+        return entry[1]
+
+    def prime(self, organization: str, entries: List[dict]) -> None:
+        """Replace the index of an organization with a known prototype list."""
+        index: Dict[Delegate, Dict[str, List[dict]]] = {}
+        for entry in entries:
+            if isinstance(entry, dict):
+                index.setdefault(delegate_of(entry), {}).setdefault(entry.get("role"), []).append(entry)
+        with self._lock:
+            self._orgs[organization] = index
+        log.debug("PrototypeIndex", "Indexed %s prototypes of %s", len(entries), organization)
+
+    def find(self, organization: str, kind: str, name: str, role: Optional[str] = None) -> List[dict]:
+        """Prototypes of a loaded organization for a delegate; role=None matches any role."""
+        with self._lock:
+            roles = self._orgs.get(organization, {}).get((kind, name), {})
+            if role is not None:
+                return list(roles.get(role, []))
+            return [entry for entries in roles.values() for entry in entries]
+
+    def add(self, organization: str, entry: dict) -> None:
+        """Record a prototype created by a POST."""
+        with self._lock:
+            index = self._orgs.get(organization)
+            if index is not None:
+                index.setdefault(delegate_of(entry), {}).setdefault(entry.get("role"), []).append(entry)
+
+    def remove(self, organization: str, entry: dict) -> None:
+        """Forget a prototype deleted by a DELETE."""
+        proto_id = prototype_id(entry)
+        if proto_id is None:
+            return
+        with self._lock:
+            roles = self._orgs.get(organization, {}).get(delegate_of(entry))
+            if not roles or entry.get("role") not in roles:
+                return
+            role = entry.get("role")
+            roles[role] = [e for e in roles[role] if prototype_id(e) != proto_id]
+            if not roles[role]:
+                del roles[role]
+
+    def invalidate(self, organization: str) -> None:
+        with self._lock:
+            self._orgs.pop(organization, None)
+
+    @classmethod
+    def reset(cls) -> None:
+        """Reset the singleton instance (called at the start of each run)."""
+        cls._instance = None
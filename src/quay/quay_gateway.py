@@ -1,3 +1,5 @@
+import threading
+from typing import Optional
 from urllib.parse import quote
 
 from quay.exceptions import (
@@ -16,23 +18,86 @@ def _safe_path(value: str) -> str:
     return quote(value, safe="")
 
 
+def _response_body(e: Exception) -> str:
+    """Body of the HTTP response attached to an exception, if any."""
+    if hasattr(e, "response") and e.response is not None:
+        try:
+            return e.response.text
+        except Exception:
+            pass
+    return ""
+
+
+def _robot_create_failure(e: Exception, organization: str, robot_shortname: str) -> dict:
+    """Translate a failed robot PUT into a domain error (or a pre-check miss result)."""
+    # Check both exception message and response body (if available)
+    msg = str(e)
+    response_body = _response_body(e)
+    full_msg = f"{msg} {response_body}"
+
+    if "Existing robot with name" in full_msg:
+        raise RobotAlreadyExistsError(
+            f"Robot {robot_shortname} already exists in {organization}",
+            response_body=response_body
+        ) from e
+    if "Could not find robot" in full_msg:
+        # Pre-check failed but creation might still succeed
+        return {
+            "created": True,
+            "robot": f"{organization}+{robot_shortname}",
+            "reason": "precheck_missing"
+        }
+    raise QuayApiError(f"Failed to create robot: {msg}") from e
+
+
+def _team_create_failure(e: Exception, organization: str, team_name: str) -> None:
+    """Translate a failed team PUT into a domain error."""
+    msg = str(e)
+    response_body = _response_body(e)
+    full_msg = f"{msg} {response_body}"
+
+    if "Team already exists" in full_msg or "already exists" in full_msg.lower():
+        raise TeamAlreadyExistsError(
+            f"Team {team_name} already exists in {organization}",
+            response_body=response_body
+        ) from e
+    raise QuayApiError(f"Failed to create team: {msg}") from e
+
+
 class QuayGateway:
+    _shared: Optional["QuayGateway"] = None
+    _shared_lock = threading.Lock()
+
     def __init__(self, client=None):
         self.client = client or ApiClient()
 
+    @staticmethod
+    def shared() -> "QuayGateway":
+        """Gateway for code without an injected one (the actions' exists() helpers)."""
+        if QuayGateway._shared is None:
+            with QuayGateway._shared_lock:
+                if QuayGateway._shared is None:
+                    QuayGateway._shared = QuayGateway()
+        return QuayGateway._shared
+
+    @staticmethod
+    def use(gateway: Optional["QuayGateway"]) -> None:
+        """Make `gateway` the shared one; None goes back to a default QuayGateway."""
+        QuayGateway._shared = gateway
+
     def create_organization(self, name: str, email: str = None):
         payload = {"name": name}
         if email:
             payload["email"] = email
-        log.debug("QuayGateway", f"create_organization name={name} email={email}")
+        log.debug("QuayGateway", "create_organization name=%s email=%s", name, email)
         return self.client.post("/organization/", json=payload)
 
     def delete_organization(self, name: str):
-        log.debug("QuayGateway", f"delete_organization name={name}")
+        log.debug("QuayGateway", "delete_organization name=%s", name)
         return self.client.delete(f"/organization/{_safe_path(name)}")
 
     def get_organization(self, name: str):
-        log.debug("QuayGateway", f"get_organization name={name}")
+        log.debug("QuayGateway", "get_organization name=%s", name)
         return self.client.get(f"/organization/{_safe_path(name)}")
 
     def list_organizations(self):
@@ -41,7 +106,7 @@ class QuayGateway:
 
     def create_robot_account(self, organization: str, robot_shortname: str, description: str | None = None):
         payload = {"description": description}
-        log.debug("QuayGateway", f"create_robot_account org={organization} robot={robot_shortname}")
+        log.debug("QuayGateway", "create_robot_account org=%s robot=%s", organization, robot_shortname)
         safe_org = _safe_path(organization)
         safe_robot = _safe_path(robot_shortname)
         try:
@@ -50,39 +115,16 @@ class QuayGateway:
                 json=payload
             )
         except Exception as e:
-            # Check both exception message and response body (if available)
-            msg = str(e)
-            response_body = ""
-            if hasattr(e, "response") and e.response is not None:
-                try:
-                    response_body = e.response.text
-                except Exception:
-                    pass
-
-            full_msg = f"{msg} {response_body}"
-
-            if "Existing robot with name" in full_msg:
-                raise RobotAlreadyExistsError(
-                    f"Robot {robot_shortname} already exists in {organization}",
-                    response_body=response_body
-                ) from e
-            if "Could not find robot" in full_msg:
-                # Pre-check failed but creation might still succeed
-                return {
-                    "created": True,
-                    "robot": f"{organization}+{robot_shortname}",
-                    "reason": "precheck_missing"
-                }
-            raise QuayApiError(f"Failed to create robot: {msg}") from e
+            return _robot_create_failure(e, organization, robot_shortname)
 
     def delete_robot_account(self, organization: str, robot_shortname: str):
-        log.debug("QuayGateway", f"delete_robot_account org={organization} robot={robot_shortname}")
+        log.debug("QuayGateway", "delete_robot_account org=%s robot=%s", organization, robot_shortname)
         safe_org = _safe_path(organization)
         safe_robot = _safe_path(robot_shortname)
         return self.client.delete(f"/organization/{safe_org}/robots/{safe_robot}")
 
     def get_robot_account(self, organization: str, robot_shortname: str):
-        log.debug("QuayGateway", f"get_robot_account org={organization} robot={robot_shortname}")
+        log.debug("QuayGateway", "get_robot_account org=%s robot=%s", organization, robot_shortname)
         safe_org = _safe_path(organization)
         safe_robot = _safe_path(robot_shortname)
         result = self.client.get(f"/organization/{safe_org}/robots/{safe_robot}")
@@ -94,7 +136,7 @@ class QuayGateway:
         return result
 
     def list_robot_accounts(self, organization: str):
-        log.debug("QuayGateway", f"list_robot_accounts org={organization}")
+        log.debug("QuayGateway", "list_robot_accounts org=%s", organization)
         safe_org = _safe_path(organization)
         return self.client.get(f"/organization/{safe_org}/robots/")
 
@@ -104,7 +146,7 @@ class QuayGateway:
         payload = {"role": role}
         if description:
             payload["description"] = description
-        log.debug("QuayGateway", f"create_team org={organization} team={team_name} role={role}")
+        log.debug("QuayGateway", "create_team org=%s team=%s role=%s", organization, team_name, role)
         safe_org = _safe_path(organization)
         safe_team = _safe_path(team_name)
         try:
@@ -113,25 +155,10 @@ class QuayGateway:
                 json=payload
             )
         except Exception as e:
-            msg = str(e)
-            response_body = ""
-            if hasattr(e, "response") and e.response is not None:
-                try:
-                    response_body = e.response.text
-                except Exception:
-                    pass
-
-            full_msg = f"{msg} {response_body}"
-
-            if "Team already exists" in full_msg or "already exists" in full_msg.lower():
-                raise TeamAlreadyExistsError(
-                    f"Team {team_name} already exists in {organization}",
-                    response_body=response_body
-                ) from e
-            raise QuayApiError(f"Failed to create team: {msg}") from e
+            _team_create_failure(e, organization, team_name)
 
     def get_team(self, organization: str, team_name: str):
-        log.debug("QuayGateway", f"get_team org={organization} team={team_name}")
+        log.debug("QuayGateway", "get_team org=%s team=%s", organization, team_name)
         safe_org = _safe_path(organization)
         safe_team = _safe_path(team_name)
         result = self.client.get(f"/organization/{safe_org}/team/{safe_team}/members")
@@ -143,34 +170,34 @@ class QuayGateway:
         return result
 
     def delete_team(self, organization: str, team_name: str):
-        log.debug("QuayGateway", f"delete_team org={organization} team={team_name}")
+        log.debug("QuayGateway", "delete_team org=%s team=%s", organization, team_name)
         safe_org = _safe_path(organization)
         safe_team = _safe_path(team_name)
         return self.client.delete(f"/organization/{safe_org}/team/{safe_team}")
 
     def add_team_member(self, organization: str, team_name: str, member_name: str):
-        log.debug("QuayGateway", f"add_team_member org={organization} team={team_name} member={member_name}")
+        log.debug("QuayGateway", "add_team_member org=%s team=%s member=%s", organization, team_name, member_name)
         safe_org = _safe_path(organization)
         safe_team = _safe_path(team_name)
         safe_member = _safe_path(member_name)
         return self.client.put(f"/organization/{safe_org}/team/{safe_team}/members/{safe_member}")
 
     def remove_team_member(self, organization: str, team_name: str, member_name: str):
-        log.debug("QuayGateway", f"remove_team_member org={organization} team={team_name} member={member_name}")
+        log.debug("QuayGateway", "remove_team_member org=%s team=%s member=%s", organization, team_name, member_name)
         safe_org = _safe_path(organization)
         safe_team = _safe_path(team_name)
         safe_member = _safe_path(member_name)
         return self.client.delete(f"/organization/{safe_org}/team/{safe_team}/members/{safe_member}")
 
     def invite_team_member(self, organization: str, team_name: str, email: str):
-        log.debug("QuayGateway", f"invite_team_member org={organization} team={team_name} email={email}")
+        log.debug("QuayGateway", "invite_team_member org=%s team=%s email=%s", organization, team_name, email)
         safe_org = _safe_path(organization)
         safe_team = _safe_path(team_name)
         safe_email = quote(email, safe="")
         return self.client.put(f"/organization/{safe_org}/team/{safe_team}/invite/{safe_email}")
 
     def delete_team_invite(self, organization: str, team_name: str, email: str):
-        log.debug("QuayGateway", f"delete_team_invite org={organization} team={team_name} email={email}")
+        log.debug("QuayGateway", "delete_team_invite org=%s team=%s email=%s", organization, team_name, email)
         safe_org = _safe_path(organization)
         safe_team = _safe_path(team_name)
         safe_email = quote(email, safe="")
@@ -185,7 +212,8 @@ class QuayGateway:
     ):
         log.debug(
             "QuayGateway",
-            f"set_team_repository_permission org={organization} team={team_name} repo={repository} permission={permission}"
+            "set_team_repository_permission org=%s team=%s repo=%s permission=%s",
+            organization, team_name, repository, permission
         )
         safe_org = _safe_path(organization)
         safe_team = _safe_path(team_name)
@@ -197,14 +225,18 @@ class QuayGateway:
         )
 
     def remove_team_repository_permission(self, organization: str, team_name: str, repository: str):
-        log.debug("QuayGateway", f"remove_team_repository_permission org={organization} team={team_name} repo={repository}")
+        log.debug(
+            "QuayGateway",
+            "remove_team_repository_permission org=%s team=%s repo=%s",
+            organization, team_name, repository
+        )
         safe_org = _safe_path(organization)
         safe_team = _safe_path(team_name)
         safe_repo = _safe_path(repository)
         return self.client.delete(f"/organization/{safe_org}/team/{safe_team}/repositories/{safe_repo}")
 
     def list_prototypes(self, organization: str):
-        log.debug("QuayGateway", f"list_prototypes org={organization}")
+        log.debug("QuayGateway", "list_prototypes org=%s", organization)
         safe_org = _safe_path(organization)
         return self.client.get(f"/organization/{safe_org}/prototypes")
 
@@ -217,7 +249,8 @@ class QuayGateway:
     ):
         log.debug(
             "QuayGateway",
-            f"set_default_repository_permission org={organization} delegate={delegate} role={role} user={activating_user}"
+            "set_default_repository_permission org=%s delegate=%s role=%s user=%s",
+            organization, delegate, role, activating_user
         )
         safe_org = _safe_path(organization)
         payload = {"delegate": delegate, "role": role}
@@ -229,7 +262,7 @@ class QuayGateway:
         )
 
     def delete_prototype(self, organization: str, prototype_id: str):
-        log.debug("QuayGateway", f"delete_prototype org={organization} prototype_id={prototype_id}")
+        log.debug("QuayGateway", "delete_prototype org=%s prototype_id=%s", organization, prototype_id)
         safe_org = _safe_path(organization)
         safe_id = _safe_path(str(prototype_id))
         return self.client.delete(f"/organization/{safe_org}/prototypes/{safe_id}")
@@ -237,21 +270,21 @@ class QuayGateway:
     def sync_team_ldap(self, organization: str, team_name: str, group_dn: str):
         """Enable LDAP sync for a team with the specified LDAP group DN."""
         payload = {"group_dn": group_dn}
-        log.debug("QuayGateway", f"sync_team_ldap org={organization} team={team_name} group_dn={group_dn}")
+        log.debug("QuayGateway", "sync_team_ldap org=%s team=%s group_dn=%s", organization, team_name, group_dn)
         safe_org = _safe_path(organization)
         safe_team = _safe_path(team_name)
         return self.client.post(f"/organization/{safe_org}/team/{safe_team}/syncing", json=payload)
 
     def unsync_team_ldap(self, organization: str, team_name: str):
         """Disable LDAP sync for a team."""
-        log.debug("QuayGateway", f"unsync_team_ldap org={organization} team={team_name}")
+        log.debug("QuayGateway", "unsync_team_ldap org=%s team=%s", organization, team_name)
         safe_org = _safe_path(organization)
         safe_team = _safe_path(team_name)
         return self.client.delete(f"/organization/{safe_org}/team/{safe_team}/syncing")
 
     def get_team_sync_status(self, organization: str, team_name: str):
         """Get LDAP sync status for a team."""
-        log.debug("QuayGateway", f"get_team_sync_status org={organization} team={team_name}")
+        log.debug("QuayGateway", "get_team_sync_status org=%s team=%s", organization, team_name)
         safe_org = _safe_path(organization)
         safe_team = _safe_path(team_name)
         return self.client.get(f"/organization/{safe_org}/team/{safe_team}/syncing")
@@ -0,0 +1,141 @@
+"""Read and write StateSnapshot results as JSON lines or msgpack."""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+from quay.state_snapshot import OrganizationState, TeamState
+from utils.logger import Logger as log
+
+FORMATS = ("jsonl", "msgpack")
+SNAPSHOT_VERSION = 1
+
+
+def snapshot_format(path: Path) -> str:
+    """Format implied by the file extension (.msgpack/.mpk, anything else is JSON lines)."""
+    return "msgpack" if Path(path).suffix in (".msgpack", ".mpk") else "jsonl"
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ValueError("msgpack snapshots require the 'msgpack' package (pip install msgpack)") from e
+    return msgpack
+
+
+def _sorted(values) -> Optional[list]:
+    return None if values is None else sorted(values)
+
+
+def state_to_record(state: OrganizationState) -> dict:
+    """Plain dict of an OrganizationState; None still means "not fetched"."""
+    return {
+        "type": "organization",
+        "name": state.name,
+        "exists": state.exists,
+        "robots": _sorted(state.robots),
+        "prototypes": state.prototypes,
+        "teams": {
+            name: None if team is None else {
+                "role": team.role,
+                "members": _sorted(team.members),
+                "sync_group_dn": team.sync_group_dn
+            }
+            for name, team in sorted(state.teams.items())
+        }
+    }
+
+
+def state_from_record(record: dict) -> OrganizationState:
+    teams = {}
+    for name, team in (record.get("teams") or {}).items():
+        teams[name] = None if team is None else TeamState(
+            name=name,
+            role=team.get("role"),
+            members=None if team.get("members") is None else set(team["members"]),
+            sync_group_dn=team.get("sync_group_dn")
+        )
+    robots = record.get("robots")
+    return OrganizationState(
+        name=record["name"],
+        exists=record["exists"],
+        robots=None if robots is None else set(robots),
+        teams=teams,
+        prototypes=record.get("prototypes")
+    )
+
+
+def write_snapshot(
+    states: Dict[str, OrganizationState],
+    path: Path,
+    fmt: Optional[str] = None,
+    parts: Iterable[str] = (),
+    source: str = ""
+) -> int:
+    """Write a header record plus one record per organization; returns bytes written.
+
+    The file is written next to its destination and renamed into place, so
+    readers never see a partial snapshot.
+    """
+    path = Path(path)
+    fmt = fmt or snapshot_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown snapshot format '{fmt}', expected one of {', '.join(FORMATS)}")
+
+    header = {
+        "type": "header",
+        "version": SNAPSHOT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "source": source,
+        "parts": sorted(parts),
+        "organizations": len(states)
+    }
+    records = [header] + [state_to_record(states[name]) for name in sorted(states)]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    if fmt == "msgpack":
+        packer = _msgpack().Packer()
+        with open(tmp, "wb") as f:
+            for record in records:
+                f.write(packer.pack(record))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+    os.replace(tmp, path)
+
+    size = path.stat().st_size
+    log.debug("SnapshotFile", "Wrote %s organizations to %s (%s, %s bytes)", len(states), path, fmt, size)
+    return size
+
+
+def _records(path: Path, fmt: str) -> Iterator[dict]:
+    if fmt == "msgpack":
+        with open(path, "rb") as f:
+            yield from _msgpack().Unpacker(f, raw=False)
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_snapshot(path: Path, fmt: Optional[str] = None) -> Dict[str, OrganizationState]:
+    """Load a snapshot file written by write_snapshot."""
+    path = Path(path)
+    fmt = fmt or snapshot_format(path)
+    states = {}
+    for record in _records(path, fmt):
+        if record.get("type") == "header":
+            if record.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported snapshot version {record.get('version')} in {path}")
+            continue
+        if record.get("type") == "organization":
+            state = state_from_record(record)
+            states[state.name] = state
+    log.debug("SnapshotFile", "Read %s organizations from %s", len(states), path)
+    return states
@@ -0,0 +1,142 @@
+"""Bulk read-only snapshot of Quay organization state."""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+from quay.exceptions import TeamNotFoundError
+from utils.logger import Logger as log
+
+# Parts of the organization state that can be fetched
+SNAPSHOT_PARTS = {"robots", "members", "prototypes", "sync"}
+
+
+@dataclass
+class TeamState:
+    """State of a single team. None means the value was not fetched."""
+    name: str
+    role: Optional[str] = None
+    members: Optional[Set[str]] = None
+    sync_group_dn: Optional[str] = None
+
+
+@dataclass
+class OrganizationState:
+    """State of a single organization. None means the value was not fetched."""
+    name: str
+    exists: bool
+    robots: Optional[Set[str]] = None
+    teams: Dict[str, Optional[TeamState]] = field(default_factory=dict)
+    prototypes: Optional[List[dict]] = None
+
+
+def unwrap_list(result, key: str) -> list:
+    """Quay list endpoints return either a bare list or {key: [...]}."""
+    if isinstance(result, dict):
+        return result.get(key) or []
+    return result or []
+
+
+def sync_group_dn(status) -> Optional[str]:
+    """Extract the LDAP group DN from a team sync status response."""
+    if not isinstance(status, dict):
+        return None
+    return status.get("group_dn") or (status.get("config") or {}).get("group_dn")
+
+
+class StateSnapshot:
+    """Fetch the current state of many organizations concurrently.
+
+    Each organization is crawled by one worker; a failure while crawling an
+    organization is logged and the organization is left out of the result,
+    so callers must treat missing entries as "unknown".
+    """
+
+    def __init__(self, gateway, max_workers: int = 1):
+        self.gateway = gateway
+        self.max_workers = max(1, max_workers)
+
+    def fetch(
+        self,
+        organizations: Dict[str, Optional[Iterable[str]]],
+        parts: Iterable[str] = SNAPSHOT_PARTS
+    ) -> Dict[str, OrganizationState]:
+        """Fetch state for organizations.
+
+        Args:
+            organizations: Organization name -> team names to inspect
+                (None = every team the organization lists)
+            parts: Subset of SNAPSHOT_PARTS to fetch besides existence
+
+        Returns:
+            Organization name -> OrganizationState for every org crawled successfully
+        """
+        parts = set(parts)
+        log.debug("StateSnapshot", "Fetching %s organizations parts=%s", len(organizations), sorted(parts))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="snapshot") as pool:
+            futures = {
+                org: pool.submit(self._fetch_organization, org, None if teams is None else set(teams), parts)
+                for org, teams in organizations.items()
+            }
+
+        states = {}
+        for org, future in futures.items():
+            try:
+                states[org] = future.result()
+            except Exception as e:
+                log.error("StateSnapshot", f"Failed to snapshot organization '{org}': {e}")
+        return states
+
+    def _fetch_organization(self, name: str, teams: Optional[Set[str]], parts: Set[str]) -> OrganizationState:
+        org = self.gateway.get_organization(name)
+        if org is None:
+            return OrganizationState(
+                name=name,
+                exists=False,
+                robots=set(),
+                teams={team: None for team in teams or ()},
+                prototypes=[]
+            )
+
+        state = OrganizationState(name=name, exists=True)
+        known_teams = org.get("teams") if isinstance(org, dict) else None
+        if teams is None:
+            teams = set(known_teams) if isinstance(known_teams, dict) else set()
+
+        if "robots" in parts:
+            robots = unwrap_list(self.gateway.list_robot_accounts(name), "robots")
+            state.robots = {r.get("name") for r in robots if isinstance(r, dict)}
+
+        if "prototypes" in parts:
+            state.prototypes = unwrap_list(self.gateway.list_prototypes(name), "prototypes")
+
+        for team in sorted(teams):
+            state.teams[team] = self._fetch_team(name, team, known_teams, parts)
+
+        return state
+
+    def _fetch_team(self, org: str, team: str, known_teams, parts: Set[str]) -> Optional[TeamState]:
+        if isinstance(known_teams, dict) and team not in known_teams:
+            return None
+
+        role = None
+        if isinstance(known_teams, dict):
+            role = (known_teams.get(team) or {}).get("role")
+        state = TeamState(name=team, role=role)
+
+        if "members" in parts or not isinstance(known_teams, dict):
+            try:
+                result = self.gateway.get_team(org, team)
+            except TeamNotFoundError:
+                return None
+            members = unwrap_list(result, "members")
+            state.members = {m.get("name") for m in members if isinstance(m, dict)}
+
+        if "sync" in parts:
+            try:
+                state.sync_group_dn = sync_group_dn(self.gateway.get_team_sync_status(org, team))
+            except Exception as e:
+                log.debug("StateSnapshot", "No sync status for %s/%s: %s", org, team, e)
+
+        return state
@@ -1,8 +1,15 @@
 """Display utilities for pipeline execution visualization."""
 
+import heapq
+import re
 import sys
+import threading
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from utils.logger import Logger
 
 
 # ANSI Colors
@@ -54,37 +61,100 @@ class PipelineStats:
     successful_steps: int = 0
     failed_steps: int = 0
     skipped_steps: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    redirects_avoided: int = 0
+    retries: Dict[str, int] = field(default_factory=dict)
+    endpoints: Dict[str, dict] = field(default_factory=dict)
+    concurrency: Dict[str, List[Tuple[float, int]]] = field(default_factory=dict)
+    first_org_ready: Optional[float] = None
     results: List[StepResult] = field(default_factory=list)
+    items: Dict[str, Dict[str, int]] = field(default_factory=dict)  # step -> succeeded/failed/skipped
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     def add_result(self, result: StepResult):
-        self.results.append(result)
-        self.completed_steps += 1
-        if result.success:
-            self.successful_steps += 1
-        else:
-            self.failed_steps += 1
+        """Record a finished step (called from DAG worker threads)."""
+        with self._lock:
+            self.results.append(result)
+            self.completed_steps += 1
+            if result.success:
+                self.successful_steps += 1
+            else:
+                self.failed_steps += 1
+
+    def count_items(self, step: str, outcome: str, count: int = 1):
+        """Add params_list items of a step by outcome (called from worker threads)."""
+        with self._lock:
+            counts = self.items.setdefault(step, {})
+            counts[outcome] = counts.get(outcome, 0) + count
+
+
+# Step label of the current thread, see Display.step_label()
+_thread = threading.local()
+
+_ANSI = re.compile(r"\033\[[0-9;]*[A-Za-z]")
+_RULE_CHARS = set("─ ")
+
+
+def _print(text: str = "", end: str = "\n", level: str = "INFO") -> None:
+    """print() for Display; with LOG_FORMAT=json every non-blank line becomes a log record instead."""
+    if not Logger.JSON:
+        print(text, end=end)
+        return
+    for line in _ANSI.sub("", text).splitlines():
+        line = line.strip()
+        if line and not set(line) <= _RULE_CHARS:
+            Logger.log(level, "Display", line)
+
+
+def _tag() -> str:
+    label = getattr(_thread, "label", None)
+    return f"{Colors.CYAN}[{label}]{Colors.RESET} " if label else ""
 
 
 class Display:
     """Handles all visual output for the pipeline."""
 
+    @staticmethod
+    @contextmanager
+    def step_label(name: str):
+        """Prefix this thread's per-step lines with [name], for steps running side by side."""
+        previous = getattr(_thread, "label", None)
+        _thread.label = name
+        try:
+            yield
+        finally:
+            _thread.label = previous
+
     @staticmethod
     def banner(version: str, debug: bool = False):
         """Print startup banner with config info."""
-        print(f"{Colors.CYAN}{BANNER}{Colors.RESET}")
-        print(f"{Colors.DIM}{'─' * 60}{Colors.RESET}")
-        print(f"  {Colors.BOLD}Version:{Colors.RESET} {version}")
-        print(f"  {Colors.BOLD}Debug:{Colors.RESET}   {'enabled' if debug else 'disabled'}")
-        print(f"{Colors.DIM}{'─' * 60}{Colors.RESET}")
-        print()
+        if not Logger.JSON:
+            _print(f"{Colors.CYAN}{BANNER}{Colors.RESET}")
+        _print(f"{Colors.DIM}{'─' * 60}{Colors.RESET}")
+        _print(f"  {Colors.BOLD}Version:{Colors.RESET} {version}")
+        _print(f"  {Colors.BOLD}Debug:{Colors.RESET}   {'enabled' if debug else 'disabled'}")
+        _print(f"{Colors.DIM}{'─' * 60}{Colors.RESET}")
+        _print()
+
+    @staticmethod
+    def startup_timing(phases: List[Tuple[str, float]], actions: Dict[str, float]):
+        """Print the start-up time breakdown (debug mode)."""
+        _print(f"{Colors.DIM}Start-up:{Colors.RESET}")
+        for name, seconds in phases:
+            _print(f"  {Colors.DIM}{name:<26} {seconds * 1000:7.1f}ms{Colors.RESET}")
+        if actions:
+            loaded = ", ".join(f"{job} {seconds * 1000:.1f}ms" for job, seconds in actions.items())
+            _print(f"  {Colors.DIM}{'action imports':<26} {sum(actions.values()) * 1000:7.1f}ms ({loaded}){Colors.RESET}")
+        _print()
 
     @staticmethod
     def pipeline_start(pipeline_file: str, total_steps: int):
         """Print pipeline start info."""
-        print(f"{Colors.BLUE}{Colors.BOLD}Pipeline:{Colors.RESET} {pipeline_file}")
-        print(f"{Colors.BLUE}{Colors.BOLD}Steps:{Colors.RESET}    {total_steps}")
-        print()
-        print(f"{Colors.DIM}{'─' * 60}{Colors.RESET}")
+        _print(f"{Colors.BLUE}{Colors.BOLD}Pipeline:{Colors.RESET} {pipeline_file}")
+        _print(f"{Colors.BLUE}{Colors.BOLD}Steps:{Colors.RESET}    {total_steps}")
+        _print()
+        _print(f"{Colors.DIM}{'─' * 60}{Colors.RESET}")
 
     @staticmethod
     def step_start(step_num: int, total: int, name: str, job: str):
@@ -92,10 +162,10 @@ class Display:
         progress = f"[{step_num}/{total}]"
         bar_width = 20
         filled = int(bar_width * step_num / total)
-        bar = "█" * filled + "░" * (bar_width - filled)
+        bar = "█" * filled + "░" * (bar_width - filled) + " " if not Logger.JSON else ""
 
-        print(f"\n{Colors.CYAN}{progress}{Colors.RESET} {bar} {Colors.BOLD}{name}{Colors.RESET}")
-        print(f"    {Colors.DIM}Job: {job}{Colors.RESET}")
+        _print(f"\n{Colors.CYAN}{progress}{Colors.RESET} {bar}{Colors.BOLD}{name}{Colors.RESET}")
+        _print(f"    {_tag()}{Colors.DIM}Job: {job}{Colors.RESET}")
 
     @staticmethod
     def step_result(success: bool, message: Optional[str] = None, duration: float = 0.0):
@@ -106,70 +176,177 @@ class Display:
             status = f"{Colors.RED}✗ FAILED{Colors.RESET}"
 
         duration_str = f"{Colors.DIM}({duration:.2f}s){Colors.RESET}" if duration > 0 else ""
-        print(f"    {status} {duration_str}")
+        _print(f"    {_tag()}{status} {duration_str}", level="INFO" if success else "ERROR")
 
         if message and not success:
-            print(f"    {Colors.RED}{message}{Colors.RESET}")
+            _print(f"    {_tag()}{Colors.RED}{message}{Colors.RESET}", level="ERROR")
 
     @staticmethod
     def step_skipped(step_num: int, total: int, name: str):
         """Print skipped step."""
         progress = f"[{step_num}/{total}]"
-        print(f"\n{Colors.DIM}{progress} {name} - SKIPPED{Colors.RESET}")
+        _print(f"\n{Colors.DIM}{progress} {name} - SKIPPED{Colors.RESET}")
 
     @staticmethod
     def dynamic_iteration(current: int, total: int, params: dict):
         """Print dynamic iteration progress."""
-        print(f"      {Colors.DIM}Iteration {current}/{total}{Colors.RESET}", end="")
+        if Logger.JSON or _tag():
+            # Another step may print before the result; write the whole line then
+            _thread.iteration = (current, total)
+            return
+        _print(f"      {Colors.DIM}Iteration {current}/{total}{Colors.RESET}", end="")
         sys.stdout.flush()
 
     @staticmethod
     def dynamic_iteration_result(success: bool):
         """Print dynamic iteration result inline."""
+        if Logger.JSON or _tag():
+            Display.iteration_line(*_thread.iteration, success)
+        elif success:
+            _print(f" {Colors.GREEN}✓{Colors.RESET}")
+        else:
+            _print(f" {Colors.RED}✗{Colors.RESET}")
+
+    @staticmethod
+    def iteration_line(current: int, total: int, success: bool):
+        """Print a finished iteration as one line (safe when steps run concurrently)."""
+        mark = f"{Colors.GREEN}✓{Colors.RESET}" if success else f"{Colors.RED}✗{Colors.RESET}"
+        _print(f"      {_tag()}{Colors.DIM}Iteration {current}/{total}{Colors.RESET} {mark}")
+
+    @staticmethod
+    def resume_skipped(count: int):
+        """Print how many items of a step were already completed by a previous run."""
+        _print(f"    {_tag()}{Colors.DIM}↷ {count} item(s) completed in a previous run (journal){Colors.RESET}")
+
+    @staticmethod
+    def unchanged_skipped(count: int):
+        """Print how many items of a step are unchanged since they were last applied."""
+        _print(f"    {_tag()}{Colors.DIM}↷ {count} item(s) unchanged since last applied (state store){Colors.RESET}")
+
+    @staticmethod
+    def stream_start(step_names: List[str], organizations: int, workers: int):
+        """Print the header of a streamed run of steps."""
+        _print(f"\n{Colors.CYAN}⇶ Streaming{Colors.RESET} {Colors.BOLD}{' → '.join(step_names)}{Colors.RESET}")
+        _print(f"    {Colors.DIM}{organizations} organizations, {workers} at a time{Colors.RESET}")
+
+    @staticmethod
+    def stream_organization(organization: str, success: bool, elapsed: float, message: Optional[str] = None):
+        """Print an organization that went through every streamed step (or stopped on a failure)."""
         if success:
-            print(f" {Colors.GREEN}✓{Colors.RESET}")
+            _print(f"      {Colors.GREEN}✓{Colors.RESET} {organization} {Colors.DIM}ready after {elapsed:.2f}s{Colors.RESET}")
         else:
-            print(f" {Colors.RED}✗{Colors.RESET}")
+            _print(f"      {Colors.RED}✗{Colors.RESET} {organization} {Colors.DIM}after {elapsed:.2f}s{Colors.RESET}"
+                   f" {Colors.RED}{message}{Colors.RESET}")
+
+    @staticmethod
+    def plan_overview(plans: dict):
+        """Print the plan computed in plan mode."""
+        _print()
+        _print(f"  {Colors.BLUE}{Colors.BOLD}Execution Plan{Colors.RESET}")
+        _print(f"  {Colors.DIM}{'─' * 40}{Colors.RESET}")
+        for plan in plans.values():
+            if not plan.planned:
+                _print(f"  {Colors.DIM}•{Colors.RESET} {plan.name}: {plan.total} item(s) {Colors.DIM}(not planned){Colors.RESET}")
+            elif plan.pending:
+                _print(f"  {Colors.YELLOW}±{Colors.RESET} {plan.name}: "
+                       f"{Colors.YELLOW}{len(plan.pending)} to apply{Colors.RESET}, {plan.in_sync} in sync")
+            else:
+                _print(f"  {Colors.GREEN}={Colors.RESET} {plan.name}: {Colors.GREEN}{plan.in_sync} in sync{Colors.RESET}")
+        _print(f"  {Colors.DIM}{'─' * 40}{Colors.RESET}")
+        _print()
+
+    @staticmethod
+    def plan_skipped(count: int):
+        """Print how many items of a step were skipped because they are already applied."""
+        _print(f"      {_tag()}{Colors.DIM}↷ {count} item(s) already in sync{Colors.RESET}")
+
+    @staticmethod
+    def snapshot_written(path: str, fmt: str, written: int, requested: int, size: int, duration: float):
+        """Print the result of a snapshot export."""
+        color = Colors.GREEN if written == requested else Colors.YELLOW
+        _print(f"{color}{Colors.BOLD}Snapshot:{Colors.RESET} {path} ({fmt}, {size / 1024:.1f} KiB)")
+        _print(f"  {Colors.BOLD}Organizations:{Colors.RESET} {written}/{requested}")
+        _print(f"  {Colors.BOLD}Duration:{Colors.RESET}      {duration:.2f}s")
 
     @staticmethod
     def summary(stats: PipelineStats, duration: float):
         """Print final pipeline summary."""
-        print()
-        print(f"{Colors.DIM}{'─' * 60}{Colors.RESET}")
-        print()
+        _print()
+        _print(f"{Colors.DIM}{'─' * 60}{Colors.RESET}")
+        _print()
 
         if stats.failed_steps == 0:
             header = f"{Colors.BG_GREEN}{Colors.BLACK}{Colors.BOLD} PIPELINE SUCCESSFUL {Colors.RESET}"
         else:
             header = f"{Colors.BG_RED}{Colors.WHITE}{Colors.BOLD} PIPELINE FAILED {Colors.RESET}"
 
-        print(f"  {header}")
-        print()
-        print(f"  {Colors.BOLD}Summary:{Colors.RESET}")
-        print(f"    Total Steps:   {stats.total_steps}")
-        print(f"    {Colors.GREEN}Successful:{Colors.RESET}    {stats.successful_steps}")
+        _print(f"  {header}")
+        _print()
+        _print(f"  {Colors.BOLD}Summary:{Colors.RESET}")
+        _print(f"    Total Steps:   {stats.total_steps}")
+        _print(f"    {Colors.GREEN}Successful:{Colors.RESET}    {stats.successful_steps}")
         if stats.failed_steps > 0:
-            print(f"    {Colors.RED}Failed:{Colors.RESET}        {stats.failed_steps}")
+            _print(f"    {Colors.RED}Failed:{Colors.RESET}        {stats.failed_steps}")
         if stats.skipped_steps > 0:
-            print(f"    {Colors.YELLOW}Skipped:{Colors.RESET}       {stats.skipped_steps}")
-        print(f"    {Colors.BOLD}Duration:{Colors.RESET}      {duration:.2f}s")
-        print()
+            _print(f"    {Colors.YELLOW}Skipped:{Colors.RESET}       {stats.skipped_steps}")
+        _print(f"    {Colors.BOLD}Duration:{Colors.RESET}      {duration:.2f}s")
+        if stats.first_org_ready is not None:
+            _print(f"    {Colors.BOLD}First org:{Colors.RESET}     ready after {stats.first_org_ready:.2f}s")
+        if stats.cache_hits or stats.cache_misses:
+            _print(f"    {Colors.DIM}Lookup cache:  {stats.cache_hits} hits / {stats.cache_misses} misses{Colors.RESET}")
+        if stats.redirects_avoided:
+            _print(f"    {Colors.DIM}Redirects:     {stats.redirects_avoided} round trips saved by the redirect cache{Colors.RESET}")
+        _print()
+
+        if stats.retries:
+            _print(f"  {Colors.YELLOW}{Colors.BOLD}Retries:{Colors.RESET}")
+            for endpoint, count in sorted(stats.retries.items(), key=lambda item: -item[1]):
+                _print(f"    {count:>5}  {endpoint}")
+            _print()
+
+        if stats.endpoints:
+            Display.endpoint_table(stats.endpoints)
+
+        if stats.concurrency:
+            _print(f"  {Colors.BOLD}Adaptive Concurrency:{Colors.RESET}")
+            for step_name, history in stats.concurrency.items():
+                limits = [limit for _, limit in history]
+                timeline = " → ".join(f"{limit}@{offset:.1f}s" for offset, limit in history[-10:])
+                if len(history) > 10:
+                    timeline = "… → " + timeline
+                _print(f"    {step_name}: min {min(limits)} / max {max(limits)} / final {limits[-1]}")
+                _print(f"      {Colors.DIM}{timeline}{Colors.RESET}")
+            _print()
 
         # Show failed steps details
         failed = [r for r in stats.results if not r.success]
         if failed:
-            print(f"  {Colors.RED}{Colors.BOLD}Failed Steps:{Colors.RESET}")
+            _print(f"  {Colors.RED}{Colors.BOLD}Failed Steps:{Colors.RESET}")
             for r in failed:
-                print(f"    - {r.name}: {r.message or 'Unknown error'}")
-            print()
+                _print(f"    - {r.name}: {r.message or 'Unknown error'}")
+            _print()
+
+        _print(f"{Colors.DIM}{'─' * 60}{Colors.RESET}")
 
-        print(f"{Colors.DIM}{'─' * 60}{Colors.RESET}")
+    @staticmethod
+    def endpoint_table(endpoints: Dict[str, dict], limit: int = 10):
+        """Print request counts and latency percentiles of the endpoints with the most total time."""
+        _print(f"  {Colors.BOLD}Endpoints:{Colors.RESET} {Colors.DIM}(by total time){Colors.RESET}")
+        header = f"{'count':>7} {'errors':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'total':>8} {'KiB':>8}  endpoint"
+        _print(f"    {Colors.DIM}{header}{Colors.RESET}")
+        for key, e in list(endpoints.items())[:limit]:
+            errors = f"{Colors.RED}{e['errors']:>6}{Colors.RESET}" if e["errors"] else f"{0:>6}"
+            _print(f"    {e['count']:>7} {errors} {e['p50_seconds'] * 1000:>6.1f}ms {e['p95_seconds'] * 1000:>6.1f}ms "
+                   f"{e['p99_seconds'] * 1000:>6.1f}ms {e['total_seconds']:>7.1f}s {e['bytes'] / 1024:>8.1f}  {key}")
+        if len(endpoints) > limit:
+            _print(f"    {Colors.DIM}… {len(endpoints) - limit} more endpoint(s){Colors.RESET}")
+        _print()
 
     @staticmethod
     def curl_command(method: str, url: str, headers: dict, body: dict = None, masked: bool = True):
         """Print a copyable CURL command."""
-        print()
-        print(f"    {Colors.DIM}┌─ CURL Command ─────────────────────────{Colors.RESET}")
+        _print()
+        _print(f"    {Colors.DIM}┌─ CURL Command ─────────────────────────{Colors.RESET}")
 
         parts = [f"curl -X {method}"]
 
@@ -187,8 +364,8 @@ class Display:
 
         # Format for display
         curl_str = " \\\n      ".join(parts)
-        print(f"    {Colors.DIM}│{Colors.RESET} {Colors.YELLOW}{curl_str}{Colors.RESET}")
-        print(f"    {Colors.DIM}└────────────────────────────────────────{Colors.RESET}")
+        _print(f"    {Colors.DIM}│{Colors.RESET} {Colors.YELLOW}{curl_str}{Colors.RESET}")
+        _print(f"    {Colors.DIM}└────────────────────────────────────────{Colors.RESET}")
 
     @staticmethod
     def api_call(method: str, endpoint: str, show_curl: bool = False,
@@ -201,7 +378,7 @@ class Display:
             "DELETE": Colors.RED,
         }
         color = method_colors.get(method, Colors.WHITE)
-        print(f"      {Colors.DIM}API:{Colors.RESET} {color}{method}{Colors.RESET} {endpoint}")
+        _print(f"      {Colors.DIM}API:{Colors.RESET} {color}{method}{Colors.RESET} {endpoint}")
 
         if show_curl and url and headers:
             Display.curl_command(method, url, headers, body)
@@ -209,20 +386,20 @@ class Display:
     @staticmethod
     def inputs_overview(inputs: dict, debug: bool = False):
         """Print a formatted overview of loaded inputs."""
-        print()
-        print(f"  {Colors.MAGENTA}{Colors.BOLD}Loaded Inputs{Colors.RESET}")
-        print(f"  {Colors.DIM}{'─' * 40}{Colors.RESET}")
+        _print()
+        _print(f"  {Colors.MAGENTA}{Colors.BOLD}Loaded Inputs{Colors.RESET}")
+        _print(f"  {Colors.DIM}{'─' * 40}{Colors.RESET}")
 
         if not inputs:
-            print(f"  {Colors.DIM}No inputs loaded{Colors.RESET}")
-            print()
+            _print(f"  {Colors.DIM}No inputs loaded{Colors.RESET}")
+            _print()
             return
 
         for key, value in inputs.items():
             if isinstance(value, list):
                 count = len(value)
                 icon = "📦" if "org" in key.lower() else "🤖" if "robot" in key.lower() else "📋"
-                print(f"  {icon} {Colors.BOLD}{key}{Colors.RESET} ({Colors.CYAN}{count}{Colors.RESET} items)")
+                _print(f"  {icon} {Colors.BOLD}{key}{Colors.RESET} ({Colors.CYAN}{count}{Colors.RESET} items)")
 
                 if debug:
                     # Show detailed list in debug mode
@@ -230,14 +407,14 @@ class Display:
                         if isinstance(item, dict):
                             # Get the most important identifier
                             name = item.get("name") or item.get("robot_shortname") or item.get("id") or f"Item {i}"
-                            print(f"      {Colors.DIM}{i}.{Colors.RESET} {Colors.GREEN}{name}{Colors.RESET}")
+                            _print(f"      {Colors.DIM}{i}.{Colors.RESET} {Colors.GREEN}{name}{Colors.RESET}")
                             # Show other fields
                             for k, v in item.items():
                                 if k not in ["name", "robot_shortname", "id"]:
                                     val_str = str(v)[:30] + "..." if len(str(v)) > 30 else str(v)
-                                    print(f"         {Colors.DIM}{k}: {val_str}{Colors.RESET}")
+                                    _print(f"         {Colors.DIM}{k}: {val_str}{Colors.RESET}")
                         else:
-                            print(f"      {Colors.DIM}{i}.{Colors.RESET} {item}")
+                            _print(f"      {Colors.DIM}{i}.{Colors.RESET} {item}")
                 else:
                     # Compact view: just show names
                     names = []
@@ -251,16 +428,16 @@ class Display:
                     names_str = ", ".join(names)
                     if len(value) > 5:
                         names_str += f", ... (+{len(value) - 5} more)"
-                    print(f"      {Colors.DIM}→ {names_str}{Colors.RESET}")
+                    _print(f"      {Colors.DIM}→ {names_str}{Colors.RESET}")
 
-                print()
+                _print()
             else:
                 # Single value
-                print(f"  📌 {Colors.BOLD}{key}{Colors.RESET}: {value}")
-                print()
+                _print(f"  📌 {Colors.BOLD}{key}{Colors.RESET}: {value}")
+                _print()
 
-        print(f"  {Colors.DIM}{'─' * 40}{Colors.RESET}")
-        print()
+        _print(f"  {Colors.DIM}{'─' * 40}{Colors.RESET}")
+        _print()
 
     @staticmethod
     def pipeline_overview(pipeline, debug: bool = False):
@@ -269,9 +446,9 @@ class Display:
         enabled = [s for s in steps if s.enabled]
         disabled = [s for s in steps if not s.enabled]
 
-        print()
-        print(f"  {Colors.CYAN}{Colors.BOLD}Pipeline Overview{Colors.RESET}")
-        print(f"  {Colors.DIM}{'─' * 40}{Colors.RESET}")
+        _print()
+        _print(f"  {Colors.CYAN}{Colors.BOLD}Pipeline Overview{Colors.RESET}")
+        _print(f"  {Colors.DIM}{'─' * 40}{Colors.RESET}")
 
         for i, step in enumerate(steps, 1):
             if step.enabled:
@@ -282,32 +459,135 @@ class Display:
                 name_style = Colors.DIM
 
             # Step name and job
-            print(f"  {status} {name_style}{step.name}{Colors.RESET}")
-            print(f"      {Colors.DIM}Job:{Colors.RESET} {step.job}")
+            _print(f"  {status} {name_style}{step.name}{Colors.RESET}")
+            _print(f"      {Colors.DIM}Job:{Colors.RESET} {step.job}")
 
             # Show params info
             if step.params_list:
                 key = step.params_list.replace("{{ ", "").replace(" }}", "")
-                print(f"      {Colors.CYAN}↻{Colors.RESET} Dynamic: {Colors.CYAN}{key}{Colors.RESET}")
+                _print(f"      {Colors.CYAN}↻{Colors.RESET} Dynamic: {Colors.CYAN}{key}{Colors.RESET}")
             elif step.params:
                 param_count = len(step.params)
-                print(f"      {Colors.DIM}Params: {param_count} parameter(s){Colors.RESET}")
+                _print(f"      {Colors.DIM}Params: {param_count} parameter(s){Colors.RESET}")
+
+            if step.depends_on:
+                _print(f"      {Colors.DIM}After: {', '.join(step.depends_on)}{Colors.RESET}")
 
             # Debug: show all param details
             if debug and step.params:
                 for k, v in step.params.items():
                     val_str = str(v)[:50] + "..." if len(str(v)) > 50 else str(v)
-                    print(f"        {Colors.DIM}• {k}: {val_str}{Colors.RESET}")
+                    _print(f"        {Colors.DIM}• {k}: {val_str}{Colors.RESET}")
 
             if debug and step.params_list:
-                print(f"        {Colors.DIM}• template: {step.params_list}{Colors.RESET}")
+                _print(f"        {Colors.DIM}• template: {step.params_list}{Colors.RESET}")
 
-            print()
+            _print()
 
         # Summary line
-        print(f"  {Colors.DIM}{'─' * 40}{Colors.RESET}")
+        _print(f"  {Colors.DIM}{'─' * 40}{Colors.RESET}")
         summary = f"  {Colors.GREEN}{len(enabled)} enabled{Colors.RESET}"
         if disabled:
             summary += f" {Colors.DIM}| {len(disabled)} disabled{Colors.RESET}"
-        print(summary)
-        print()
+        _print(summary)
+        _print()
+
+
+class ProgressLine:
+    """Compact progress of one params_list step.
+
+    On a terminal a single line (done/total, rate, ETA, errors) is redrawn
+    at most every REFRESH_INTERVAL seconds; otherwise, or while several
+    steps report at once, a summary line is printed every `interval`
+    seconds. Only failed items are printed in full. close() prints the
+    final line with the slowest items.
+    """
+
+    REFRESH_INTERVAL = 0.2
+    SLOWEST = 3
+
+    _active = 0
+    _lock = threading.Lock()
+
+    def __init__(self, name: str, total: int, interval: float = 10.0):
+        self.name = name
+        self.total = total
+        self.interval = interval
+        self.done = 0
+        self.errors = 0
+        self.started = time.monotonic()
+        self._last_draw = self.started
+        self._slowest: List[Tuple[float, int, str]] = []  # min-heap of (elapsed, item, params)
+        self._tty = sys.stdout.isatty() and not Logger.JSON
+        self._drawn = False
+        with ProgressLine._lock:
+            ProgressLine._active += 1
+
+    def item_done(self, current: int, params, success: bool, elapsed: float, message: Optional[str] = None):
+        """Record a finished item; `current` is its 1-based position in the step."""
+        self.done += 1
+        if len(self._slowest) < self.SLOWEST:
+            heapq.heappush(self._slowest, (elapsed, current, _short(params)))
+        elif elapsed > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, (elapsed, current, _short(params)))
+
+        if not success:
+            self.errors += 1
+            self._clear()
+            _print(f"      {_tag()}{Colors.RED}✗{Colors.RESET} Item {current}/{self.total} {Colors.DIM}{params}{Colors.RESET}"
+                   f" {Colors.RED}{message or 'failed'}{Colors.RESET}", level="ERROR")
+
+        now = time.monotonic()
+        redraw = self._tty and ProgressLine._active == 1
+        if now - self._last_draw >= (self.REFRESH_INTERVAL if redraw else self.interval):
+            self._last_draw = now
+            self._draw(now, redraw)
+
+    def close(self):
+        """Print the final progress line and the slowest items."""
+        with ProgressLine._lock:
+            ProgressLine._active -= 1
+        self._clear()
+        self._draw(time.monotonic(), False)
+        if self._slowest and self.done > self.SLOWEST:
+            slowest = ", ".join(
+                f"#{current} {elapsed:.3f}s {params}"
+                for elapsed, current, params in sorted(self._slowest, reverse=True)
+            )
+            _print(f"      {_tag()}{Colors.DIM}Slowest: {slowest}{Colors.RESET}")
+
+    def _line(self, now: float) -> str:
+        elapsed = now - self.started
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        eta = (self.total - self.done) / rate if rate > 0 else 0.0
+        errors = f"{Colors.RED}{self.errors} failed{Colors.RESET}" if self.errors else "0 failed"
+        return (f"      {Colors.DIM}{self.name}{Colors.RESET} {self.done}/{self.total} "
+                f"({self.done * 100 // max(self.total, 1)}%) {rate:.1f}/s "
+                f"ETA {_duration(eta)} {errors}")
+
+    def _draw(self, now: float, redraw: bool):
+        if redraw:
+            sys.stdout.write(f"\r\033[K{self._line(now)}")
+            sys.stdout.flush()
+            self._drawn = True
+        else:
+            _print(self._line(now))
+
+    def _clear(self):
+        if self._drawn:
+            sys.stdout.write("\r\033[K")
+            self._drawn = False
+
+
+def _short(params, width: int = 60) -> str:
+    text = str(params)
+    return text if len(text) <= width else text[:width - 1] + "…"
+
+
+def _duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
@@ -1,33 +1,128 @@
-import datetime
+import atexit
+import json
+import sys
+import threading
+import time
+from typing import List
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "ERROR": 40}
+FORMATS = ("text", "json")
+
+COLORS = {
+    "DEBUG": "\033[94m",  # Blue
+    "INFO": "\033[92m",  # Green
+    "ERROR": "\033[91m",  # Red
+}
+RESET = "\033[0m"
+
+JSON_FLUSH_LINES = 512  # buffered JSON lines written per flush
+JSON_FLUSH_INTERVAL = 1.0  # seconds; flush at least this often while logging continues
 
 
 class Logger:
+    """Process-wide logger used as `from utils.logger import Logger as log`.
+
+    Messages may be %-style templates with arguments, e.g.
+    `log.debug("Cls", "inputs: %s", inputs)`. The level is checked before
+    any formatting, so disabled calls cost one comparison; prefer this over
+    f-strings for large values and per-item debug logs.
+
+    The "text" format prints colored lines. The "json" format writes one
+    JSON object per line (ts, level, component, msg) through a buffer that
+    is flushed every JSON_FLUSH_LINES lines, every JSON_FLUSH_INTERVAL
+    seconds, on ERROR, after each step, on SIGTERM (see main.py) and at
+    exit. Display output is written as "Display" records in that format.
+    """
+
     DEBUG_ENABLED = False
+    LEVEL = LEVELS["INFO"]
+    JSON = False
+
+    # Reentrant: the SIGTERM handler flushes on the main thread, maybe inside log()
+    _lock = threading.RLock()
+    _buffer: List[str] = []
+    _last_flush = 0.0
+    _ts_second = -1
+    _ts_text = ""
 
     @staticmethod
-    def configure(debug: bool):
-        Logger.DEBUG_ENABLED = debug
+    def configure(debug: bool, level: str = "INFO", fmt: str = "text"):
+        level = level.upper()
+        if level not in LEVELS:
+            raise ValueError(f"LOG_LEVEL must be one of {', '.join(LEVELS)}, got '{level}'")
+        if fmt not in FORMATS:
+            raise ValueError(f"LOG_FORMAT must be one of {', '.join(FORMATS)}, got '{fmt}'")
+        Logger.flush()
+        Logger.LEVEL = LEVELS["DEBUG"] if debug else LEVELS[level]
+        Logger.DEBUG_ENABLED = Logger.LEVEL <= LEVELS["DEBUG"]
+        Logger.JSON = fmt == "json"
+        Logger._ts_second = -1
 
     @staticmethod
-    def log(level, cls, msg):
-        colors = {
-            "DEBUG": "\033[94m",  # Blue
-            "INFO": "\033[92m",  # Green
-            "ERROR": "\033[91m",  # Red
-        }
-        reset = "\033[0m"
-        ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"{colors.get(level, '')}[{ts}] [{level}] [{cls}] {msg}{reset}")
+    def enabled_for(level: str) -> bool:
+        """True if messages of `level` are emitted; use to guard expensive log arguments."""
+        return LEVELS[level] >= Logger.LEVEL
 
     @staticmethod
-    def debug(cls, msg):
-        if Logger.DEBUG_ENABLED:
-            Logger.log("DEBUG", cls, msg)
+    def _timestamp(now: float, fmt: str) -> str:
+        # strftime once per second, not once per line
+        second = int(now)
+        if second != Logger._ts_second:
+            Logger._ts_text = time.strftime(fmt, time.localtime(second))
+            Logger._ts_second = second
+        return Logger._ts_text
 
     @staticmethod
-    def info(cls, msg):
-        Logger.log("INFO", cls, msg)
+    def log(level, cls, msg, *args):
+        if args:
+            try:
+                msg = msg % args
+            except (TypeError, ValueError):
+                msg = f"{msg} {args}"
+        now = time.time()
+
+        if not Logger.JSON:
+            ts = Logger._timestamp(now, "%Y-%m-%d %H:%M:%S")
+            print(f"{COLORS.get(level, '')}[{ts}] [{level}] [{cls}] {msg}{RESET}")
+            return
+
+        with Logger._lock:
+            ts = f"{Logger._timestamp(now, '%Y-%m-%dT%H:%M:%S')}.{int(now % 1 * 1000):03d}"
+            Logger._buffer.append(json.dumps(
+                {"ts": ts, "level": level, "component": cls, "msg": str(msg)},
+                ensure_ascii=False
+            ))
+            if (level == "ERROR" or len(Logger._buffer) >= JSON_FLUSH_LINES
+                    or now - Logger._last_flush >= JSON_FLUSH_INTERVAL):
+                Logger._flush_locked(now)
 
     @staticmethod
-    def error(cls, msg):
-        Logger.log("ERROR", cls, msg)
+    def _flush_locked(now: float) -> None:
+        if Logger._buffer:
+            lines, Logger._buffer = Logger._buffer, []
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+        Logger._last_flush = now
+
+    @staticmethod
+    def flush():
+        """Write out buffered JSON lines."""
+        with Logger._lock:
+            Logger._flush_locked(time.time())
+
+    @staticmethod
+    def debug(cls, msg, *args):
+        if Logger.LEVEL <= 10:
+            Logger.log("DEBUG", cls, msg, *args)
+
+    @staticmethod
+    def info(cls, msg, *args):
+        if Logger.LEVEL <= 20:
+            Logger.log("INFO", cls, msg, *args)
+
+    @staticmethod
+    def error(cls, msg, *args):
+        Logger.log("ERROR", cls, msg, *args)
+
+
+atexit.register(Logger.flush)
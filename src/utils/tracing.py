@@ -0,0 +1,229 @@
+"""In-process tracing of a run: pipeline -> step -> iteration -> HTTP call.
+
+Spans are kept in memory and written to a file when the run ends, either
+as Chrome trace events (open in https://ui.perfetto.dev or chrome://tracing)
+or as OTLP JSON (the OpenTelemetry collector file format). No collector or
+SDK is needed. While tracing is off, `span()` returns a shared no-op and
+costs one attribute lookup.
+"""
+
+import contextvars
+import functools
+import json
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+FORMATS = ("chrome", "otlp")
+SERVICE_NAME = "quay-provisioner"
+
+_current: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    __slots__ = ("name", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error", "thread", "lane")
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any], lane: bool):
+        self.name = name
+        self.span_id = random.getrandbits(64) or 1
+        self.parent_id = parent.span_id if parent else 0
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        self.thread = threading.get_ident()
+        self.lane = lane
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, values: Any) -> None:
+        """Copy the scalar entries of a params dict."""
+        if isinstance(values, dict):
+            for key, value in values.items():
+                if isinstance(value, (str, int, float, bool)):
+                    self.attributes[key] = value
+
+    def fail(self, message: Optional[str]) -> None:
+        self.error = message or "failed"
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, values: Any) -> None:
+        pass
+
+    def fail(self, message: Optional[str]) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+class _Scope:
+    """Context manager that makes a span current while it is open."""
+
+    __slots__ = ("tracer", "span", "token")
+
+    def __init__(self, tracer: "Tracer", span: Span):
+        self.tracer = tracer
+        self.span = span
+
+    def __enter__(self) -> Span:
+        self.token = _current.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        _current.reset(self.token)
+        if exc is not None and self.span.error is None:
+            self.span.error = f"{exc_type.__name__}: {exc}"
+        self.span.end_ns = time.time_ns()
+        self.tracer.finish(self.span)
+        return False
+
+
+class Tracer:
+    """Collects finished spans of one run; at most `max_spans` are kept."""
+
+    _active: Optional["Tracer"] = None
+
+    def __init__(self, max_spans: int = 500_000):
+        self.trace_id = os.urandom(16).hex()
+        self.max_spans = max_spans
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self._lock = threading.Lock()
+
+    def finish(self, span: Span) -> None:
+        with self._lock:
+            if len(self.spans) < self.max_spans:
+                self.spans.append(span)
+            else:
+                self.dropped += 1
+
+    def write(self, path: Path, fmt: str) -> int:
+        """Write the finished spans; returns the number written."""
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown trace format '{fmt}', expected one of {', '.join(FORMATS)}")
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start_ns)
+        document = _chrome(spans) if fmt == "chrome" else _otlp(self.trace_id, spans)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f, separators=(",", ":"), default=str)
+        return len(spans)
+
+
+def start(max_spans: int = 500_000) -> Tracer:
+    """Start collecting spans (process-wide) and return the tracer."""
+    Tracer._active = Tracer(max_spans)
+    return Tracer._active
+
+
+def stop() -> Optional[Tracer]:
+    tracer, Tracer._active = Tracer._active, None
+    return tracer
+
+
+def span(name: str, parent: Optional[Span] = None, lane: bool = False, **attributes):
+    """Open a child of `parent` (default: the current span) for use in a `with` block.
+
+    `lane=True` marks spans that run concurrently on one thread (asyncio
+    iterations); the Chrome export gives each of them its own row.
+    """
+    tracer = Tracer._active
+    if tracer is None:
+        return _NOOP
+    return _Scope(tracer, Span(name, parent or _current.get(), attributes, lane))
+
+
+def bind(fn: Callable) -> Callable:
+    """`fn` running in a copy of the current context, so spans opened on a
+    worker thread become children of the span that submitted it."""
+    if Tracer._active is None:
+        return fn
+    return functools.partial(contextvars.copy_context().run, fn)
+
+
+def _chrome(spans: List[Span]) -> dict:
+    """Complete ("X") trace events; overlapping lane spans of a thread get separate rows."""
+    rows: Dict[tuple, int] = {}
+    lane_of: Dict[int, tuple] = {}
+    lane_ends: Dict[int, List[int]] = {}
+    events = []
+    for s in spans:
+        row = lane_of.get(s.parent_id, (s.thread, 0))
+        if s.lane:
+            ends = lane_ends.setdefault(s.thread, [])
+            free = next((i for i, end in enumerate(ends) if end <= s.start_ns), None)
+            if free is None:
+                ends.append(s.end_ns)
+                free = len(ends) - 1
+            else:
+                ends[free] = s.end_ns
+            row = (s.thread, free + 1)
+        lane_of[s.span_id] = row
+        tid = rows.setdefault(row, len(rows) + 1)
+        args = dict(s.attributes)
+        if s.error:
+            args["error"] = s.error
+        events.append({
+            "name": s.name,
+            "ph": "X",
+            "ts": s.start_ns / 1000,
+            "dur": (s.end_ns - s.start_ns) / 1000,
+            "pid": 1,
+            "tid": tid,
+            "args": args
+        })
+    for (thread, lane), tid in rows.items():
+        label = f"thread {thread}" + (f" lane {lane}" if lane else "")
+        events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": label}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _otlp_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp(trace_id: str, spans: List[Span]) -> dict:
+    """OTLP/JSON ExportTraceServiceRequest with one resource and scope."""
+    otlp_spans = []
+    for s in spans:
+        entry = {
+            "traceId": trace_id,
+            "spanId": f"{s.span_id:016x}",
+            "name": s.name,
+            "kind": 3 if "http.method" in s.attributes else 1,  # CLIENT / INTERNAL
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.end_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in s.attributes.items()],
+            "status": {"code": 2, "message": s.error} if s.error else {"code": 1}
+        }
+        if s.parent_id:
+            entry["parentSpanId"] = f"{s.parent_id:016x}"
+        otlp_spans.append(entry)
+    return {"resourceSpans": [{
+        "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+        "scopeSpans": [{"scope": {"name": SERVICE_NAME}, "spans": otlp_spans}]
+    }]}